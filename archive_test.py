@@ -5,42 +5,397 @@ Usage: python archive_test.py "LISTING_URL"
 """
 import sys
 import os
+import atexit
+import hashlib
+import json
+from pathlib import Path
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # Not Windows
+    msvcrt = None
 
 # Add project to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flathunter.config import Config
-from flathunter.archive_manager import ArchiveManager
-from flathunter.telegram_archive_handler import TelegramArchiveHandler
-from flathunter.notifiers import SenderTelegram
-from flathunter.logger_config import logger
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+import threading
 import time
 
+# Selenium, webdriver-manager and the flathunter components are imported in the
+# functions that need them, so printing the usage stays instant
+
+
+# Crawler name used for archive extraction, by listing host
+CRAWLER_BY_HOST = {
+    'willhaben.at': 'Willhaben',
+    'www.willhaben.at': 'Willhaben',
+    'wg-gesucht.de': 'WG-Gesucht',
+    'www.wg-gesucht.de': 'WG-Gesucht',
+}
+
+
+def crawler_for_url(url):
+    """Return the crawler name for a listing URL, or 'Unknown'"""
+    return CRAWLER_BY_HOST.get(urlparse(url).hostname, 'Unknown')
+
+
+# Long-lived chromedriver service and (optionally) a browser session shared
+# between test runs, so repeated checks don't pay the full browser boot
+_driver_service = None
+_shared_driver = None
+
+# Resources that are never needed for scraping URLs and text out of the DOM
+BLOCKED_RESOURCE_URLS = ['*.jpg', '*.jpeg', '*.png', '*.webp', '*.gif', '*.svg',
+                         '*.woff2', '*.woff', '*.ttf', '*.mp4', '*.css']
+
+# Persistent Chrome profile, so caches survive between runs
+CHROME_PROFILE_DIR = Path.home() / '.flathunter_chrome_profile'
+_profile_lock = None
+
+
+def get_driver_service():
+    """Start the chromedriver service once and stop it on interpreter shutdown"""
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    global _driver_service
+    if _driver_service is None:
+        _driver_service = Service(ChromeDriverManager().install())
+        _driver_service.start()
+        atexit.register(_driver_service.stop)
+    return _driver_service
+
+
+def get_shared_driver():
+    """Return the shared driver, replacing the previous tab with a fresh one if the browser is already running"""
+    global _shared_driver
+    if _shared_driver is None:
+        _shared_driver = create_test_driver()
+        atexit.register(_shared_driver.quit)
+    else:
+        # Close the previous tab so tabs don't pile up over the run
+        previous_tab = _shared_driver.current_window_handle
+        _shared_driver.switch_to.new_window('tab')
+        fresh_tab = _shared_driver.current_window_handle
+        _shared_driver.switch_to.window(previous_tab)
+        _shared_driver.close()
+        _shared_driver.switch_to.window(fresh_tab)
+    return _shared_driver
+
+
+# Current position of the Flickity gallery; changes once a click has moved the slider
+GALLERY_POSITION_SCRIPT = """
+const slider = document.querySelector('.flickity-slider');
+if (!slider) { return null; }
+const selected = slider.querySelector('.is-selected');
+return [slider.style.transform, Array.prototype.indexOf.call(slider.children, selected)];
+"""
+
+
+# Compact HTML snapshot holding only the nodes ArchiveManager extracts from:
+# listing images, embedded page data and the description containers. This is
+# far smaller than driver.page_source, which serializes the whole DOM.
+ARCHIVE_SNAPSHOT_SCRIPT = """
+const selector = [
+    'img[src*="cache.willhaben.at/mmo"]', 'img[data-src*="cache.willhaben.at/mmo"]',
+    'script#__NEXT_DATA__', 'script[type="application/ld+json"]',
+    'div[data-testid="ad-description-Objektbeschreibung"]',
+    'img.sp-image', 'div[class*="section_freetext" i]', 'div[id*="freitext" i]',
+    'div#ad_description_text'
+].join(', ');
+const nodes = Array.from(document.querySelectorAll(selector));
+// Drop nodes nested in another match, so nothing is extracted twice
+return nodes
+    .filter(node => !nodes.some(other => other !== node && other.contains(node)))
+    .map(node => node.outerHTML)
+    .join('\\n');
+"""
+
+# Number of slides in the Flickity gallery (0 if there is no slider)
+GALLERY_SLIDE_COUNT_SCRIPT = """
+return document.querySelectorAll('.flickity-slider > .carousel-cell, .flickity-slider > *').length;
+"""
+
+
+def wait_until(driver, timeout, condition):
+    """Explicitly wait for a condition with implicit waits disabled meanwhile
+
+    Mixing implicit and explicit waits makes timeouts compound, so the implicit
+    wait is set to zero for the duration of the wait and restored afterwards.
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    implicit_wait = driver.timeouts.implicit_wait
+    driver.implicitly_wait(0)
+    try:
+        return WebDriverWait(driver, timeout).until(condition)
+    finally:
+        driver.implicitly_wait(implicit_wait)
+
+
+def acquire_chrome_profile():
+    """
+    Lock the persistent Chrome profile for this process
+
+    Returns:
+        True if the profile can be used, False if another run holds it,
+        None if file locking is unavailable on this platform
+    """
+    global _profile_lock
+    if _profile_lock is not None:
+        return True
+    if fcntl is None and msvcrt is None:
+        return None
+    CHROME_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    lock_file = open(CHROME_PROFILE_DIR.with_suffix('.lock'), 'w')
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        lock_file.close()
+        return False
+    # Keep the handle open - the lock is released when the process exits
+    _profile_lock = lock_file
+    return True
+
 
 def create_test_driver():
-    """Create a headless Chrome driver"""
+    """Create a headless Chrome driver attached to the long-lived chromedriver service"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.remote_connection import ChromeRemoteConnection
+
     options = Options()
-    options.add_argument('--headless')
+    # Return from get() at DOMContentLoaded instead of waiting for every subresource
+    options.page_load_strategy = 'eager'
+    # Reuse HTTP/DNS caches and static assets from earlier runs when the profile is free
+    profile_acquired = acquire_chrome_profile()
+    if profile_acquired:
+        options.add_argument(f'--user-data-dir={CHROME_PROFILE_DIR}')
+        options.add_argument(f'--disk-cache-dir={CHROME_PROFILE_DIR / "cache"}')
+    elif profile_acquired is None:
+        print("  No file locking on this platform - starting with a fresh Chrome profile")
+    else:
+        print("  Chrome profile in use by another run - starting with a fresh profile")
+    options.add_argument('--headless=new')
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
+    # Images are scraped from src attributes, so they never need to be rendered
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--disable-sync')
+    options.add_argument('--mute-audio')
+    options.add_argument('--no-first-run')
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
 
-    driver = webdriver.Chrome(options=options)
+    # ChromeRemoteConnection knows the Chrome-specific endpoints (e.g. CDP commands)
+    command_executor = ChromeRemoteConnection(get_driver_service().service_url)
+    driver = webdriver.Remote(command_executor=command_executor, options=options)
+
+    # Only the DOM is scraped, so don't download image, font, media or style payloads
+    execute_cdp_cmd(driver, 'Network.enable', {})
+    execute_cdp_cmd(driver, 'Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_URLS})
     return driver
 
 
-def test_archive_for_url(listing_url: str, config_path: str = None):
+def execute_cdp_cmd(driver, cmd: str, params: dict):
+    """Run a Chrome DevTools Protocol command on a Remote driver"""
+    return driver.execute('executeCdpCommand', {'cmd': cmd, 'params': params})['value']
+
+
+# Fetched page sources are kept on disk, so iterating on the extraction code
+# doesn't need to start Chrome and walk the gallery on every run
+PAGE_CACHE_DIR = Path('.archive_cache')
+PAGE_CACHE_MAX_AGE = 3600  # seconds
+
+# Listings that are gone are remembered for a day, so they are not refetched
+NOT_FOUND_CACHE_FILE = PAGE_CACHE_DIR / 'not_found.json'
+NOT_FOUND_CACHE_TTL = 24 * 3600  # seconds
+NOT_FOUND_STATUSES = (404, 410)
+
+# Skip the gallery click-through once the embedded page data yields this many
+# images (a lone JSON-LD image is usually just the cover photo)
+MIN_EMBEDDED_IMAGES = 2
+
+# HTTP status of the main document (supported by Chrome 109+)
+NAVIGATION_STATUS_SCRIPT = """
+const entries = performance.getEntriesByType('navigation');
+return entries.length ? entries[0].responseStatus : null;
+"""
+
+
+def get_page_cache_path(listing_url: str) -> Path:
+    """Path of the cached page source for a listing URL"""
+    return PAGE_CACHE_DIR / (hashlib.sha1(listing_url.encode()).hexdigest() + '.html')
+
+
+def load_cached_page_source(listing_url: str):
+    """Return the cached page source, or None if there is no sufficiently recent copy"""
+    cache_path = get_page_cache_path(listing_url)
+    try:
+        if time.time() - cache_path.stat().st_mtime >= PAGE_CACHE_MAX_AGE:
+            return None
+        return cache_path.read_text(encoding='utf-8')
+    except OSError:
+        return None
+
+
+def save_cached_page_source(listing_url: str, page_source: str):
+    """Store a fetched page source in the local cache"""
+    try:
+        PAGE_CACHE_DIR.mkdir(exist_ok=True)
+        get_page_cache_path(listing_url).write_text(page_source, encoding='utf-8')
+    except OSError as e:
+        print(f"  Warning: Could not cache page source: {e}")
+
+
+def load_not_found_cache() -> dict:
+    """Load the negative cache of listing URLs that answered 'not found'"""
+    try:
+        with open(NOT_FOUND_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_cached_not_found(listing_url: str) -> bool:
+    """Returns true if the listing answered 'not found' within the negative cache TTL"""
+    entry = load_not_found_cache().get(listing_url)
+    return entry is not None and time.time() - entry['fetched_at'] < NOT_FOUND_CACHE_TTL
+
+
+def cache_not_found(listing_url: str, status: int):
+    """Record a 'not found' answer for a listing URL, dropping expired entries"""
+    now = time.time()
+    entries = {url: entry for url, entry in load_not_found_cache().items()
+               if now - entry['fetched_at'] < NOT_FOUND_CACHE_TTL}
+    entries[listing_url] = {'status': status, 'fetched_at': now}
+    try:
+        PAGE_CACHE_DIR.mkdir(exist_ok=True)
+        with open(NOT_FOUND_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+    except OSError as e:
+        print(f"  Warning: Could not update not-found cache: {e}")
+
+
+def fetch_page_source(driver, listing_url: str):
+    """
+    Load the listing in the browser (walking through the Willhaben gallery)
+
+    Returns:
+        Tuple of the HTTP status of the document (None if unknown) and the
+        HTML needed for archiving (see get_archive_snapshot)
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import NoSuchElementException, TimeoutException
+    from flathunter.archive_manager import ArchiveManager
+
+    driver.get(listing_url)
+    # With the eager strategy get() returns at DOMContentLoaded; guard against a
+    # document that is still parsing, the gallery wait below does the rest
+    try:
+        wait_until(driver, 5, lambda d: d.execute_script("return document.readyState") != "loading")
+    except TimeoutException:
+        print("  Warning: Page was still loading after 5s")
+
+    status = driver.execute_script(NAVIGATION_STATUS_SCRIPT)
+    if status in NOT_FOUND_STATUSES:
+        return status, ""
+
+    is_willhaben = crawler_for_url(listing_url) == 'Willhaben'
+
+    # For Willhaben: the embedded page data usually lists the whole gallery already
+    if is_willhaben:
+        page_source = get_archive_snapshot(driver)
+        embedded_images = ArchiveManager.extract_willhaben_embedded_images(page_source)
+        if len(embedded_images) >= MIN_EMBEDDED_IMAGES:
+            print(f"✓ Found {len(embedded_images)} images in embedded page data - skipping gallery scroll")
+            return status, page_source
+
+    # Otherwise scroll through the Willhaben gallery to load all images
+    if is_willhaben:
+        print(f"Scrolling through Willhaben gallery to load all images...")
+
+        # Wait for gallery container to be present
+        try:
+            wait_until(driver, 10, EC.presence_of_element_located(
+                (By.CSS_SELECTOR, '.flickity-viewport, [class*="gallery"], [class*="carousel"]')))
+            print("  Gallery container found")
+        except TimeoutException:
+            print("  Warning: Gallery container not found")
+
+        # Click exactly once per remaining slide; without a Flickity slider fall
+        # back to the old safety limit
+        slide_count = driver.execute_script(GALLERY_SLIDE_COUNT_SCRIPT)
+        max_clicks = slide_count - 1 if slide_count else 30
+
+        next_button = None
+        for selector in ['button.flickity-prev-next-button.next',
+                         'button.flickity-button.next',
+                         'button[aria-label*="Next" i]',
+                         '.flickity-prev-next-button.next']:
+            try:
+                next_button = driver.find_element(By.CSS_SELECTOR, selector)
+                break
+            except NoSuchElementException:
+                continue
+
+        clicks = 0
+        if next_button is not None and next_button.is_displayed():
+            for _ in range(max_clicks):
+                try:
+                    # Use JavaScript click (more reliable), then wait until the
+                    # slider has actually moved to the next slide
+                    prev_position = driver.execute_script(GALLERY_POSITION_SCRIPT)
+                    driver.execute_script("arguments[0].click();", next_button)
+                    wait_until(driver, 2, lambda d, prev=prev_position:
+                               d.execute_script(GALLERY_POSITION_SCRIPT) != prev)
+                except Exception:
+                    # Slider did not move or the button went away - nothing left to load
+                    break
+                clicks += 1
+
+        print(f"✓ Clicked through gallery {clicks} times ({slide_count} slides)")
+
+    return status, get_archive_snapshot(driver)
+
+
+def get_archive_snapshot(driver) -> str:
+    """Return the compact archive snapshot, or the full page source if it came up empty"""
+    snapshot = driver.execute_script(ARCHIVE_SNAPSHOT_SCRIPT)
+    if snapshot:
+        return f"<html><body>{snapshot}</body></html>"
+    return driver.page_source
+
+
+def test_archive_for_url(listing_url: str, config_path: str = None, reuse_session: bool = False,
+                         no_cache: bool = False):
     """
     Test archive feature by fetching a listing page and creating an archive
 
     Args:
         listing_url: URL of the listing to archive
         config_path: Optional path to config file
+        reuse_session: Keep the browser open and load the URL in a new tab of
+            the shared session instead of starting a new Chrome
+        no_cache: Always fetch the page, ignoring the local page source cache
     """
+    from flathunter.config import Config
+    from flathunter.archive_manager import ArchiveManager
+    from flathunter.telegram_archive_handler import TelegramArchiveHandler
+    from flathunter.notifiers import SenderTelegram
+
     print(f"\n{'='*70}")
     print(f"ARCHIVE TEST")
     print(f"{'='*70}\n")
@@ -75,11 +430,14 @@ def test_archive_for_url(listing_url: str, config_path: str = None):
 
         telegram_notifier = None
         archive_handler = None
+        # Set by the handler once a button click was answered
+        button_clicked = threading.Event()
         if 'telegram' in config.notifiers():
             telegram_notifier = SenderTelegram(config)
             archive_handler = TelegramArchiveHandler(
                 bot_token=telegram_notifier.bot_token,
-                sender_telegram=telegram_notifier
+                sender_telegram=telegram_notifier,
+                done_event=button_clicked
             )
             # Start polling
             archive_handler.start_polling()
@@ -88,182 +446,133 @@ def test_archive_for_url(listing_url: str, config_path: str = None):
             print("⚠️  No Telegram configured - will skip button test")
 
         # Determine crawler type
-        crawler = 'Unknown'
-        if 'willhaben.at' in listing_url:
-            crawler = 'Willhaben'
-        elif 'wg-gesucht.de' in listing_url:
-            crawler = 'WG-Gesucht'
+        crawler = crawler_for_url(listing_url)
 
         print(f"✓ Detected crawler: {crawler}")
 
-        # Create driver and fetch page
+        # Fetch page, from the local cache if a recent copy exists
         print(f"\nFetching page...")
-        driver = create_test_driver()
-
-        try:
-            driver.get(listing_url)
-            time.sleep(3)  # Wait for page to load
-
-            # For Willhaben: Scroll through gallery to load all images
-            if 'willhaben.at' in listing_url:
-                print(f"Scrolling through Willhaben gallery to load all images...")
-                from selenium.webdriver.common.by import By
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-                from selenium.common.exceptions import NoSuchElementException, TimeoutException
-
-                # Wait for gallery container to be present
-                try:
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, '.flickity-viewport, [class*="gallery"], [class*="carousel"]'))
-                    )
-                    time.sleep(1)  # Give Flickity time to fully initialize
-                    print("  Gallery container found")
-                except TimeoutException:
-                    print("  Warning: Gallery container not found")
-
-                clicks = 0
-                max_clicks = 30
-                consecutive_failures = 0
-                max_consecutive_failures = 3
-
-                while clicks < max_clicks and consecutive_failures < max_consecutive_failures:
-                    try:
-                        # Try multiple selectors
-                        next_button = None
-                        selectors = [
-                            'button.flickity-prev-next-button.next',
-                            'button.flickity-button.next',
-                            'button[aria-label*="Next" i]',
-                            '.flickity-prev-next-button.next'
-                        ]
-
-                        for selector in selectors:
-                            try:
-                                next_button = driver.find_element(By.CSS_SELECTOR, selector)
-                                if next_button:
-                                    break
-                            except NoSuchElementException:
-                                continue
-
-                        if not next_button or not next_button.is_displayed():
-                            break
-
-                        # Use JavaScript click (more reliable)
-                        driver.execute_script("arguments[0].click();", next_button)
-                        time.sleep(0.4)
-                        clicks += 1
-                        consecutive_failures = 0
-
-                    except (NoSuchElementException, Exception) as e:
-                        consecutive_failures += 1
-                        if consecutive_failures >= max_consecutive_failures:
-                            break
-
-                print(f"✓ Clicked through gallery {clicks} times")
-                time.sleep(0.5)
-
-            page_source = driver.page_source
-            print(f"✓ Page loaded ({len(page_source)} bytes)")
-
-            # Create mock expose
-            expose = {
-                'url': listing_url,
-                'title': 'Test Listing',
-                'price': '€850',
-                'size': '60m²',
-                'rooms': '2',
-                'address': 'Test Address',
-                'crawler': crawler,
-                '_auto_contacted': True
-            }
-
-            # Extract archive data
-            print(f"\nExtracting archive data...")
-            archive_data = archive_manager.extract_archive_data(
-                page_source, listing_url, expose
-            )
+        if not no_cache and is_cached_not_found(listing_url):
+            print("✗ Listing was not found on a previous run (cached for 24h, use --no-cache to retry)")
+            return False
 
-            if not archive_data:
-                print("✗ Failed to extract archive data")
+        page_source = None if no_cache else load_cached_page_source(listing_url)
+        if page_source is not None:
+            print(f"✓ Using cached page source from {get_page_cache_path(listing_url)}")
+        else:
+            driver = get_shared_driver() if reuse_session else create_test_driver()
+            try:
+                status, page_source = fetch_page_source(driver, listing_url)
+            finally:
+                if not reuse_session:
+                    driver.quit()
+            if status in NOT_FOUND_STATUSES:
+                cache_not_found(listing_url, status)
+                print(f"✗ Listing not found (HTTP {status})")
                 return False
+            save_cached_page_source(listing_url, page_source)
+
+        print(f"✓ Page loaded ({len(page_source)} bytes)")
+
+        # Create mock expose
+        expose = {
+            'url': listing_url,
+            'title': 'Test Listing',
+            'price': '€850',
+            'size': '60m²',
+            'rooms': '2',
+            'address': 'Test Address',
+            'crawler': crawler,
+            '_auto_contacted': True
+        }
+
+        # Extract archive data
+        print(f"\nExtracting archive data...")
+        archive_data = archive_manager.extract_archive_data(
+            page_source, listing_url, expose
+        )
+
+        if not archive_data:
+            print("✗ Failed to extract archive data")
+            return False
+
+        images = archive_data.get('images', [])
+        description = archive_data.get('description', '')
+
+        print(f"✓ Extracted {len(images)} images")
+        if images:
+            print(f"  Sample image URLs:")
+            for i, img in enumerate(images[:3], 1):
+                print(f"    {i}. {img[:80]}...")
+
+        print(f"✓ Extracted description ({len(description)} chars)")
+        if description:
+            preview = description[:200].replace('\n', ' ')
+            print(f"  Preview: {preview}...")
+
+        # Save locally
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        listing_id = listing_url.split('/')[-1] or 'test'
+        archive_id = f"{timestamp}_{listing_id}"
+
+        print(f"\nSaving archive locally...")
+        save_result = archive_manager.save_archive_locally(archive_data, archive_id)
+        if save_result:
+            print(f"✓ Saved to: {save_result.path} "
+                  f"({save_result.bytes_written} bytes, sha256 {save_result.sha256[:12]})")
+        else:
+            print(f"✗ Failed to save locally")
 
-            images = archive_data.get('images', [])
-            description = archive_data.get('description', '')
-
-            print(f"✓ Extracted {len(images)} images")
-            if images:
-                print(f"  Sample image URLs:")
-                for i, img in enumerate(images[:3], 1):
-                    print(f"    {i}. {img[:80]}...")
-
-            print(f"✓ Extracted description ({len(description)} chars)")
-            if description:
-                preview = description[:200].replace('\n', ' ')
-                print(f"  Preview: {preview}...")
+        # Test Telegram integration
+        if telegram_notifier and archive_handler:
+            print(f"\nTesting Telegram button...")
 
-            # Save locally
-            timestamp = time.strftime('%Y%m%d_%H%M%S')
-            listing_id = listing_url.split('/')[-1] or 'test'
-            archive_id = f"{timestamp}_{listing_id}"
+            # Store archive for first receiver
+            receiver_id = telegram_notifier.receiver_ids[0] if telegram_notifier.receiver_ids else None
 
-            print(f"\nSaving archive locally...")
-            if archive_manager.save_archive_locally(archive_data, archive_id):
-                print(f"✓ Saved to: {archive_manager.archive_path / archive_id}")
+            if not receiver_id:
+                print("✗ No Telegram receivers configured")
             else:
-                print(f"✗ Failed to save locally")
+                stored_id = archive_handler.store_archive(archive_data, receiver_id)
 
-            # Test Telegram integration
-            if telegram_notifier and archive_handler:
-                print(f"\nTesting Telegram button...")
+                if stored_id:
+                    print(f"✓ Archive stored with ID: {stored_id}")
 
-                # Store archive for first receiver
-                receiver_id = telegram_notifier.receiver_ids[0] if telegram_notifier.receiver_ids else None
+                    # Send message with button
+                    result = telegram_notifier.send_with_inline_button(
+                        chat_id=receiver_id,
+                        message=f"🧪 TEST: Archive for\n{expose['title']}",
+                        button_text="📷 View Archive (Test)",
+                        callback_data=f"archive:{stored_id}"
+                    )
 
-                if not receiver_id:
-                    print("✗ No Telegram receivers configured")
-                else:
-                    stored_id = archive_handler.store_archive(archive_data, receiver_id)
-
-                    if stored_id:
-                        print(f"✓ Archive stored with ID: {stored_id}")
-
-                        # Send message with button
-                        result = telegram_notifier.send_with_inline_button(
-                            chat_id=receiver_id,
-                            message=f"🧪 TEST: Archive for\n{expose['title']}",
-                            button_text="📷 View Archive (Test)",
-                            callback_data=f"archive:{stored_id}"
-                        )
-
-                        if result:
-                            print(f"✓ Sent Telegram message with button to chat {receiver_id}")
-                            print(f"\n{'='*70}")
-                            print(f"SUCCESS! Check your Telegram and click the button.")
-                            print(f"{'='*70}\n")
-                        else:
-                            print(f"✗ Failed to send Telegram message")
+                    if result:
+                        print(f"✓ Sent Telegram message with button to chat {receiver_id}")
+                        print(f"\n{'='*70}")
+                        print(f"SUCCESS! Check your Telegram and click the button.")
+                        print(f"{'='*70}\n")
                     else:
-                        print(f"✗ Failed to store archive")
+                        print(f"✗ Failed to send Telegram message")
+                else:
+                    print(f"✗ Failed to store archive")
 
-            print(f"\n{'='*70}")
-            print(f"Test completed successfully!")
-            print(f"{'='*70}\n")
+        print(f"\n{'='*70}")
+        print(f"Test completed successfully!")
+        print(f"{'='*70}\n")
 
-            # Keep polling thread alive for a bit to handle button clicks
-            if archive_handler:
-                print("Waiting 60 seconds for button clicks (press Ctrl+C to exit early)...")
-                try:
-                    time.sleep(60)
-                except KeyboardInterrupt:
-                    print("\nExiting...")
+        # Keep polling thread alive for a bit to handle button clicks
+        if archive_handler:
+            print("Waiting up to 60 seconds for a button click (press Ctrl+C to exit early)...")
+            try:
+                if button_clicked.wait(60):
+                    print("✓ Button click handled")
+            except KeyboardInterrupt:
+                print("\nExiting...")
 
-                archive_handler.stop_polling()
+            archive_handler.stop_polling()
 
-            return True
+        return True
 
-        finally:
-            driver.quit()
 
     except Exception as e:
         print(f"\n✗ ERROR: {e}")
@@ -273,18 +582,40 @@ def test_archive_for_url(listing_url: str, config_path: str = None):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print(f"Usage: python archive_test.py \"LISTING_URL\" [config_path]")
+    args = sys.argv[1:]
+    reuse_session = '--reuse-session' in args
+    no_cache = '--no-cache' in args
+    args = [arg for arg in args if arg not in ('--reuse-session', '--no-cache')]
+
+    if len(args) < 1:
+        print("Usage: python archive_test.py [--reuse-session] [--no-cache] \"LISTING_URL\" [config_path]")
         print(f"\nExamples:")
         print(f"  python archive_test.py \"https://www.willhaben.at/iad/immobilien/d/wohnung/...\"")
         print(f"  python archive_test.py \"https://www.wg-gesucht.de/...\" /path/to/config.yaml")
+        print("  python archive_test.py --reuse-session \"https://www.willhaben.at/...\"")
         print(f"\nNote: If config_path is not provided, looks for config.yaml in current directory")
+        print("      With --reuse-session the browser stays open and further URLs are read from stdin")
+        print(f"      Page sources are cached in {PAGE_CACHE_DIR}/ for 1h, --no-cache always refetches")
         sys.exit(1)
 
-    listing_url = sys.argv[1]
-    config_path = sys.argv[2] if len(sys.argv) > 2 else None
+    listing_url = args[0]
+    config_path = args[1] if len(args) > 1 else None
+
+    success = test_archive_for_url(listing_url, config_path, reuse_session=reuse_session,
+                                   no_cache=no_cache)
+
+    if reuse_session:
+        # Keep the browser alive and test further URLs in new tabs
+        while True:
+            try:
+                listing_url = input("Next listing URL (empty to quit): ").strip()
+            except (EOFError, KeyboardInterrupt):
+                break
+            if not listing_url:
+                break
+            success = test_archive_for_url(listing_url, config_path, reuse_session=True,
+                                           no_cache=no_cache) and success
 
-    success = test_archive_for_url(listing_url, config_path)
     sys.exit(0 if success else 1)
 
 
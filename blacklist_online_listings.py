@@ -8,26 +8,28 @@ systems. This prevents accidentally spamming contacts if the database files get
 cleaned up during updates.
 
 Usage:
-    python blacklist_online_listings.py [--dry-run]
+    python blacklist_online_listings.py [--dry-run] [-v]
 
 Options:
     --dry-run    Show what would be blacklisted without actually doing it
+    -v           Log the status of every single listing
 """
 
 import sys
 import os
 import argparse
+from collections import Counter
+from contextlib import contextmanager
 from pathlib import Path
+from urllib.parse import urlparse
 
 # Add flathunter directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flathunter.config import Config
-from flathunter.idmaintainer import IdMaintainer
-from flathunter.crawler.willhaben import Willhaben
-from flathunter.crawler.wggesucht import WgGesucht
-import json
+# requests and the flathunter modules (crawlers pull in selenium) are imported
+# where they are used, so --help returns without the import cost
 import logging
+import logging.handlers
 
 logging.basicConfig(
     level=logging.INFO,
@@ -35,21 +37,71 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Platform of a configured search URL, by host
+PLATFORM_BY_HOST = {
+    'willhaben.at': 'willhaben',
+    'www.willhaben.at': 'willhaben',
+    'wg-gesucht.de': 'wg-gesucht',
+    'www.wg-gesucht.de': 'wg-gesucht',
+}
 
-def load_willhaben_contacted_cache():
-    """Load the Willhaben-specific contacted listings cache"""
-    contacted_file = Path.home() / '.willhaben_contacted.json'
-    if contacted_file.exists():
-        with open(contacted_file, 'r') as f:
-            return set(json.load(f))
-    return set()
 
+@contextmanager
+def buffered_log_output(capacity=500):
+    """Buffer the records of the root handlers and write them out in chunks
 
-def save_willhaben_contacted_cache(contacted_listings):
-    """Save the Willhaben-specific contacted listings cache"""
-    contacted_file = Path.home() / '.willhaben_contacted.json'
-    with open(contacted_file, 'w') as f:
-        json.dump(list(contacted_listings), f, indent=2)
+    Records are flushed every `capacity` records, on ERROR and when the block
+    is left, so a long per-listing loop doesn't write to stderr line by line.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    buffers = [logging.handlers.MemoryHandler(capacity, flushLevel=logging.ERROR, target=handler)
+               for handler in handlers]
+    for handler, buffer in zip(handlers, buffers):
+        root.removeHandler(handler)
+        root.addHandler(buffer)
+    try:
+        yield
+    finally:
+        for handler, buffer in zip(handlers, buffers):
+            root.removeHandler(buffer)
+            buffer.close()
+            root.addHandler(handler)
+
+
+def create_http_session():
+    """Create a requests session with a connection pool sized for the parallel crawl"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def crawl_urls_parallel(crawler, urls, max_workers=8):
+    """
+    Crawl the first result page of each URL concurrently
+
+    Args:
+        crawler: Crawler instance shared by all workers
+        urls: Search URLs to crawl
+        max_workers: Maximum number of concurrent requests
+
+    Returns:
+        List of listings, ordered like the input URLs
+    """
+    # Crawl the URLs (just first page to get current listings)
+    results = crawler.crawl_many(urls, max_pages=1, max_workers=max_workers)
+    for url, listings in zip(urls, results):
+        logger.info(f"Crawled: {url}")
+        logger.info(f"  Found {len(listings)} listings")
+
+    return [listing for listings in results for listing in listings]
 
 
 def blacklist_online_listings(dry_run=False):
@@ -59,6 +111,12 @@ def blacklist_online_listings(dry_run=False):
     Args:
         dry_run: If True, only show what would be done without making changes
     """
+    from flathunter.config import Config
+    from flathunter.idmaintainer import IdMaintainer
+    from flathunter.crawler.willhaben import Willhaben
+    from flathunter.crawler.wggesucht import WgGesucht
+    from flathunter.willhaben_contacted_store import WillhabenContactedStore
+
     # Load configuration
     config_path = Path(__file__).parent / 'config.yaml'
     if not config_path.exists():
@@ -69,8 +127,12 @@ def blacklist_online_listings(dry_run=False):
     config = Config(str(config_path))
 
     # Separate URLs by platform
-    willhaben_urls = [url for url in config.target_urls() if 'willhaben.at' in url]
-    wg_gesucht_urls = [url for url in config.target_urls() if 'wg-gesucht.de' in url]
+    urls_by_platform = {}
+    for url in config.target_urls():
+        platform = PLATFORM_BY_HOST.get(urlparse(url).hostname)
+        urls_by_platform.setdefault(platform, []).append(url)
+    willhaben_urls = urls_by_platform.get('willhaben', [])
+    wg_gesucht_urls = urls_by_platform.get('wg-gesucht', [])
 
     if not willhaben_urls and not wg_gesucht_urls:
         logger.warning("No Willhaben or WG-Gesucht URLs found in config!")
@@ -86,26 +148,19 @@ def blacklist_online_listings(dry_run=False):
 
     # Initialize tracking systems
     id_watch = IdMaintainer(f'{config.database_location()}/processed_ids.db')
-    willhaben_cache = load_willhaben_contacted_cache()
+    willhaben_cache = WillhabenContactedStore()
+    new_willhaben_ids = set()
 
     # Collect all listings
     all_listings = []
     logger.info("\nFetching listings from configured URLs...")
 
-    # Crawl Willhaben URLs
+    # Crawl Willhaben URLs (network-bound, so fetch them in parallel)
     if willhaben_urls:
         logger.info("\n--- Willhaben ---")
-        willhaben_crawler = Willhaben(config)
-        for url in willhaben_urls:
-            logger.info(f"\nCrawling: {url}")
-            try:
-                # Crawl the URL (just first page to get current listings)
-                listings = willhaben_crawler.get_results(url, max_pages=1)
-                logger.info(f"  Found {len(listings)} listings")
-                all_listings.extend(listings)
-            except Exception as e:
-                logger.error(f"  Error crawling URL: {e}")
-                continue
+        # One pooled session for all URLs, so TLS connections are kept alive
+        willhaben_crawler = Willhaben(config, session=create_http_session())
+        all_listings.extend(crawl_urls_parallel(willhaben_crawler, willhaben_urls))
 
     # Crawl WG-Gesucht URLs
     if wg_gesucht_urls:
@@ -130,76 +185,72 @@ def blacklist_online_listings(dry_run=False):
     logger.info(f"Total listings to blacklist: {len(all_listings)}")
     logger.info(f"{'='*60}\n")
 
-    # Statistics
-    stats = {
-        'total': len(all_listings),
-        'willhaben': 0,
-        'wg_gesucht': 0,
-        'already_processed': 0,
-        'already_contacted_title': 0,
-        'already_in_willhaben_cache': 0,
-        'newly_blacklisted': 0
-    }
-
-    # Process each listing
-    for i, listing in enumerate(all_listings, 1):
-        listing_id = listing.get('id')
-        listing_title = listing.get('title', 'N/A')
-        listing_url = listing.get('url', 'N/A')
-        platform = listing.get('crawler', 'Unknown')
-
-        # Track platform statistics
-        if platform == 'Willhaben':
-            stats['willhaben'] += 1
-        elif platform == 'WgGesucht':
-            stats['wg_gesucht'] += 1
-
-        logger.info(f"[{i}/{len(all_listings)}] {platform} - ID: {listing_id}")
-        logger.info(f"  Title: {listing_title[:60]}...")
-        logger.info(f"  URL: {listing_url}")
-
-        # Check current status
-        already_processed = id_watch.is_processed(listing_id)
-        already_contacted = id_watch.is_title_contacted(listing_title)
-
-        # Only check Willhaben cache for Willhaben listings
-        already_cached = False
-        if platform == 'Willhaben':
-            already_cached = str(listing_id) in willhaben_cache
-
-        if already_processed:
-            logger.info(f"  ✓ Already in processed_ids")
-            stats['already_processed'] += 1
-
-        if already_contacted:
-            logger.info(f"  ✓ Already in contacted_titles")
-            stats['already_contacted_title'] += 1
-
-        if already_cached:
-            logger.info(f"  ✓ Already in willhaben cache")
-            stats['already_in_willhaben_cache'] += 1
-
-        # Check if this is new to all systems
-        is_new = not (already_processed or already_contacted or already_cached)
-
-        if is_new:
-            stats['newly_blacklisted'] += 1
-            logger.info(f"  → NEW - will be blacklisted")
+    # Look up the current status of all listings in one pass per tracking system
+    processed_ids = id_watch.filter_processed(
+        [listing.get('id') for listing in all_listings])
+    contacted_titles = id_watch.filter_title_contacted(
+        [listing.get('title', 'N/A') for listing in all_listings])
+    cached_willhaben_ids = willhaben_cache.filter_contacted(
+        [listing.get('id') for listing in all_listings if listing.get('crawler') == 'Willhaben'])
+
+    stats = Counter(total=len(all_listings))
+    verbose = logger.isEnabledFor(logging.DEBUG)
+
+    # Process each listing (log output is written in batches)
+    with buffered_log_output():
+        for i, listing in enumerate(all_listings, 1):
+            listing_id = listing.get('id')
+            listing_title = listing.get('title', 'N/A')
+            platform = listing.get('crawler', 'Unknown')
+
+            # Check current status (only Willhaben listings live in the Willhaben cache)
+            already_processed = listing_id in processed_ids
+            already_contacted = listing_title in contacted_titles
+            already_cached = platform == 'Willhaben' and str(listing_id) in cached_willhaben_ids
+            is_new = not (already_processed or already_contacted or already_cached)
+
+            stats.update({
+                'willhaben': platform == 'Willhaben',
+                'wg_gesucht': platform == 'WgGesucht',
+                'already_processed': already_processed,
+                'already_contacted_title': already_contacted,
+                'already_in_willhaben_cache': already_cached,
+                'newly_blacklisted': is_new,
+            })
+
+            if verbose:
+                logger.debug(f"[{i}/{len(all_listings)}] {platform} - ID: {listing_id}")
+                logger.debug(f"  Title: {listing_title[:60]}...")
+                logger.debug(f"  URL: {listing.get('url', 'N/A')}")
+                if already_processed:
+                    logger.debug("  ✓ Already in processed_ids")
+                if already_contacted:
+                    logger.debug("  ✓ Already in contacted_titles")
+                if already_cached:
+                    logger.debug("  ✓ Already in willhaben cache")
+
+            if not is_new:
+                continue
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"NEW - will be blacklisted: {platform} {listing_id} - {listing_title[:60]}")
 
             if not dry_run:
                 # Mark in database tracking systems (both platforms)
                 id_watch.mark_processed(listing_id)
                 id_watch.mark_title_contacted(listing)
+                # Keep duplicates across search URLs from being counted twice
+                processed_ids.add(listing_id)
+                contacted_titles.add(listing_title)
 
                 # Only add to Willhaben cache for Willhaben listings
                 if platform == 'Willhaben':
-                    willhaben_cache.add(str(listing_id))
-
-        logger.info("")  # Blank line for readability
+                    new_willhaben_ids.add(str(listing_id))
+                    cached_willhaben_ids.add(str(listing_id))
 
     # Save the updated cache (only if there were Willhaben listings)
-    if not dry_run and stats['willhaben'] > 0:
-        save_willhaben_contacted_cache(willhaben_cache)
+    if not dry_run and new_willhaben_ids:
+        willhaben_cache.update(new_willhaben_ids)
         logger.info("✓ Updated Willhaben contacted cache")
 
     # Print summary
@@ -234,8 +285,15 @@ def main():
         action='store_true',
         help='Show what would be done without making changes'
     )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Log the status of every single listing'
+    )
 
     args = parser.parse_args()
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
 
     try:
         return blacklist_online_listings(dry_run=args.dry_run)
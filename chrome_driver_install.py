@@ -1,4 +1,5 @@
 """Script to trigger installation of chrome driver during docker image build"""
+import glob
 import logging
 import os
 
@@ -10,4 +11,19 @@ from flathunter.logger_config import wdm_logger
 os.environ['WDM_LOCAL'] = '1'
 wdm_logger.setLevel(logging.INFO)
 
-ChromeDriverManager().install()
+# Where webdriver-manager keeps its drivers when WDM_LOCAL is set
+DRIVER_GLOB = os.path.join(os.getcwd(), '.wdm', 'drivers', 'chromedriver', '**', 'chromedriver*')
+
+
+def installed_drivers():
+    """Return the chromedriver binaries already present in the local cache"""
+    return [path for path in glob.glob(DRIVER_GLOB, recursive=True)
+            if os.path.isfile(path) and not path.endswith('.zip')]
+
+
+# Only look up (and download) a driver when none is cached yet, or a refresh is
+# requested. A pinned CHROMEDRIVER_VERSION skips the online "latest" lookup.
+if os.environ.get('FORCE_WDM_REFRESH') == '1' or not installed_drivers():
+    ChromeDriverManager(driver_version=os.environ.get('CHROMEDRIVER_VERSION')).install()
+else:
+    wdm_logger.info("Chromedriver already installed: %s", installed_drivers()[0])
@@ -2,13 +2,12 @@
 Create or edit a basic flathunter configuration
 """
 import sys
-import re
 import os
-from typing import List, Any, Dict, Optional
+import copy
+import functools
+from typing import List, Any, Dict, Optional, Tuple
 from enum import Enum
-from functools import reduce
 
-from ruamel.yaml import YAML
 from prompt_toolkit.shortcuts import message_dialog, radiolist_dialog, clear, button_dialog
 from prompt_toolkit import prompt
 from prompt_toolkit.document import Document
@@ -18,6 +17,68 @@ from flathunter.config import YamlConfig
 from flathunter.crawler import immobilienscout
 
 
+@functools.lru_cache(maxsize=None)
+def yaml_parser():
+    """Return the shared YAML parser, importing ruamel.yaml on first use
+
+    Round-trip mode keeps the comments of config.yaml.dist in the generated
+    config, so the parser is kept in that mode and only built once. A wide line
+    width avoids re-wrapping long URLs on dump.
+    """
+    from ruamel.yaml import YAML
+    parser = YAML()
+    parser.width = 4096
+    return parser
+
+
+# Full-screen dialogs render slowly on low-end devices and don't work on dumb or
+# redirected terminals - plain prompts are used there instead
+FULLSCREEN_DIALOGS = sys.stdout.isatty() and \
+    (os.name == 'nt' or os.environ.get('TERM', '') not in ('dumb', ''))
+
+# Help screens of the wizard steps (printed as a single block each)
+_URL_HELP = ("Enter URLs for Scraping\n\n"
+    "Flathunter scrapes property portals by fetching content from search URLs\n"
+    "on the websites. Visit ImmoScout, ImmoWelt, Kleinanzeigen or WG-Gesucht,\n"
+    "make a search for the flat that you are looking for (e.g. pick a city), and\n"
+    "copy the URL here. You can add as many URLs as you like.\n\n\n")
+
+_BOT_TOKEN_HELP = ("Telegram Bot Token\n\n"
+    "To send Telegram messages, we need a Telegram Bot Token. You can follow\n"
+    "the instructions here to track down 'The BotFather' and generate your token:\n"
+    "https://medium.com/geekculture/generate-telegram-token-for-bot-api-d26faf9bf064\n")
+
+_RECEIVER_ID_HELP = ("Telegram Receiver ID\n\n"
+    "Your Telegram Bot needs to know which user to send the notifications to.\n"
+    "This will normally be the User ID associated with your Telegram Account.\n"
+    "To work out your User ID, start a chat with the @userinfobot:\n"
+    "https://telegram.me/userinfobot\n")
+
+_MATTERMOST_HELP = ("Mattermost Webhook URL\n\n"
+    "To receive messages over Mattermost, Flathunter will need the Webhook URL\n"
+    "of your Mattermost server.\n")
+
+_APPRISE_HELP = ("Apprise notification URL\n\n"
+    "To receive messages using Apprise, you need to supply a notification URL in the\n"
+    "apprise format, e.g. 'gotifys://...' or 'mailto://...'\n")
+
+_SLACK_HELP = ("Slack Webhook URL\n\n"
+    "To receive messages over Slack, Flathunter will need the Webhook URL\n"
+    "of your Slack channel.\n")
+
+_CAPTCHA_HELP = ("Captcha configuration\n\n"
+    "Your search configuration includes URLs from ImmobilienScout24\n"
+    "To crawl ImmoScout, we need to browse the site with a real Chrome browser instance\n"
+    "and solve the Captcha that shows up on the ImmoScout site.\n\n"
+    "You WILL NEED TO INSTALL google-chrome / chromium to solve Captchas\n\n"
+    "We recommend using Capmonster (https://capmonster.cloud/) as your captcha-solving\n"
+    "service. You will need an account there with some credit on it.\n"
+    "IMPORTANT NOTICE: Buying captcha credit does not guarantee that Flathunter will be\n"
+    "able to bypass the bot detection on the ImmoScout site - pay at your own risk!!\n\n"
+    "Once you have an account and have paid, enter the API Key here (or hit Enter\n"
+    "to skip Captcha configuration, but be aware that ImmoScout scraping will fail...)\n")
+
+
 class ConfigurationAborted(Exception):
     """Exception to indicate the user has aborted the configuration"""
     def __str__(self):
@@ -33,16 +94,46 @@ class Notifier(Enum):
     APPRISE = "apprise"
     SLACK = "slack"
 
+def show_message(title: str, text: str):
+    """Show a message and wait for the user to press Enter"""
+    if FULLSCREEN_DIALOGS:
+        message_dialog(title=title, text=text).run()
+        return
+    print(f"{title}\n\n{text}")
+    input()
+
+def ask_yes_no(title: str, text: str) -> bool:
+    """Ask a yes / no question"""
+    if FULLSCREEN_DIALOGS:
+        return button_dialog(title=title, text=text,
+                             buttons=[("Yes", True), ("No", False)]).run()
+    print(f"{title}\n\n{text}")
+    return input("[y/N]: ").strip().lower() in ("y", "yes")
+
+def choose_option(title: str, text: str, values: List[Tuple[str, str]], default: str) -> str:
+    """Let the user pick one of the (value, label) options"""
+    if FULLSCREEN_DIALOGS:
+        return radiolist_dialog(values=values, title=title, text=text, default=default).run()
+    print(f"{title}\n\n{text}")
+    for index, (value, label) in enumerate(values, 1):
+        print(f"  [{index}] {label}{' (default)' if value == default else ''}")
+    while True:
+        choice = input("Enter a number (or hit enter for the default): ").strip()
+        if len(choice) == 0:
+            return default
+        if choice.isdigit() and 1 <= int(choice) <= len(values):
+            return values[int(choice) - 1][0]
+
 def welcome():
     """Display the welcome dialog"""
-    message_dialog(
+    show_message(
         title="Flathunter Configuration Wizard",
         text="Welcome to the Flathunter Configuration Wizard\n\n"
           "This Wizard will take you through the configuration of your Flathunter\ninstallation. "
           "The configuration generated will be saved to `config.yaml`\n"
           "in your project directory\n\n"
           "Press ENTER to continue.",
-    ).run()
+    )
 
 class UrlsValidator(Validator):
     """Validate that URLs entered in the URL entry screen are crawled by one of the
@@ -50,6 +141,10 @@ class UrlsValidator(Validator):
     def __init__(self, urls, config):
         self.urls = urls
         self.config = config
+        # URL_PATTERNs are compiled regexes - collect them once, not on every validation
+        self.url_patterns = [searcher.URL_PATTERN for searcher in config.searchers()]
+        # URLs that already passed validation (e.g. when Enter is pressed twice)
+        self.validated_urls = set()
 
     def validate(self, document: Document):
         """Runs when Enter is pressed at the URL Entry prompt"""
@@ -57,8 +152,11 @@ class UrlsValidator(Validator):
             if len(self.urls) == 0:
                 raise ValidationError(cursor_position=0, message="Supply at least one URL")
             return
-        for searcher in self.config.searchers():
-            if re.search(searcher.URL_PATTERN, document.text):
+        if document.text in self.validated_urls:
+            return
+        for pattern in self.url_patterns:
+            if pattern.search(document.text):
+                self.validated_urls.add(document.text)
                 return
         raise ValidationError(cursor_position=len(document.text),
             message="URL did not match any configured scraper")
@@ -69,18 +167,19 @@ def gather_urls(config: YamlConfig) -> List[str]:
     urls = config.target_urls()
     result = ""
     first_run = True
+    # The validator sees URLs appended to the list, so one instance serves all prompts
+    validator = UrlsValidator(urls, config)
     while first_run or len(urls) == 0 or len(result) > 0:
-        clear()
-        print("Enter URLs for Scraping\n")
-        print("Flathunter scrapes property portals by fetching content from search URLs\n"
-            "on the websites. Visit ImmoScout, ImmoWelt, Kleinanzeigen or WG-Gesucht,\n"
-            "make a search for the flat that you are looking for (e.g. pick a city), and\n"
-            "copy the URL here. You can add as many URLs as you like.\n\n")
-        if len(urls) > 0:
-            print("\n".join(urls))
-            print("")
+        # Entered URLs stay on screen below the help text, so only draw it once
+        if first_run:
+            clear()
+            screen = _URL_HELP
+            if len(urls) > 0:
+                screen += "\n".join(urls) + "\n\n"
+            sys.stdout.write(screen)
+            sys.stdout.flush()
         result = prompt("Enter a target URL (or hit enter to continue): ",
-            validator=UrlsValidator(urls, config), validate_while_typing=False)
+            validator=validator, validate_while_typing=False)
         if len(result) > 0:
             urls.append(result)
         if len(result) == 0 and len(urls) == 0:
@@ -94,7 +193,7 @@ def select_notifier(config: YamlConfig) -> str:
         default = config.notifiers()[0]
     else:
         default = Notifier.TELEGRAM.value
-    return radiolist_dialog(
+    return choose_option(
         values=[
             (Notifier.TELEGRAM.value, "Telegram"),
             (Notifier.MATTERMOST.value, "Mattermost"),
@@ -104,21 +203,16 @@ def select_notifier(config: YamlConfig) -> str:
         title="Configure notifications",
         text="Choose a notification platform.",
         default=default
-    ).run()
+    )
 
 def prompt_with_default(prompt_string: str, default_value: Optional[str]) -> str:
     """Prompt the user for input, providing an optional default value"""
-    if default_value is None:
-        return prompt(prompt_string)
-    return prompt(prompt_string, default = default_value)
+    return prompt(prompt_string, default = default_value or "")
 
 def get_bot_token(config: YamlConfig) -> str:
     """Ask the user for the Telegram Bot token"""
     clear()
-    print("Telegram Bot Token\n")
-    print("To send Telegram messages, we need a Telegram Bot Token. You can follow\n"
-        "the instructions here to track down 'The BotFather' and generate your token:\n"
-        "https://medium.com/geekculture/generate-telegram-token-for-bot-api-d26faf9bf064\n")
+    print(_BOT_TOKEN_HELP)
 
     result = prompt_with_default("Enter Bot Token: ", config.telegram_bot_token())
     if result is None or len(result) == 0:
@@ -128,11 +222,7 @@ def get_bot_token(config: YamlConfig) -> str:
 def get_receiver_id(config: YamlConfig) -> str:
     """Ask the user for the target Telegram User ID for the Telegram notifications"""
     clear()
-    print("Telegram Receiver ID\n")
-    print("Your Telegram Bot needs to know which user to send the notifications to.\n"
-        "This will normally be the User ID associated with your Telegram Account.\n"
-        "To work out your User ID, start a chat with the @userinfobot:\n"
-        "https://telegram.me/userinfobot\n")
+    print(_RECEIVER_ID_HELP)
     current_receiver_id = None
     if len(config.telegram_receiver_ids()) > 0:
         current_receiver_id = str(config.telegram_receiver_ids()[0])
@@ -156,9 +246,7 @@ def configure_telegram(config: YamlConfig) -> Dict[str, Any]:
 def configure_mattermost(config: YamlConfig) -> Dict[str, Any]:
     """Ask the user for the mattermost webhook URL"""
     clear()
-    print("Mattermost Webhook URL\n")
-    print("To receive messages over Mattermost, Flathunter will need the Webhook URL\n"
-    "of your Mattermost server.\n")
+    print(_MATTERMOST_HELP)
 
     webhook_url = prompt_with_default("Enter Webhook URL: ", config.mattermost_webhook_url())
     if len(webhook_url) == 0:
@@ -172,13 +260,10 @@ def configure_mattermost(config: YamlConfig) -> Dict[str, Any]:
 def configure_apprise(config: YamlConfig) -> Dict[str, Any]:
     """Ask the user for the apprise notification URL"""
     clear()
-    print("Apprise notification URL\n")
-    print("To receive messages using Apprise, you need to supply a notification URL in the\n"
-    "apprise format, e.g. 'gotifys://...' or 'mailto://...'\n")
-    if len(config.apprise_urls()) > 0:
-        apprise_url = prompt("Enter Apprise notification URL: ", default=config.apprise_urls()[0])
-    else:
-        apprise_url = prompt("Enter Apprise notification URL: ")
+    print(_APPRISE_HELP)
+    apprise_urls = config.apprise_urls()
+    apprise_url = prompt_with_default("Enter Apprise notification URL: ",
+                                      apprise_urls[0] if len(apprise_urls) > 0 else None)
 
     if len(apprise_url) == 0:
         raise ConfigurationAborted()
@@ -189,9 +274,7 @@ def configure_apprise(config: YamlConfig) -> Dict[str, Any]:
 def configure_slack(config: YamlConfig) -> Dict[str, Any]:
     """Ask the user for the Slack webhook URL"""
     clear()
-    print("Slack Webhook URL\n")
-    print("To receive messages over Slack, Flathunter will need the Webhook URL\n"
-    "of your Slack channel.\n")
+    print(_SLACK_HELP)
 
     webhook_url = prompt_with_default("Enter Webhook URL: ", config.slack_webhook_url())
     if len(webhook_url) == 0:
@@ -202,41 +285,28 @@ def configure_slack(config: YamlConfig) -> Dict[str, Any]:
         }
     }
 
+_NOTIFIER_HANDLERS = {
+    Notifier.TELEGRAM.value: configure_telegram,
+    Notifier.MATTERMOST.value: configure_mattermost,
+    Notifier.APPRISE.value: configure_apprise,
+    Notifier.SLACK.value: configure_slack,
+}
+
 def configure_notifier(notifier: str, config) -> Dict[str, Any]:
     """Configure the selected / active notifier"""
-    if notifier == Notifier.TELEGRAM.value:
-        return configure_telegram(config)
-    if notifier == Notifier.MATTERMOST.value:
-        return configure_mattermost(config)
-    if notifier == Notifier.APPRISE.value:
-        return configure_apprise(config)
-    if notifier == Notifier.SLACK.value:
-        return configure_slack(config)
-    raise ConfigurationError("Invalid Notifier Selection")
+    handler = _NOTIFIER_HANDLERS.get(notifier)
+    if handler is None:
+        raise ConfigurationError("Invalid Notifier Selection")
+    return handler(config)
 
 def configure_captcha(urls: List[str], config: YamlConfig) -> Optional[Dict[str, Any]]:
     """Configure the captcha solver, where required"""
-    is_immoscout = reduce(lambda a,b: a or b,
-                          [re.search(immobilienscout.STATIC_URL_PATTERN, url) for url in urls],
-                          False)
+    is_immoscout = any(immobilienscout.STATIC_URL_PATTERN.search(url) for url in urls)
     if not is_immoscout:
         return None
     clear()
-    print("Captcha configuration\n")
-    print("Your search configuration includes URLs from ImmobilienScout24\n"
-    "To crawl ImmoScout, we need to browse the site with a real Chrome browser instance\n"
-    "and solve the Captcha that shows up on the ImmoScout site.\n")
-    print("You WILL NEED TO INSTALL google-chrome / chromium to solve Captchas\n")
-    print("We recommend using Capmonster (https://capmonster.cloud/) as your captcha-solving\n"
-    "service. You will need an account there with some credit on it.\n"
-    "IMPORTANT NOTICE: Buying captcha credit does not guarantee that Flathunter will be\n"
-    "able to bypass the bot detection on the ImmoScout site - pay at your own risk!!\n")
-    print("Once you have an account and have paid, enter the API Key here (or hit Enter\n"
-    "to skip Captcha configuration, but be aware that ImmoScout scraping will fail...)\n")
-    if config.get_capmonster_key() is not None:
-        api_key = prompt("Enter Capmonster API Key: ", default=config.get_capmonster_key())
-    else:
-        api_key = prompt("Enter Capmonster API Key: ")
+    print(_CAPTCHA_HELP)
+    api_key = prompt_with_default("Enter Capmonster API Key: ", config.get_capmonster_key())
 
     if len(api_key) == 0:
         return None
@@ -256,34 +326,37 @@ def configure_captcha(urls: List[str], config: YamlConfig) -> Optional[Dict[str,
         }
     }
 
+@functools.lru_cache(maxsize=2)
+def _parse_yaml_file(path: str, mtime: float):
+    """Parse a YAML file, cached per path and modification time"""
+    with open(path, "r", encoding="utf-8") as yaml_file:
+        return yaml_parser().load(yaml_file)
+
 def load_config(existing) -> YamlConfig:
     """Load the existing (or default) config from disk"""
-    yaml = YAML()
     source_file = "config.yaml.dist"
     if existing:
         source_file = "config.yaml"
-    with open(source_file, "r", encoding="utf-8") as dist_config:
-        config = yaml.load(dist_config)
-    return YamlConfig(config)
+    # The wizard edits the config in place, so hand out a copy of the cached tree
+    config = _parse_yaml_file(source_file, os.path.getmtime(source_file))
+    return YamlConfig(copy.deepcopy(config))
 
 def save_config(config: Dict):
     """Save the configuration as 'config.yaml'"""
     clear()
-    yaml = YAML()
     with open("config.yaml", "w", encoding="utf-8") as config_file:
-        yaml.dump(config, config_file)
+        yaml_parser().dump(config, config_file)
     print("Configuration saved to 'config.yaml' - you're all set!")
 
 def check_existing() -> bool:
     """Check to see if a configuration file already exists, prompt if so"""
     if not os.path.exists("config.yaml"):
         return False
-    result = button_dialog(
+    result = ask_yes_no(
         title="Config File Exists",
         text="We found an existing 'config.yaml' file in the current directory\n"
         "Running the wizard will update / edit this file. Do you want to proceed?",
-        buttons=[("Yes", True), ("No", False)],
-    ).run()
+    )
     if not result:
         raise ConfigurationAborted()
     return True
@@ -4,15 +4,16 @@
    messages about them. This is the main command-line executable, for running on the
    console. To run as a webservice, look at main.py"""
 
+import os
+import signal
+import sys
+import threading
 import time
 from datetime import time as dtime
 from pathlib import Path
-import json
 
 from flathunter.argument_parser import parse
 from flathunter.logger_config import logger, configure_logging
-from flathunter.idmaintainer import IdMaintainer
-from flathunter.hunter import Hunter
 from flathunter.config import Config
 from flathunter.heartbeat import Heartbeat
 from flathunter.time_utils import get_random_time_jitter, wait_during_period
@@ -23,20 +24,69 @@ __maintainer__ = "Nody"
 __email__ = "harrymcfly@protonmail.com"
 __status__ = "Production"
 
+# Cookie files written by the contact bots (plain strings for cheap os.path checks)
+HOME_DIR = os.path.expanduser('~')
+WILLHABEN_COOKIES_FILE = os.path.join(HOME_DIR, '.willhaben_cookies.json')
+WGGESUCHT_COOKIES_FILE = os.path.join(HOME_DIR, '.wg_gesucht_cookies.json')
+
+# Seconds to wait for a choice at the saved sessions prompt before using them,
+# overridable with FLATHUNTER_SESSION_PROMPT_TIMEOUT
+SESSION_PROMPT_TIMEOUT = 30.0
+
+# Interactive session menus, each written to the terminal in one go
+SEPARATOR = "=" * 60
+
+SESSION_MANAGER_MENU = f"""
+{SEPARATOR}
+SESSION MANAGER
+{SEPARATOR}
+{{sessions_block}}
+
+{SEPARATOR}
+Options:
+  [1]  Setup Willhaben session
+  [2]  Setup WG-Gesucht session
+  [3]  Setup both sessions
+  [4]  Clear Willhaben session
+  [5]  Clear WG-Gesucht session
+  [6]  Clear all sessions
+  [c]  Continue with current sessions
+  [q]  Quit
+{SEPARATOR}
+"""
+
+SAVED_SESSIONS_MENU = f"""
+{SEPARATOR}
+SAVED SESSIONS FOUND
+{SEPARATOR}
+{{sessions_block}}
+{SEPARATOR}
+
+Options:
+  [ENTER]  Use saved sessions and continue
+  [x]      Clear/manage sessions
+  [s]      Setup/refresh sessions
+  [q]      Quit
+{SEPARATOR}
+"""
+
+
+def format_sessions(sessions):
+    """One line per saved session, for the session menus"""
+    return "\n".join(f"  ✓ {info['name']}" for info in sessions.values())
+
 
 def get_session_info():
     """Get information about saved sessions"""
     sessions = {}
 
     # Check for willhaben session
-    willhaben_cookies = Path.home() / '.willhaben_cookies.json'
-    if willhaben_cookies.exists():
-        sessions['willhaben'] = {'path': willhaben_cookies, 'name': 'Willhaben'}
+    if os.path.isfile(WILLHABEN_COOKIES_FILE):
+        sessions['willhaben'] = {'path': WILLHABEN_COOKIES_FILE, 'name': 'Willhaben'}
 
     # Check for wg-gesucht session
-    wggesucht_cookies = Path.home() / '.wg_gesucht_cookies.json'
-    if wggesucht_cookies.exists():
-        sessions['wg-gesucht'] = {'path': wggesucht_cookies, 'name': 'WG-Gesucht'}
+    if os.path.isfile(WGGESUCHT_COOKIES_FILE):
+        sessions['wg-gesucht'] = {'path': WGGESUCHT_COOKIES_FILE, 'name': 'WG-Gesucht'}
 
     return sessions
 
@@ -49,7 +99,7 @@ def clear_session(service_key):
         return False
 
     try:
-        sessions[service_key]['path'].unlink()
+        Path(sessions[service_key]['path']).unlink()
         print(f"  ✓ Cleared {sessions[service_key]['name']} session")
         return True
     except Exception as e:
@@ -99,8 +149,7 @@ def setup_session(service_key):
             from flathunter.wg_gesucht_contact_bot import WgGesuchtContactBot
 
             # Check if session already exists
-            cookie_file = Path.home() / '.wg_gesucht_cookies.json'
-            if cookie_file.exists():
+            if os.path.isfile(WGGESUCHT_COOKIES_FILE):
                 print("\n✓ Existing WG-Gesucht session found!")
                 response = input("Session exists. Re-login anyway? (y/N): ").strip().lower()
                 if response != 'y':
@@ -108,7 +157,7 @@ def setup_session(service_key):
                     return True
 
                 # Delete old session to force re-login
-                cookie_file.unlink()
+                Path(WGGESUCHT_COOKIES_FILE).unlink()
                 print("Old session deleted. Proceeding with new login...\n")
 
             # Initialize in non-headless mode for manual login
@@ -132,39 +181,20 @@ def setup_session(service_key):
 
 def session_manager_menu():
     """Interactive session management menu"""
+    # Only re-check the cookie files after an option changed them
+    sessions = get_session_info()
     while True:
-        sessions = get_session_info()
-
-        print("\n" + "="*60)
-        print("SESSION MANAGER")
-        print("="*60)
-
         if sessions:
-            print("\nCurrent sessions:")
-            if 'willhaben' in sessions:
-                print("  ✓ Willhaben")
-            if 'wg-gesucht' in sessions:
-                print("  ✓ WG-Gesucht")
+            sessions_block = "\nCurrent sessions:\n" + format_sessions(sessions)
         else:
-            print("\n  No sessions found")
-
-        print("\n" + "="*60)
-        print("Options:")
-        print("  [1]  Setup Willhaben session")
-        print("  [2]  Setup WG-Gesucht session")
-        print("  [3]  Setup both sessions")
-        print("  [4]  Clear Willhaben session")
-        print("  [5]  Clear WG-Gesucht session")
-        print("  [6]  Clear all sessions")
-        print("  [c]  Continue with current sessions")
-        print("  [q]  Quit")
-        print("="*60)
+            sessions_block = "\n  No sessions found"
+        sys.stdout.write(SESSION_MANAGER_MENU.format(sessions_block=sessions_block))
+        sys.stdout.flush()
 
         choice = input("\nEnter your choice: ").strip().lower()
 
         if choice == 'q':
             print("\nExiting...")
-            import sys
             sys.exit(0)
         elif choice == 'c':
             print("\nContinuing with current sessions...\n")
@@ -185,12 +215,61 @@ def session_manager_menu():
             clear_session('wg-gesucht')
         else:
             print("\n✗ Invalid choice. Please try again.")
+            continue
+        sessions = get_session_info()
+
+
+def read_with_timeout(prompt, timeout):
+    """Like input(), but returns an empty answer when nothing was entered within timeout seconds"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    if os.name == 'nt':
+        import msvcrt
+        deadline = time.monotonic() + timeout
+        chars = []
+        while time.monotonic() < deadline:
+            if not msvcrt.kbhit():
+                time.sleep(0.05)
+                continue
+            char = msvcrt.getwche()
+            if char in '\r\n':
+                print()
+                return ''.join(chars)
+            chars.append(char)
+    else:
+        import select
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        if ready:
+            return sys.stdin.readline().rstrip('\n')
+    print()
+    return ''
+
+
+def session_prompt_timeout() -> float:
+    """Timeout of the saved sessions prompt, falling back to the default on bad values"""
+    value = os.environ.get('FLATHUNTER_SESSION_PROMPT_TIMEOUT')
+    if value is None:
+        return SESSION_PROMPT_TIMEOUT
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Invalid FLATHUNTER_SESSION_PROMPT_TIMEOUT %r, using %.0f seconds",
+                       value, SESSION_PROMPT_TIMEOUT)
+        return SESSION_PROMPT_TIMEOUT
 
 
 def check_saved_sessions():
     """Check for saved sessions and provide interactive options"""
     sessions = get_session_info()
 
+    # Nobody to ask when running unattended (cron, systemd, CI)
+    if not sys.stdin.isatty():
+        if sessions:
+            print("\nUsing saved sessions...\n")
+        else:
+            print("\nNo saved sessions - continuing without auto-contact...\n")
+        return
+
     # If no sessions found, offer to set them up
     if not sessions:
         print("\n" + "="*60)
@@ -206,24 +285,13 @@ def check_saved_sessions():
         return
 
     # Show saved sessions and prompt
-    print("\n" + "="*60)
-    print("SAVED SESSIONS FOUND")
-    print("="*60)
-    for key, info in sessions.items():
-        print(f"  ✓ {info['name']}")
-    print("="*60)
-    print("\nOptions:")
-    print("  [ENTER]  Use saved sessions and continue")
-    print("  [x]      Clear/manage sessions")
-    print("  [s]      Setup/refresh sessions")
-    print("  [q]      Quit")
-    print("="*60)
-
-    response = input("\nChoice: ").strip().lower()
+    sys.stdout.write(SAVED_SESSIONS_MENU.format(sessions_block=format_sessions(sessions)))
+    sys.stdout.flush()
+
+    response = read_with_timeout("\nChoice: ", session_prompt_timeout()).strip().lower()
 
     if response == 'q':
         print("\nExiting...")
-        import sys
         sys.exit(0)
     elif response == 'x' or response == 's':
         session_manager_menu()
@@ -233,12 +301,30 @@ def check_saved_sessions():
 
 def launch_flat_hunt(config, heartbeat: Heartbeat):
     """Starts the crawler / notification loop"""
+    # The hunter pulls in all processors and contact bots - only load it when hunting
+    from flathunter.idmaintainer import IdMaintainer
+    from flathunter.hunter import Hunter
+
     id_watch = IdMaintainer(f'{config.database_location()}/processed_ids.db')
 
     time_from = dtime.fromisoformat(config.loop_pause_from())
     time_till = dtime.fromisoformat(config.loop_pause_till())
 
-    wait_during_period(time_from, time_till)
+    # Set by SIGTERM / SIGINT, so that waits between hunts end right away
+    stop_event = threading.Event()
+
+    def request_stop(signum, _frame):
+        if signum == signal.SIGINT and stop_event.is_set():
+            raise KeyboardInterrupt
+        if signum == signal.SIGINT:
+            logger.info("Stopping after the current step - press Ctrl+C again to abort")
+        stop_event.set()
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, request_stop)
+
+    if wait_during_period(time_from, time_till, stop_event):
+        return
 
     hunter = Hunter(config, id_watch)
 
@@ -271,17 +357,25 @@ def launch_flat_hunt(config, heartbeat: Heartbeat):
     hunter.hunt_flats()
     counter = 0
 
-    while config.loop_is_active():
-        wait_during_period(time_from, time_till)
+    # The loop settings don't change while running, read them once
+    loop_period = config.loop_period_seconds()
+    jitter_enabled = config.random_jitter_enabled()
+
+    while config.loop_is_active() and not stop_event.is_set():
+        if wait_during_period(time_from, time_till, stop_event):
+            break
 
         counter += 1
         counter = heartbeat.send_heartbeat(counter)
-        if config.random_jitter_enabled():
-            sleep_period = get_random_time_jitter(config.loop_period_seconds())
+        if jitter_enabled:
+            sleep_period = get_random_time_jitter(loop_period)
         else:
-            sleep_period = config.loop_period_seconds()
-        time.sleep(sleep_period)
+            sleep_period = loop_period
+        if stop_event.wait(sleep_period):
+            break
         hunter.hunt_flats()
+    if stop_event.is_set():
+        logger.info("Shutdown requested, stopping the hunt")
 
 
 def main():
@@ -301,27 +395,19 @@ def main():
     config.init_searchers()
 
     # check config
-    notifiers = config.notifiers()
-    if 'mattermost' in notifiers \
-            and not config.mattermost_webhook_url():
-        logger.error("No Mattermost webhook configured. Starting like this would be pointless...")
-        return
-    if 'telegram' in notifiers:
-        if not config.telegram_bot_token():
-            logger.error(
-                "No Telegram bot token configured. Starting like this would be pointless..."
-            )
+    notifiers = set(config.notifiers())
+    required_settings = [
+        ('mattermost', config.mattermost_webhook_url, "No Mattermost webhook configured"),
+        ('telegram', config.telegram_bot_token, "No Telegram bot token configured"),
+        ('apprise', lambda: config.get('apprise', {}), "No apprise url configured"),
+        ('slack', config.slack_webhook_url, "No Slack webhook url configured"),
+    ]
+    for notifier, setting, message in required_settings:
+        if notifier in notifiers and not setting():
+            logger.error("%s. Starting like this would be pointless...", message)
             return
-        if len(config.telegram_receiver_ids()) == 0:
-            logger.warning("No Telegram receivers configured - nobody will get notifications.")
-    if 'apprise' in notifiers \
-            and not config.get('apprise', {}):
-        logger.error("No apprise url configured. Starting like this would be pointless...")
-        return
-    if 'slack' in notifiers \
-            and not config.slack_webhook_url():
-        logger.error("No Slack webhook url configured. Starting like this would be pointless...")
-        return
+    if 'telegram' in notifiers and len(config.telegram_receiver_ids()) == 0:
+        logger.warning("No Telegram receivers configured - nobody will get notifications.")
 
     if len(config.target_urls()) == 0:
         logger.error("No URLs configured. Starting like this would be pointless...")
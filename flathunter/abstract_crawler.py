@@ -1,18 +1,23 @@
 """Interface for webcrawlers. Crawler implementations should subclass this"""
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import cached_property
 import re
 import time
 import random
 from time import sleep
-from typing import Optional, Any
+from typing import Optional, Any, List
 import json
 
 import backoff
 import requests
+from requests.adapters import HTTPAdapter
 # pylint: disable=unused-import
 import requests_random_user_agent
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver import Chrome
@@ -25,6 +30,35 @@ from flathunter.captcha.captcha_solver import CaptchaUnsolvableError
 from flathunter.logger_config import logger
 from flathunter.exceptions import ProxyException
 
+# Patterns used to pull the captcha parameters out of the page source
+GEETEST_DATA_PATTERN = re.compile("geetest_validate: obj.geetest_validate,\n.*?data: \"(.*)\"")
+GEETEST_INIT_PATTERN = re.compile(r"initGeetest\({(.*?)}", re.DOTALL)
+GEETEST_GT_PATTERN = re.compile("gt: \"(.*?)\"")
+GEETEST_CHALLENGE_PATTERN = re.compile("challenge: \"(.*?)\"")
+AWSWAF_API_KEY_PATTERN = re.compile(r"apiKey: \"(.*?)\"")
+AWSWAF_CHALLENGE_JS_PATTERN = re.compile(r'src="([^"]*challenge\.js)"')
+AWSWAF_JSAPI_JS_PATTERN = re.compile(r'src="([^"]*jsapi\.js)"')
+# Markers of the captchas we can solve - found in a single pass over the page source
+CAPTCHA_MARKER_PATTERN = re.compile("initGeetest|awswaf-captcha|g-recaptcha")
+
+# Upper bound for waits requested by a server's Retry-After header
+MAX_RETRY_AFTER = 120
+
+
+def retry_after_seconds(resp: requests.Response) -> Optional[float]:
+    """Seconds to wait according to the Retry-After header, None if absent or invalid"""
+    value = resp.headers.get('Retry-After')
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
 class Crawler(ABC):
     """Defines the Crawler interface"""
@@ -46,26 +80,60 @@ class Crawler(ABC):
         'Accept-Language': 'en-US,en;q=0.9',
     }
 
-    def __init__(self, config):
+    # Parser used for all fetched pages - lxml is the fastest backend bs4 supports
+    HTML_PARSER = 'lxml'
+
+    # Optional filter for the search result pages: only the matching elements are
+    # parsed, so extract_data must not look outside of them. Detail pages are
+    # always parsed completely.
+    RESULTS_STRAINER: Optional[SoupStrainer] = None
+
+    # Whether one instance may crawl several URLs at once (see crawl_many)
+    CONCURRENT_CRAWLS = True
+
+    # Number of proxies tried at the same time by get_soup_with_proxy
+    PROXY_RACE_SIZE = 8
+
+    def __init__(self, config, session: Optional[requests.Session] = None):
         self.config = config
+        # Reuse keep-alive connections instead of a new TCP/TLS handshake per request.
+        # Each crawler gets its own session so cookies never leak between portals.
+        self.session = session if session is not None else self.create_session()
         if config.captcha_enabled():
             self.captcha_solver = config.get_captcha_solver()
 
+    @staticmethod
+    def create_session() -> requests.Session:
+        """Returns a new requests session with a keep-alive connection pool"""
+        session = requests.Session()
+        # Retries are handled by the crawlers themselves (with backoff)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def parse_html(self, markup, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parses fetched HTML (str or bytes), optionally only the parts matching parse_only"""
+        return BeautifulSoup(markup, self.HTML_PARSER, parse_only=parse_only)
+
     # pylint: disable=unused-argument
-    def get_page(self, search_url, driver=None, page_no=None) -> BeautifulSoup:
+    def get_page(self, search_url, driver=None, page_no=None,
+                 parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
         """Applies a page number to a formatted search URL and fetches the exposes at that page"""
-        return self.get_soup_from_url(search_url)
+        return self.get_soup_from_url(search_url, parse_only=parse_only)
 
-    @backoff.on_exception(wait_gen=backoff.constant,
+    @backoff.on_exception(wait_gen=backoff.expo,
                           exception=TimeoutException,
-                          max_tries=3)
+                          max_tries=3,
+                          jitter=backoff.full_jitter)
     def get_soup_from_url(
             self,
             url: str,
             driver: Optional[Any] = None,
             checkbox: bool = False,
             afterlogin_string: Optional[str] = None,
-            retry_count: int = 0) -> BeautifulSoup:
+            retry_count: int = 0,
+            parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
         """
         Creates a Soup object from the HTML at the provided URL
 
@@ -77,29 +145,38 @@ class Crawler(ABC):
             checkbox: Captcha checkbox flag
             afterlogin_string: String to wait for after login
             retry_count: Current retry attempt (for internal use)
+            parse_only: Only parse the elements matching this strainer
         """
         max_retries = 3
         base_delay = 5  # seconds
 
         if self.config.use_proxy():
-            return self.get_soup_with_proxy(url)
+            return self.get_soup_with_proxy(url, parse_only)
         if driver is not None:
             driver.get(url)
-            if re.search("initGeetest", driver.page_source):
+            # Every page_source access is a round-trip to the browser - fetch it once
+            page_source = driver.page_source
+            captchas = set(CAPTCHA_MARKER_PATTERN.findall(page_source))
+            if "initGeetest" in captchas:
                 self.resolve_geetest(driver)
-            elif re.search("awswaf-captcha", driver.page_source):
+            elif "awswaf-captcha" in captchas:
                 self.resolve_awsawf(driver)
-            elif re.search("g-recaptcha", driver.page_source):
+            elif "g-recaptcha" in captchas:
                 self.resolve_recaptcha(
                     driver, checkbox, afterlogin_string or "")
-            return BeautifulSoup(driver.page_source, 'lxml')
+            if captchas:
+                # Solving the captcha changed the page
+                page_source = driver.page_source
+            return self.parse_html(page_source, parse_only)
 
+        retry_after = None
         try:
-            resp = requests.get(url, headers=self.HEADERS, timeout=30)
+            resp = self.session.get(url, headers=self.HEADERS, timeout=30)
 
             # Check for rate limiting (HTTP 429) or server errors (5xx)
             if resp.status_code == 429:
                 logger.warning("Rate limit hit (HTTP 429) for %s", url)
+                retry_after = retry_after_seconds(resp)
                 raise requests.exceptions.RequestException("Rate limited")
             elif resp.status_code >= 500:
                 logger.warning("Server error (HTTP %d) for %s", resp.status_code, url)
@@ -111,7 +188,7 @@ class Crawler(ABC):
                 logger.error("Got response (%i): %s\n%s",
                              resp.status_code, resp.content, user_agent)
 
-            return BeautifulSoup(resp.content, 'lxml')
+            return self.parse_html(resp.content, parse_only)
 
         except (requests.exceptions.Timeout, requests.exceptions.RequestException) as exc:
             if retry_count >= max_retries:
@@ -119,58 +196,85 @@ class Crawler(ABC):
                     f"Page load failed after {max_retries} retries - likely rate limited or down: {url}"
                 )
                 # Return empty soup after exhausting retries
-                return BeautifulSoup("", 'lxml')
+                return self.parse_html("")
 
             # Exponential backoff with jitter to avoid thundering herd
             delay = base_delay * (2 ** retry_count) + random.uniform(0, 3)
+            if retry_after is not None:
+                # Wait at least as long as the server asked us to
+                delay = max(delay, min(retry_after, MAX_RETRY_AFTER))
             logger.warning(
                 f"Request failed ({type(exc).__name__}), "
                 f"retrying in {delay:.1f}s (attempt {retry_count + 1}/{max_retries}) for {url}"
             )
             time.sleep(delay)
 
-            return self.get_soup_from_url(url, driver, checkbox, afterlogin_string, retry_count + 1)
+            return self.get_soup_from_url(url, driver, checkbox, afterlogin_string, retry_count + 1,
+                                          parse_only)
 
-    def get_soup_with_proxy(self, url) -> BeautifulSoup:
-        """Will try proxies until it's possible to crawl and return a soup"""
-        resolved = False
+    def get_soup_with_proxy(self, url, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Will try proxies until it's possible to crawl and return a soup
+
+        Proxies are raced in batches of PROXY_RACE_SIZE: the first one that
+        answers with a 200 wins and the pending attempts of its batch are dropped.
+        """
         resp = None
 
         # We will keep trying to fetch new proxies until one works
-        while not resolved:
-            proxies_list = proxies.get_proxies()
-            for proxy in proxies_list:
-                try:
-                    # Very low proxy read timeout, or it will get stuck on slow proxies
-                    resp = requests.get(
-                        url,
-                        headers=self.HEADERS,
-                        proxies={"http": proxy, "https": proxy},
-                        timeout=(20, 0.1)
-                    )
-
-                    if resp.status_code != 200:
-                        logger.error("Got response (%i): %s",
-                                     resp.status_code, resp.content)
-                    else:
-                        resolved = True
-                        break
-
-                except requests.exceptions.ConnectionError:
-                    logger.error(
-                        "Connection failed for proxy %s. Trying new proxy...", proxy)
-                except requests.exceptions.Timeout:
-                    logger.error(
-                        "Connection timed out for proxy %s. Trying new proxy...", proxy
-                    )
-                except requests.exceptions.RequestException:
-                    logger.error("Some error occurred. Trying new proxy...")
+        while resp is None:
+            proxies_list = list(proxies.get_proxies())
+            for i in range(0, len(proxies_list), self.PROXY_RACE_SIZE):
+                resp = self._race_proxies(url, proxies_list[i:i + self.PROXY_RACE_SIZE])
+                if resp is not None:
+                    break
 
         if not resp:
             raise ProxyException(
                 "An error occurred while fetching proxies or content")
 
-        return BeautifulSoup(resp.content, 'lxml')
+        return self.parse_html(resp.content, parse_only)
+
+    def _race_proxies(self, url, proxies_batch) -> Optional[requests.Response]:
+        """Request the URL through all given proxies at once, return the first successful response"""
+        executor = ThreadPoolExecutor(max_workers=len(proxies_batch))
+        futures = [executor.submit(self._get_with_proxy, url, proxy) for proxy in proxies_batch]
+        try:
+            for future in as_completed(futures):
+                resp = future.result()
+                if resp is not None:
+                    return resp
+            return None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_with_proxy(self, url, proxy) -> Optional[requests.Response]:
+        """Request the URL through one proxy, return the response if it was successful"""
+        try:
+            # Very low proxy read timeout, or it will get stuck on slow proxies
+            resp = self.session.get(
+                url,
+                headers=self.HEADERS,
+                proxies={"http": proxy, "https": proxy},
+                timeout=(20, 0.1)
+            )
+        except requests.exceptions.ConnectionError:
+            logger.error(
+                "Connection failed for proxy %s. Trying new proxy...", proxy)
+            return None
+        except requests.exceptions.Timeout:
+            logger.error(
+                "Connection timed out for proxy %s. Trying new proxy...", proxy
+            )
+            return None
+        except requests.exceptions.RequestException:
+            logger.error("Some error occurred. Trying new proxy...")
+            return None
+
+        if resp.status_code != 200:
+            logger.error("Got response (%i): %s",
+                         resp.status_code, resp.content)
+            return None
+        return resp
 
     def extract_data(self, raw_data):
         """Should be implemented in subclass"""
@@ -182,7 +286,7 @@ class Crawler(ABC):
         logger.debug("Got search URL %s", search_url)
 
         # load first page
-        soup = self.get_page(search_url)
+        soup = self.get_page(search_url, parse_only=self.RESULTS_STRAINER)
 
         # get data from first page
         entries = self.extract_data(soup)
@@ -192,7 +296,7 @@ class Crawler(ABC):
 
     def crawl(self, url, max_pages=None):
         """Load as many exposes as possible from the provided URL"""
-        if re.search(self.URL_PATTERN, url):
+        if self.URL_PATTERN.search(url):
             try:
                 return self.get_results(url, max_pages)
             except requests.exceptions.ConnectionError:
@@ -201,28 +305,50 @@ class Crawler(ABC):
                 return []
         return []
 
+    def crawl_many(self, urls, max_pages=None, max_workers=4) -> List[List[Any]]:
+        """Crawl several search URLs, overlapping the network waits where possible
+
+        Returns one list of exposes per URL, in the order of the given URLs. A URL
+        that fails with an unexpected error yields an empty list.
+        """
+        def crawl_url(url):
+            try:
+                return self.crawl(url, max_pages)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Crawling %s failed: %s", url, exc)
+                return []
+
+        urls = list(urls)
+        if not self.CONCURRENT_CRAWLS or len(urls) < 2:
+            return [crawl_url(url) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(crawl_url, urls))
+
+    @cached_property
+    def name(self) -> str:
+        """The name of this crawler (its class name), computed once per instance"""
+        return type(self).__name__
+
     def get_name(self):
         """Returns the name of this crawler"""
-        return type(self).__name__
+        return self.name
 
     def get_expose_details(self, expose):
         """Loads additional detalis for an expose. Should be implemented in the subclass"""
         return expose
 
-    @backoff.on_exception(wait_gen=backoff.constant,
+    @backoff.on_exception(wait_gen=backoff.expo,
                           exception=CaptchaUnsolvableError,
-                          max_tries=3)
+                          max_tries=3,
+                          jitter=backoff.full_jitter)
     def resolve_geetest(self, driver):
         """Resolve GeeTest Captcha"""
-        data = re.findall(
-            "geetest_validate: obj.geetest_validate,\n.*?data: \"(.*)\"",
-            driver.page_source
-        )[0]
-        result = re.findall(
-            r"initGeetest\({(.*?)}", driver.page_source, re.DOTALL)
-
-        geetest = re.findall("gt: \"(.*?)\"", result[0])[0]
-        challenge = re.findall("challenge: \"(.*?)\"", result[0])[0]
+        page_source = driver.page_source
+        data = GEETEST_DATA_PATTERN.findall(page_source)[0]
+        result = GEETEST_INIT_PATTERN.findall(page_source)
+
+        geetest = GEETEST_GT_PATTERN.findall(result[0])[0]
+        challenge = GEETEST_CHALLENGE_PATTERN.findall(result[0])[0]
         try:
             captcha_response = self.captcha_solver.solve_geetest(
                 geetest,
@@ -240,15 +366,20 @@ class Crawler(ABC):
             raise
 
     # pylint: disable=too-many-locals
-    @backoff.on_exception(wait_gen=backoff.constant,
-                        exception=CaptchaUnsolvableError,
-                        max_tries=3)
+    @backoff.on_exception(wait_gen=backoff.expo,
+                          exception=CaptchaUnsolvableError,
+                          max_tries=3,
+                          jitter=backoff.full_jitter)
     def resolve_awsawf(self, driver):
         """Resolve AWS WAF Captcha"""
 
         # Intercept background network traffic via log sniffing
         sleep(2)
-        logs = [json.loads(lr["message"])["message"] for lr in driver.get_log("performance")]
+        # Only decode the entries that can be the captcha problem response -
+        # the vast majority of the performance log is unrelated traffic
+        logs = [json.loads(lr["message"])["message"] for lr in driver.get_log("performance")
+                if "awswaf" in lr["message"] and "problem" in lr["message"]
+                and "Network.responseReceived" in lr["message"]]
 
         def log_filter(log_):
             return (
@@ -274,17 +405,17 @@ class Crawler(ABC):
         if context is None or iv is None:
             raise CaptchaUnsolvableError("Unable to find captcha data in logs")
 
-        sitekey = re.findall(
-            r"apiKey: \"(.*?)\"", driver.page_source)[0]
+        page_source = driver.page_source
+        sitekey = AWSWAF_API_KEY_PATTERN.findall(page_source)[0]
 
         challenge = None
-        challenge_matches = re.findall(r'src="([^"]*challenge\.js)"', driver.page_source)
+        challenge_matches = AWSWAF_CHALLENGE_JS_PATTERN.findall(page_source)
         for match in challenge_matches:
             logger.debug('Challenge SRC Value: %s', match)
             challenge = match
 
         jsapi = None
-        jsapi_matches = re.findall(r'src="([^"]*jsapi\.js)"', driver.page_source)
+        jsapi_matches = AWSWAF_JSAPI_JS_PATTERN.findall(page_source)
         for match in jsapi_matches:
             logger.debug('JsApi SRC Value: %s', match)
             jsapi = match
@@ -312,9 +443,10 @@ class Crawler(ABC):
             driver.refresh()
             raise
 
-    @backoff.on_exception(wait_gen=backoff.constant,
+    @backoff.on_exception(wait_gen=backoff.expo,
                           exception=CaptchaUnsolvableError,
-                          max_tries=3)
+                          max_tries=3,
+                          jitter=backoff.full_jitter)
     def resolve_recaptcha(self, driver, checkbox: bool, afterlogin_string: str = ""):
         """Resolve Captcha"""
         iframe_present = self._wait_for_iframe(driver)
@@ -1,14 +1,30 @@
 """Abstract class defining the 'Processor' interface"""
-from typing import Dict
+from itertools import islice
+from typing import Dict, Iterator, List
 
 class Processor:
     """Processor interface. Flathunter runs sequences of exposes through
        a set of processors that stack on each other"""
 
+    # Number of exposes handed to process_batch at once. Processors that can
+    # coalesce work (one request or transaction for several exposes) raise this
+    BATCH_SIZE = 1
+
     def process_expose(self, expose: Dict) -> Dict:
         """Mutate the expose. Should be implemented in the subclass"""
         return expose
 
+    def process_batch(self, batch: List[Dict]) -> List[Dict]:
+        """Mutate a batch of exposes. Override to handle several exposes at once"""
+        return [self.process_expose(expose) for expose in batch]
+
+    def process_exposes_batched(self, exposes, batch_size=32) -> Iterator[List[Dict]]:
+        """Apply the processor to the sequence, yielding lists of processed exposes"""
+        iterator = iter(exposes)
+        while batch := list(islice(iterator, batch_size)):
+            yield self.process_batch(batch)
+
     def process_exposes(self, exposes):
         """Apply the processor to every expose in the sequence"""
-        return map(self.process_expose, exposes)
+        for batch in self.process_exposes_batched(exposes, self.BATCH_SIZE):
+            yield from batch
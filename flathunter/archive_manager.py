@@ -1,17 +1,175 @@
 """Archive manager for contacted listings - extracts and stores listing data"""
+import os
 import re
 import json
+import hashlib
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import TreeBuilder, builder_registry
+from bs4.filter import ElementFilter
 
 from flathunter.logger_config import logger
 
+# orjson is optional - it serializes considerably faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Tree builders by parser name, one set per thread (see ArchiveManager._tree_builder)
+_builders = threading.local()
+
+
+def dump_json(data) -> bytes:
+    """Serialize data as indented UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+class AnyStrainer(ElementFilter):
+    """Parse filter keeping every tag (with its contents) that matches one of several strainers"""
+
+    def __init__(self, *strainers: SoupStrainer):
+        super().__init__()
+        self.strainers = strainers
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return any(strainer.allow_tag_creation(nsprefix, name, attrs)
+                   for strainer in self.strainers)
+
+    def allow_string_creation(self, string) -> bool:
+        # Text outside of the kept tags is never needed
+        return False
+
+    def match(self, element, _known_rules=False) -> bool:
+        return any(strainer.match(element) for strainer in self.strainers)
+
+
+def narrow_source(page_source: Union[str, bytes], marker_pattern: re.Pattern,
+                  end_markers=()) -> Union[str, bytes]:
+    """Cut a page down to the region holding the tags the extractors read
+
+    The page is cut right before the start tag of the first marker_pattern match.
+    If the last end_markers occurrence sits in a <script> or <img> tag, the page
+    is also cut right after that element. Falls back to the full source if no
+    marker is found.
+    """
+    if isinstance(page_source, bytes):
+        # Same markers, matched against the raw UTF-8 source
+        def literal(text):
+            return text.encode('utf-8')
+        marker_pattern = _bytes_pattern(marker_pattern)
+    else:
+        def literal(text):
+            return text
+    match = marker_pattern.search(page_source)
+    if match is None:
+        return page_source
+    start = max(page_source.rfind(literal('<'), 0, match.start()), 0)
+
+    end = len(page_source)
+    last_marker = max((page_source.rfind(literal(marker)) for marker in end_markers), default=-1)
+    if last_marker > start:
+        tag_start = page_source.rfind(literal('<'), start, last_marker)
+        if page_source.startswith(literal('<script'), tag_start):
+            closing = page_source.find(literal('</script>'), last_marker)
+            if closing != -1:
+                end = closing + len('</script>')
+        elif page_source.startswith(literal('<img'), tag_start):
+            closing = page_source.find(literal('>'), last_marker)
+            if closing != -1:
+                end = closing + 1
+    return page_source[start:end]
+
+
+@lru_cache(maxsize=None)
+def _bytes_pattern(pattern: re.Pattern) -> re.Pattern:
+    """The bytes equivalent of a str pattern"""
+    return re.compile(pattern.pattern.encode('utf-8'), pattern.flags & ~re.UNICODE)
+
+
+def has_class(css_class: str):
+    """Attribute matcher for one CSS class, for raw (str) and parsed (list) class values"""
+    def matches(value) -> bool:
+        if not value:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+        return css_class in classes
+    return matches
+
+
+# WG-Gesucht description containers
+FREETEXT_CLASS_PATTERN = re.compile(r'section_freetext', re.I)
+FREETEXT_ID_PATTERN = re.compile(r'freitext', re.I)
+
+# Site names that can appear in a crawler name, e.g. "WgGesucht" or "Willhaben"
+CRAWLER_SITE_PATTERN = re.compile(r'willhaben|wg-?gesucht')
+
+# Expose fields copied into the archive metadata of each site
+WILLHABEN_METADATA_FIELDS = ('title', 'price', 'size', 'rooms', 'address', 'crawler')
+WGGESUCHT_METADATA_FIELDS = ('title', 'price', 'size', 'rooms', 'crawler')
+
+# Every tag the extractors need carries one of these in its start tag, so
+# nothing before the first match is needed
+WILLHABEN_MARKER_PATTERN = re.compile(
+    r'cache\.willhaben\.at/mmo|ad-description-Objektbeschreibung|__NEXT_DATA__|application/ld\+json')
+WGGESUCHT_MARKER_PATTERN = re.compile(r'sp-image|freetext|freitext|ad_description_text', re.I)
+
+# Embedded page data of a Willhaben listing (holds the full image list)
+WILLHABEN_DATA_STRAINERS = (
+    SoupStrainer('script', id='__NEXT_DATA__'),
+    SoupStrainer('script', type='application/ld+json'),
+)
+
+# Only the parts of a listing page the extractors look at - the rest of the
+# document (head, navigation, footer, ads) is never turned into a tree
+WILLHABEN_STRAINER = AnyStrainer(
+    SoupStrainer('img'),
+    SoupStrainer('div', attrs={'data-testid': 'ad-description-Objektbeschreibung'}),
+    *WILLHABEN_DATA_STRAINERS,
+)
+WILLHABEN_DATA_STRAINER = AnyStrainer(*WILLHABEN_DATA_STRAINERS)
+WGGESUCHT_STRAINER = AnyStrainer(
+    SoupStrainer('img', class_=has_class('sp-image')),
+    SoupStrainer('div', class_=FREETEXT_CLASS_PATTERN),
+    SoupStrainer('div', id=FREETEXT_ID_PATTERN),
+    SoupStrainer('div', id='ad_description_text'),
+)
+
+
+@dataclass
+class SaveResult:
+    """Outcome of saving an archive to local disk"""
+    path: Path
+    bytes_written: int
+    sha256: str
+
 
 class ArchiveManager:
     """Manages extraction and storage of contacted listing archives"""
 
+    # Willhaben apartment images are served from this cache domain
+    WILLHABEN_IMAGE_MARKER = 'cache.willhaben.at/mmo'
+
+    # Archives keep at most this many image URLs per listing
+    MAX_ARCHIVE_IMAGES = 30
+
+    # Listing pages are large - parse them with the C based lxml parser
+    HTML_PARSER = 'lxml'
+
+    # Pages above this size (in characters) are cut down to the relevant region before parsing
+    NARROW_SOURCE_THRESHOLD = 1024 * 1024
+
+    # Markers whose last occurrence can end the relevant region of a Willhaben page
+    WILLHABEN_END_MARKERS = ('__NEXT_DATA__', 'application/ld+json', 'cache.willhaben.at/mmo',
+                             'ad-description-Objektbeschreibung')
+
     def __init__(self, config=None):
         """
         Initialize archive manager
@@ -29,18 +187,27 @@ class ArchiveManager:
 
         self.archive_path = Path(archive_path).expanduser()
 
+        # Site -> extractor, and the extractor resolved for every crawler name seen so far
+        self._extractors = {
+            'willhaben': self._extract_willhaben,
+            'wggesucht': self._extract_wggesucht,
+        }
+        self._extractor_cache: Dict[str, Optional[Callable]] = {}
+
         # Retention days
         if config:
             self.retention_days = config.get('telegram_archive_retention_days', 30)
         else:
             self.retention_days = 30
 
-    def extract_archive_data(self, page_source: str, listing_url: str, expose: Dict) -> Optional[Dict]:
+    def extract_archive_data(self, page_source: Union[str, bytes], listing_url: str, expose: Dict) -> Optional[Dict]:
         """
         Extract images and description from listing page HTML
 
         Args:
-            page_source: HTML source of the listing page
+            page_source: HTML source of the listing page. Pass the raw UTF-8 bytes
+                (e.g. response.content) when available - BeautifulSoup then skips
+                encoding detection
             listing_url: URL of the listing
             expose: Expose dict with listing metadata
 
@@ -49,27 +216,123 @@ class ArchiveManager:
             Returns None if extraction fails completely
         """
         try:
-            crawler = expose.get('crawler', '').lower()
-
-            if 'willhaben' in crawler:
-                return self._extract_willhaben(page_source, listing_url, expose)
-            elif 'wg-gesucht' in crawler or 'wggesucht' in crawler:
-                return self._extract_wggesucht(page_source, listing_url, expose)
-            else:
-                logger.warning(f"Unknown crawler type for archiving: {crawler}")
+            crawler = expose.get('crawler', '')
+            extractor = self._extractor_for(crawler)
+            if extractor is None:
+                logger.warning("Unknown crawler type for archiving: %s", crawler.lower())
                 return None
+            return extractor(page_source, listing_url, expose)
 
         except Exception as e:
-            logger.error(f"Failed to extract archive data: {e}", exc_info=True)
+            logger.error("Failed to extract archive data: %s", e, exc_info=True)
             return None
 
-    def _extract_willhaben(self, page_source: str, listing_url: str, expose: Dict) -> Optional[Dict]:
+    def _extractor_for(self, crawler: str) -> Optional[Callable]:
+        """Return the extractor for a crawler name, or None for unsupported sites"""
+        try:
+            return self._extractor_cache[crawler]
+        except KeyError:
+            pass
+        match = CRAWLER_SITE_PATTERN.search(crawler.lower())
+        extractor = self._extractors.get(match.group().replace('-', '')) if match else None
+        self._extractor_cache[crawler] = extractor
+        return extractor
+
+    @classmethod
+    def extract_willhaben_embedded_images(cls, page_source: Union[str, bytes]) -> List[str]:
+        """
+        Extract the gallery image URLs from the JSON data embedded in a Willhaben page
+
+        The full media list is part of the server-side rendered state (__NEXT_DATA__)
+        and the JSON-LD blocks, so no gallery interaction is needed to discover it.
+
+        Args:
+            page_source: HTML source of the listing page
+
+        Returns:
+            List of full-size image URLs (empty if no embedded data was found)
+        """
+        return cls._embedded_willhaben_images(cls._parse_html(
+            cls._narrow_source(page_source, WILLHABEN_MARKER_PATTERN, cls.WILLHABEN_END_MARKERS),
+            WILLHABEN_DATA_STRAINER))
+
+    @classmethod
+    def _narrow_source(cls, page_source: Union[str, bytes], marker_pattern: re.Pattern, end_markers=()):
+        """Cut pages above NARROW_SOURCE_THRESHOLD down to the region the extractor reads"""
+        if len(page_source) <= cls.NARROW_SOURCE_THRESHOLD:
+            return page_source
+        return narrow_source(page_source, marker_pattern, end_markers)
+
+    @classmethod
+    def _parse_html(cls, page_source, parse_only: Optional[ElementFilter] = None) -> BeautifulSoup:
+        """Parse a listing page given as str or bytes (bytes are decoded as UTF-8),
+        optionally only the tags matching parse_only"""
+        builder = cls._tree_builder()
+        if isinstance(page_source, bytes):
+            return BeautifulSoup(page_source, builder=builder, parse_only=parse_only,
+                                 from_encoding='utf-8')
+        return BeautifulSoup(page_source, builder=builder, parse_only=parse_only)
+
+    @classmethod
+    def _tree_builder(cls) -> TreeBuilder:
+        """The HTML_PARSER tree builder of the current thread
+
+        Builders keep per-parse state, so each thread gets its own instance instead
+        of BeautifulSoup looking up and creating a new one for every page.
+        """
+        builder = getattr(_builders, cls.HTML_PARSER, None)
+        if builder is None:
+            builder = builder_registry.lookup(cls.HTML_PARSER)()
+            setattr(_builders, cls.HTML_PARSER, builder)
+        return builder
+
+    @classmethod
+    def _embedded_willhaben_images(cls, soup: BeautifulSoup) -> List[str]:
+        """Collect image URLs from the __NEXT_DATA__ and JSON-LD scripts of a parsed page"""
+        images: List[str] = []
+
+        def collect(node):
+            if isinstance(node, dict):
+                # Image entries list several sizes - the main image is enough
+                main_image = node.get('mainImageUrl')
+                if isinstance(main_image, str) and cls.WILLHABEN_IMAGE_MARKER in main_image:
+                    images.append(main_image)
+                    return
+                for value in node.values():
+                    collect(value)
+            elif isinstance(node, list):
+                for value in node:
+                    collect(value)
+            elif isinstance(node, str) and cls.WILLHABEN_IMAGE_MARKER in node:
+                images.append(node)
+
+        # One walk over the scripts, keeping the __NEXT_DATA__ blocks before the JSON-LD ones
+        next_data, json_ld = [], []
+        for script in soup.find_all('script'):
+            if script.get('id') == '__NEXT_DATA__':
+                next_data.append(script)
+            elif script.get('type') == 'application/ld+json':
+                json_ld.append(script)
+        for script in next_data + json_ld:
+            try:
+                collect(json.loads(script.string or ''))
+            except ValueError:
+                logger.debug("Skipping unparsable embedded JSON in Willhaben page")
+
+        images = [src.replace('_thumb.jpg', '.jpg').replace('_thumb.jpeg', '.jpeg')
+                  for src in images]
+        return list(dict.fromkeys(images))
+
+    def _extract_willhaben(self, page_source: Union[str, bytes], listing_url: str, expose: Dict) -> Optional[Dict]:
         """Extract archive data from Willhaben listing"""
         try:
-            soup = BeautifulSoup(page_source, 'html.parser')
+            page_source = self._narrow_source(page_source, WILLHABEN_MARKER_PATTERN,
+                                              self.WILLHABEN_END_MARKERS)
+            soup = self._parse_html(page_source, WILLHABEN_STRAINER)
 
             # Extract images - use URL pattern matching (works even with lazy-loaded images)
-            images = []
+            # Collected as dict keys to drop duplicates while preserving order
+            images: Dict[str, None] = {}
 
             # Get ALL img tags with cache.willhaben.at URLs (includes lazy-loaded)
             all_imgs = soup.find_all('img')
@@ -78,38 +341,31 @@ class ArchiveManager:
                 src = img.get('src', '') or img.get('data-src', '')
 
                 # Only willhaben apartment images from cache domain
-                if src and 'cache.willhaben.at/mmo' in src:
+                if src and self.WILLHABEN_IMAGE_MARKER in src:
                     # Convert thumbnail URLs to full-size by removing _thumb suffix
                     # e.g., 276_-2046106179_thumb.jpg → 276_-2046106179.jpg
                     src = src.replace('_thumb.jpg', '.jpg').replace('_thumb.jpeg', '.jpeg')
-                    images.append(src)
+                    images[src] = None
+                    if len(images) >= self.MAX_ARCHIVE_IMAGES:
+                        break
 
-            # Remove duplicates while preserving order
-            seen = set()
-            images = [x for x in images if not (x in seen or seen.add(x))]
+            # Add images only listed in the embedded page data (gallery not clicked through)
+            if len(images) < self.MAX_ARCHIVE_IMAGES:
+                images.update(dict.fromkeys(self._embedded_willhaben_images(soup)))
+            images = list(images)[:self.MAX_ARCHIVE_IMAGES]
 
-            logger.info(f"Extracted {len(images)} images from Willhaben listing")
+            logger.info("Extracted %d images from Willhaben listing", len(images))
 
             # Extract description
             description = ""
             desc_div = soup.find('div', {'data-testid': 'ad-description-Objektbeschreibung'})
             if desc_div:
                 description = desc_div.get_text(separator='\n', strip=True)
-                logger.info(f"Extracted description ({len(description)} chars)")
+                logger.info("Extracted description (%d chars)", len(description))
             else:
                 logger.warning("Could not find description div in Willhaben page")
 
-            # Build metadata
-            metadata = {
-                'url': listing_url,
-                'title': expose.get('title', 'N/A'),
-                'price': expose.get('price', 'N/A'),
-                'size': expose.get('size', 'N/A'),
-                'rooms': expose.get('rooms', 'N/A'),
-                'address': expose.get('address', 'N/A'),
-                'crawler': expose.get('crawler', 'N/A'),
-                'timestamp': datetime.now().isoformat(),
-            }
+            metadata = self._build_metadata(listing_url, expose, WILLHABEN_METADATA_FIELDS)
 
             return {
                 'images': images,
@@ -118,16 +374,18 @@ class ArchiveManager:
             }
 
         except Exception as e:
-            logger.error(f"Failed to extract Willhaben archive data: {e}", exc_info=True)
+            logger.error("Failed to extract Willhaben archive data: %s", e, exc_info=True)
             return None
 
-    def _extract_wggesucht(self, page_source: str, listing_url: str, expose: Dict) -> Optional[Dict]:
+    def _extract_wggesucht(self, page_source: Union[str, bytes], listing_url: str, expose: Dict) -> Optional[Dict]:
         """Extract archive data from WG-Gesucht listing"""
         try:
-            soup = BeautifulSoup(page_source, 'html.parser')
+            page_source = self._narrow_source(page_source, WGGESUCHT_MARKER_PATTERN)
+            soup = self._parse_html(page_source, WGGESUCHT_STRAINER)
 
             # Extract images - WG-Gesucht specific (only apartment photos)
-            images = []
+            # Collected as dict keys to drop duplicates while preserving order
+            images: Dict[str, None] = {}
 
             # Only extract sp-image class (apartment gallery photos - this class only appears on photos)
             gallery_imgs = soup.find_all('img', class_='sp-image')
@@ -135,20 +393,19 @@ class ArchiveManager:
                 # Try data-default first (always has large image), fallback to data-large
                 src = img.get('data-default') or img.get('data-large', '')
 
-                if src and src.startswith('http'):
-                    images.append(src)
-
-            # Remove duplicates while preserving order
-            seen = set()
-            images = [x for x in images if not (x in seen or seen.add(x))]
+                if src.startswith(('http://', 'https://')):
+                    images[src] = None
+                    if len(images) >= self.MAX_ARCHIVE_IMAGES:
+                        break
+            images = list(images)
 
-            logger.info(f"Extracted {len(images)} apartment photos from WG-Gesucht listing")
+            logger.info("Extracted %d apartment photos from WG-Gesucht listing", len(images))
 
             # Extract description - WG-Gesucht uses freitext divs with <p> tags
             description = ""
 
             # Strategy 1: Find freitext divs and extract all <p> tags
-            freitext_divs = soup.find_all('div', class_=re.compile(r'section_freetext', re.I))
+            freitext_divs = soup.find_all('div', class_=FREETEXT_CLASS_PATTERN)
             if freitext_divs:
                 desc_parts = []
                 for div in freitext_divs:
@@ -161,35 +418,27 @@ class ArchiveManager:
 
                 if desc_parts:
                     description = '\n\n'.join(desc_parts)
-                    logger.info(f"Extracted description ({len(description)} chars) from {len(desc_parts)} paragraphs")
+                    logger.info("Extracted description (%d chars) from %d paragraphs",
+                                len(description), len(desc_parts))
 
             # Strategy 2: Fallback to freitext div text
             if not description:
-                freitext_div = soup.find('div', id=re.compile(r'freitext', re.I))
+                freitext_div = soup.find('div', id=FREETEXT_ID_PATTERN)
                 if freitext_div:
                     description = freitext_div.get_text(separator='\n', strip=True)
-                    logger.info(f"Extracted description ({len(description)} chars) using fallback")
+                    logger.info("Extracted description (%d chars) using fallback", len(description))
 
             # Strategy 3: Generic description container
             if not description:
                 desc_div = soup.find('div', id='ad_description_text')
                 if desc_div:
                     description = desc_div.get_text(separator='\n', strip=True)
-                    logger.info(f"Extracted description ({len(description)} chars) from generic container")
+                    logger.info("Extracted description (%d chars) from generic container", len(description))
 
             if not description:
                 logger.warning("Could not find description in WG-Gesucht page")
 
-            # Build metadata
-            metadata = {
-                'url': listing_url,
-                'title': expose.get('title', 'N/A'),
-                'price': expose.get('price', 'N/A'),
-                'size': expose.get('size', 'N/A'),
-                'rooms': expose.get('rooms', 'N/A'),
-                'crawler': expose.get('crawler', 'N/A'),
-                'timestamp': datetime.now().isoformat(),
-            }
+            metadata = self._build_metadata(listing_url, expose, WGGESUCHT_METADATA_FIELDS)
 
             return {
                 'images': images,
@@ -198,48 +447,69 @@ class ArchiveManager:
             }
 
         except Exception as e:
-            logger.error(f"Failed to extract WG-Gesucht archive data: {e}", exc_info=True)
+            logger.error("Failed to extract WG-Gesucht archive data: %s", e, exc_info=True)
             return None
 
-    def save_archive_locally(self, archive_data: Dict, archive_id: str) -> bool:
+    @staticmethod
+    def _build_metadata(listing_url: str, expose: Dict, fields: Tuple[str, ...]) -> Dict:
+        """Archive metadata: the listing URL, the given expose fields and the archive time"""
+        metadata = {'url': listing_url}
+        metadata.update((field, expose.get(field, 'N/A')) for field in fields)
+        metadata['timestamp'] = datetime.now().isoformat()
+        return metadata
+
+    def save_archive_locally(self, archive_data: Dict, archive_id: str) -> Optional[SaveResult]:
         """
         Save archive data to local disk (optional backup)
 
+        Every file is written to a temporary file in the archive directory and
+        moved into place with os.replace, so readers never see partial files.
+
         Args:
             archive_data: Dict with images, description, metadata
             archive_id: Unique identifier for this archive
 
         Returns:
-            True if saved successfully, False otherwise
+            SaveResult with the archive directory, total size and SHA-256 of the
+            written content, or None if saving failed
         """
         try:
             # Create archive directory
             archive_dir = self.archive_path / archive_id
             archive_dir.mkdir(parents=True, exist_ok=True)
 
-            # Save metadata
-            metadata_file = archive_dir / 'metadata.json'
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(archive_data['metadata'], f, indent=2, ensure_ascii=False)
-
-            # Save description
+            files = {'metadata.json': dump_json(archive_data['metadata'])}
             if archive_data.get('description'):
-                desc_file = archive_dir / 'description.txt'
-                with open(desc_file, 'w', encoding='utf-8') as f:
-                    f.write(archive_data['description'])
-
+                files['description.txt'] = archive_data['description'].encode('utf-8')
             # Save image URLs (not downloading actual images)
             if archive_data.get('images'):
-                images_file = archive_dir / 'images.json'
-                with open(images_file, 'w', encoding='utf-8') as f:
-                    json.dump(archive_data['images'], f, indent=2)
+                files['images.json'] = dump_json(archive_data['images'])
+
+            digest = hashlib.sha256()
+            bytes_written = 0
+            for name, data in files.items():
+                self._write_atomic(archive_dir / name, data)
+                digest.update(data)
+                bytes_written += len(data)
 
-            logger.info(f"Saved archive locally: {archive_dir}")
-            return True
+            logger.info("Saved archive locally: %s (%d bytes)", archive_dir, bytes_written)
+            return SaveResult(path=archive_dir, bytes_written=bytes_written, sha256=digest.hexdigest())
 
         except Exception as e:
-            logger.error(f"Failed to save archive locally: {e}", exc_info=True)
-            return False
+            logger.error("Failed to save archive locally: %s", e, exc_info=True)
+            return None
+
+    @staticmethod
+    def _write_atomic(target: Path, data: bytes):
+        """Write data to a temporary file next to target and move it into place"""
+        # Unique per process and thread, so concurrent writers never share a temporary file
+        tmp = target.with_name(f'.{target.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        tmp.write_bytes(data)
+        try:
+            os.replace(tmp, target)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
 
     def cleanup_old_archives(self) -> int:
         """
@@ -255,27 +525,31 @@ class ArchiveManager:
             cutoff_date = datetime.now() - timedelta(days=self.retention_days)
             deleted_count = 0
 
-            for archive_dir in self.archive_path.iterdir():
-                if not archive_dir.is_dir():
-                    continue
+            # scandir entries carry their type and stat data from the directory read
+            with os.scandir(self.archive_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
 
-                # Check modification time
-                mtime = datetime.fromtimestamp(archive_dir.stat().st_mtime)
-                if mtime < cutoff_date:
+                    # Check modification time
+                    mtime = datetime.fromtimestamp(entry.stat(follow_symlinks=False).st_mtime)
+                    if mtime >= cutoff_date:
+                        continue
                     try:
                         # Delete all files in directory
-                        for file in archive_dir.iterdir():
-                            file.unlink()
-                        archive_dir.rmdir()
+                        with os.scandir(entry.path) as files:
+                            for file in files:
+                                os.unlink(file.path)
+                        os.rmdir(entry.path)
                         deleted_count += 1
                     except Exception as e:
-                        logger.warning(f"Failed to delete archive {archive_dir}: {e}")
+                        logger.warning("Failed to delete archive %s: %s", entry.path, e)
 
             if deleted_count > 0:
-                logger.info(f"Cleaned up {deleted_count} old archives")
+                logger.info("Cleaned up %d old archives", deleted_count)
 
             return deleted_count
 
         except Exception as e:
-            logger.error(f"Failed to cleanup old archives: {e}", exc_info=True)
+            logger.error("Failed to cleanup old archives: %s", e, exc_info=True)
             return 0
@@ -1,6 +1,5 @@
 """Captcha solver for CapMonster Captcha Solving Service (https://capmonster.cloud)"""
 from typing import Dict
-from time import sleep
 import backoff
 import requests
 
@@ -11,6 +10,9 @@ from flathunter.captcha.captcha_solver import (
     AwsAwfResponse,
     RecaptchaResponse,
 )
+# Bodies of "still waiting" poll responses, detected without decoding the JSON
+PROCESSING_MARKERS = ('"status":"processing"', '"status": "processing"')
+
 
 class CapmonsterSolver(CaptchaSolver):
     """Implementation of Captcha solver for CapMonster"""
@@ -55,7 +57,7 @@ class CapmonsterSolver(CaptchaSolver):
     @backoff.on_exception(**CaptchaSolver.backoff_options)
     def __submit_capmonster_request(self, params: Dict[str, str]) -> str:
         submit_url = "https://api.capmonster.cloud/createTask"
-        submit_response = requests.post(submit_url, json=params, timeout=30)
+        submit_response = self.session.post(submit_url, json=params, timeout=30)
         logger.info("Got response from capmonster: %s", submit_response.text)
 
         response_json = submit_response.json()
@@ -69,17 +71,22 @@ class CapmonsterSolver(CaptchaSolver):
             "clientKey": self.api_key,
             "taskId": captcha_id
         }
-        while True:
-            retrieve_response = requests.get(retrieve_url, json=params, timeout=30)
-            logger.debug("Got response from capmonster: %s", retrieve_response.text)
+
+        def check():
+            retrieve_response = self.session.get(retrieve_url, json=params, timeout=30)
+            text = retrieve_response.text
+            logger.debug("Got response from capmonster: %s", text)
+            if any(marker in text for marker in PROCESSING_MARKERS):
+                logger.info("Captcha is not ready yet, waiting...")
+                return None
 
             response_json = retrieve_response.json()
             if not "status" in response_json:
                 raise requests.HTTPError(response=response_json["errorCode"])
 
-            if response_json["status"] == "processing":
-                logger.info("Captcha is not ready yet, waiting...")
-                sleep(5)
-                continue
             if response_json["status"] == "ready":
                 return response_json["solution"]["cookies"]["aws-waf-token"]
+            logger.info("Captcha is not ready yet, waiting...")
+            return None
+
+        return self._poll(check)
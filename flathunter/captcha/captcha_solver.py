@@ -2,9 +2,15 @@
 Captcha solver implementations should subclass this."""
 
 from dataclasses import dataclass
+from random import uniform
+from time import monotonic, sleep
+from typing import Callable, Optional, TypeVar
 import requests
+from requests.adapters import HTTPAdapter
 import backoff
 
+T = TypeVar('T')
+
 @dataclass
 class GeetestResponse:
     """Responde from GeeTest Captcha"""
@@ -34,6 +40,28 @@ class CaptchaSolver:
 
     def __init__(self, api_key):
         self.api_key = api_key
+        # The solvers poll the service every few seconds - keep the connection alive
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'User-Agent': 'flathunter', 'Connection': 'keep-alive'})
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _poll(self, check: Callable[[], Optional[T]], initial: float = 1.0, factor: float = 1.5,
+              max_delay: float = 5.0, deadline: float = 120.0) -> T:
+        """Call check until it returns a result, waiting a growing (jittered) delay
+        before each call. Gives up with CaptchaUnsolvableError after `deadline` seconds"""
+        give_up_at = monotonic() + deadline
+        delay = initial
+        while True:
+            sleep(delay + uniform(0, 0.3))
+            result = check()
+            if result is not None:
+                return result
+            if monotonic() >= give_up_at:
+                raise CaptchaUnsolvableError("Timed out waiting for the captcha solution.")
+            delay = min(delay * factor, max_delay)
 
     def solve_geetest(self, geetest: str, challenge: str, page_url: str) -> GeetestResponse:
         """Should be implemented in subclass"""
@@ -2,7 +2,6 @@
 
 import json
 from typing import Dict
-from time import sleep
 import backoff
 import requests
 
@@ -14,6 +13,9 @@ from flathunter.captcha.captcha_solver import (
     AwsAwfResponse,
     RecaptchaResponse,
 )
+# Bodies of "still waiting" poll responses, detected without decoding the JSON
+PENDING_MARKERS = ('"Status":"Pending"', '"Status": "Pending"')
+
 
 class ImageTyperzSolver(CaptchaSolver):
     """Implementation of Captcha solver for ImageTyperz"""
@@ -74,7 +76,7 @@ class ImageTyperzSolver(CaptchaSolver):
 
     @backoff.on_exception(**CaptchaSolver.backoff_options)
     def __submit_imagetyperz_request(self, submit_url: str, params: Dict[str, str]) -> str:
-        submit_response = requests.get(submit_url, params=params, timeout=30)
+        submit_response = self.session.get(submit_url, params=params, timeout=30)
         logger.debug("Got response from imagetyperz/request: %s:", submit_response.text)
 
         if "error" in submit_response.text.lower():
@@ -95,14 +97,18 @@ class ImageTyperzSolver(CaptchaSolver):
             "captchaid": captcha_id,
         }
 
-        while True:
-            retrieve_response = requests.get(retrieve_url, params=params, timeout=30)
-            logger.debug("Got response from imagetyperz: %s:", retrieve_response.text)
-            response = json.loads(retrieve_response.text)[0]
+        def check():
+            retrieve_response = self.session.get(retrieve_url, params=params, timeout=30)
+            text = retrieve_response.text
+            logger.debug("Got response from imagetyperz: %s:", text)
+            if any(marker in text for marker in PENDING_MARKERS):
+                logger.info("Captcha is not ready yet, waiting...")
+                return None
+
+            response = json.loads(text)[0]
             if response["Status"] == "Pending":
                 logger.info("Captcha is not ready yet, waiting...")
-                sleep(5)
-                continue
+                return None
 
             if response["Status"] == "ERROR: IMAGE_TIMED_OUT":
                 raise CaptchaUnsolvableError()
@@ -110,3 +116,5 @@ class ImageTyperzSolver(CaptchaSolver):
                 raise requests.HTTPError(response=retrieve_response)
 
             return response["Response"]
+
+        return self._poll(check)
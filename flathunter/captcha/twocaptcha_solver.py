@@ -1,7 +1,6 @@
 """Captcha solver for 2Captcha Captcha Solving Service (https://2captcha.com)"""
 import json
 from typing import Dict
-from time import sleep
 import backoff
 import requests
 
@@ -63,7 +62,7 @@ class TwoCaptchaSolver(CaptchaSolver):
     @backoff.on_exception(**CaptchaSolver.backoff_options)
     def __submit_2captcha_request(self, params: Dict[str, str]) -> str:
         submit_url = "http://2captcha.com/in.php"
-        submit_response = requests.post(submit_url, params=params, timeout=30)
+        submit_response = self.session.post(submit_url, params=params, timeout=30)
         logger.info("Got response from 2captcha/in: %s", submit_response.text)
 
         if not submit_response.text.startswith("OK"):
@@ -81,14 +80,14 @@ class TwoCaptchaSolver(CaptchaSolver):
             "id": captcha_id,
             "json": 0,
         }
-        while True:
-            retrieve_response = requests.get(retrieve_url, params=params, timeout=30)
+
+        def check():
+            retrieve_response = self.session.get(retrieve_url, params=params, timeout=30)
             logger.debug("Got response from 2captcha/res: %s", retrieve_response.text)
 
             if "CAPCHA_NOT_READY" in retrieve_response.text:
                 logger.info("Captcha is not ready yet, waiting...")
-                sleep(5)
-                continue
+                return None
 
             if "ERROR_CAPTCHA_UNSOLVABLE" in retrieve_response.text:
                 logger.info("The captcha was unsolvable.")
@@ -102,3 +101,5 @@ class TwoCaptchaSolver(CaptchaSolver):
                 raise requests.HTTPError(response=retrieve_response)
 
             return retrieve_response.text.split("|", 1)[1]
+
+        return self._poll(check)
@@ -1,46 +1,108 @@
 """Chrome needs some special handling to work out where the correct
 binary is, to attach the correct selenium chromedriver, and to set
 the correct version number"""
+import json
+import os
 import re
+import shutil
 import subprocess
-from typing import List
+import time
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from sys import platform
 import undetected_chromedriver as uc
 
 from flathunter.logger_config import logger
 from flathunter.exceptions import ChromeNotFound
 
-CHROME_VERSION_REGEXP = re.compile(r'.* (\d+\.\d+\.\d+\.\d+)( .*)?')
+# The registry is read natively on Windows, other platforms fall back to `reg query`
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
 WINDOWS_CHROME_REG_PATH = r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon'
 WINDOWS_CHROME_REG_REGEXP = re.compile(r'\s*version\s*REG_SZ\s*(\d+)\..*')
-CHROME_BINARY_NAMES = ['google-chrome', 'chromium', 'chrome', 'chromium-browser',
-                       '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome']
+WINDOWS_CHROME_REG_KEY = r'Software\Google\Chrome\BLBeacon'
+# Chrome binaries worth probing on each platform. Windows Chrome does not answer
+# --version, its version is read from the registry instead. Well-known install
+# locations are listed too, services often run with a minimal PATH
+CHROME_BINARY_NAMES_BY_OS = {
+    'linux': ['google-chrome', 'google-chrome-stable', 'chromium', 'chrome', 'chromium-browser',
+              '/usr/bin/google-chrome-stable', '/snap/bin/chromium',
+              '/var/lib/flatpak/exports/bin/com.google.Chrome',
+              '/var/lib/flatpak/exports/bin/org.chromium.Chromium'],
+    'darwin': ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+               os.path.expanduser('~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'),
+               '/Applications/Chromium.app/Contents/MacOS/Chromium',
+               'google-chrome', 'chromium'],
+    'win32': [],
+}
+CHROME_BINARY_NAMES = CHROME_BINARY_NAMES_BY_OS.get(
+    platform, ['google-chrome', 'chromium', 'chrome', 'chromium-browser',
+               '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'])
+
+# Seconds to wait for a version probe before giving up on it
+COMMAND_TIMEOUT = 5
+
+# Where the detected Chrome version is kept between runs, and for how many seconds
+CHROME_VERSION_CACHE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'flathunter', 'chrome_version')
+CHROME_VERSION_CACHE_TTL = 24 * 60 * 60
 
 def get_command_output(args) -> List[str]:
-    """Run a command and return stdout"""
+    """Run a command and return the lines of its stdout"""
     try:
-        with subprocess.Popen(args,
-                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                    universal_newlines=True) as process:
-            if process.stdout is None:
-                return []
-            return process.stdout.readlines()
-    except FileNotFoundError:
+        result = subprocess.run(args, capture_output=True, timeout=COMMAND_TIMEOUT, check=False)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         return []
+    return result.stdout.decode('utf-8', 'replace').splitlines()
+
+def parse_chrome_version(line: str) -> Optional[int]:
+    """Major version from `chrome --version` output like "Google Chrome 120.0.6099.71"
+
+    The version is the last a.b.c.d token after the product name"""
+    for token in reversed(line.split()[1:]):
+        parts = token.split('.')
+        if len(parts) == 4 and all(part.isdigit() for part in parts):
+            return int(parts[0])
+    return None
+
+def get_registry_chrome_version() -> Optional[int]:
+    """Read the Chrome major version from the Windows registry without spawning reg.exe"""
+    if winreg is None:
+        return None
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, WINDOWS_CHROME_REG_KEY) as key:
+            version = winreg.QueryValueEx(key, 'version')[0]
+        return int(str(version).split('.', 1)[0])
+    except (OSError, ValueError):
+        return None
 
 def get_chrome_version() -> int:
     """Determine the correct name for the chrome binary"""
+    return probe_chrome_version()[0]
+
+def probe_chrome_version() -> Tuple[int, Optional[str]]:
+    """Chrome major version and the binary that reported it (None if read from the registry)"""
     for binary_name in CHROME_BINARY_NAMES:
+        # Looking the binary up on PATH is much cheaper than failing to start it
+        binary_path = shutil.which(binary_name)
+        if binary_path is None:
+            continue
         try:
-            version_output = get_command_output([binary_name, '--version'])
+            version_output = get_command_output([binary_path, '--version'])
             if not version_output:
                 continue
-            match = CHROME_VERSION_REGEXP.match(version_output[0])
-            if match is None:
+            version = parse_chrome_version(version_output[0])
+            if version is None:
                 continue
-            return int(match.group(1).split('.')[0])
+            return version, binary_path
         except FileNotFoundError:
             pass
+    registry_version = get_registry_chrome_version()
+    if registry_version is not None:
+        return registry_version, None
     try:
         # on Windows, Chrome doesn't respond to --version, but we can find
         # the version in the registry
@@ -50,11 +112,54 @@ def get_chrome_version() -> int:
         version_matches = (WINDOWS_CHROME_REG_REGEXP.match(l) for l in output)
         version_matches = [m for m in version_matches if m is not None]
         if version_matches:
-            return int(version_matches[0].group(1))
+            return int(version_matches[0].group(1)), None
     except FileNotFoundError:
         pass
     raise ChromeNotFound()
 
+def read_chrome_version_cache() -> Optional[int]:
+    """Chrome version stored by an earlier run, None if missing, stale or the binary changed"""
+    try:
+        if time.time() - os.path.getmtime(CHROME_VERSION_CACHE) > CHROME_VERSION_CACHE_TTL:
+            return None
+        with open(CHROME_VERSION_CACHE, encoding='utf-8') as cache_file:
+            cached = json.load(cache_file)
+        binary = cached['binary']
+        if binary is not None and os.stat(binary).st_mtime_ns != cached['mtime_ns']:
+            # Chrome was updated since the version was stored
+            return None
+        return int(cached['version'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def write_chrome_version_cache(version: int, binary: Optional[str]):
+    """Store the Chrome version for later runs, ignoring any failure to do so"""
+    try:
+        cached = {'version': version, 'binary': binary,
+                  'mtime_ns': os.stat(binary).st_mtime_ns if binary is not None else None}
+        os.makedirs(os.path.dirname(CHROME_VERSION_CACHE), exist_ok=True)
+        tmp_path = f'{CHROME_VERSION_CACHE}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(cached, cache_file)
+        os.replace(tmp_path, CHROME_VERSION_CACHE)
+    except OSError as exc:
+        logger.debug("Could not store Chrome version in %s: %s", CHROME_VERSION_CACHE, exc)
+
+@lru_cache(maxsize=1)
+def cached_chrome_version() -> int:
+    """Chrome version of this machine, determined once per run
+
+    The version is also kept on disk for CHROME_VERSION_CACHE_TTL seconds, so new
+    processes skip the probe too. Set FLATHUNTER_DISABLE_CHROME_VERSION_CACHE to
+    always probe. ChromeNotFound is not cached, so a failed lookup is retried next time"""
+    if os.environ.get('FLATHUNTER_DISABLE_CHROME_VERSION_CACHE'):
+        return get_chrome_version()
+    version = read_chrome_version_cache()
+    if version is None:
+        version, binary = probe_chrome_version()
+        write_chrome_version_cache(version, binary)
+    return version
+
 def get_chrome_driver(driver_arguments):
     """Configure Chrome WebDriver"""
     logger.info('Initializing Chrome WebDriver for crawler...')
@@ -64,11 +169,19 @@ def get_chrome_driver(driver_arguments):
     if driver_arguments is not None:
         for driver_argument in driver_arguments:
             chrome_options.add_argument(driver_argument)
-    chrome_version = get_chrome_version()
+    chrome_version = cached_chrome_version()
     chrome_options.add_argument("--headless=new")
     chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
-    driver = uc.Chrome(version_main=chrome_version, options=chrome_options) # pylint: disable=no-member
+    # A pre-installed chromedriver saves undetected-chromedriver from fetching a matching one
+    driver_path = os.environ.get('FLATHUNTER_CHROMEDRIVER_PATH')
+    if driver_path:
+        driver = uc.Chrome(version_main=chrome_version, options=chrome_options, # pylint: disable=no-member
+                           driver_executable_path=driver_path)
+    else:
+        driver = uc.Chrome(version_main=chrome_version, options=chrome_options) # pylint: disable=no-member
 
+    # Enable the Network domain first, so the overrides below apply from the first request on
+    driver.execute_cdp_cmd('Network.enable', {})
     driver.execute_cdp_cmd(
         "Network.setUserAgentOverride",
         {
@@ -80,5 +193,4 @@ def get_chrome_driver(driver_arguments):
 
     driver.execute_cdp_cmd('Network.setBlockedURLs',
         {"urls": ["https://api.geetest.com/get.*"]})
-    driver.execute_cdp_cmd('Network.enable', {})
     return driver
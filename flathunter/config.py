@@ -1,29 +1,23 @@
 """Wrap configuration options as an object"""
 import os
-from typing import Optional, Dict, Any, List, Protocol
+from functools import lru_cache, partial
+from typing import Optional, Dict, Any, Callable, List, Protocol
 
 import json
 import yaml
 from dotenv import load_dotenv
 
 from flathunter.captcha.captcha_solver import CaptchaSolver
-from flathunter.captcha.imagetyperz_solver import ImageTyperzSolver
-from flathunter.captcha.twocaptcha_solver import TwoCaptchaSolver
-from flathunter.captcha.capmonster_solver import CapmonsterSolver
-from flathunter.crawler.kleinanzeigen import Kleinanzeigen
-from flathunter.crawler.idealista import Idealista
-from flathunter.crawler.immobiliare import Immobiliare
-from flathunter.crawler.immobilienscout import Immobilienscout
-from flathunter.crawler.immowelt import Immowelt
-from flathunter.crawler.wggesucht import WgGesucht
-from flathunter.crawler.willhaben import Willhaben
-from flathunter.crawler.vrmimmo import VrmImmo
-from flathunter.crawler.subito import Subito
-from flathunter.crawler.derstandard import DerStandard
 from flathunter.filter import Filter
 from flathunter.logger_config import logger
 from flathunter.exceptions import ConfigException
 
+# libyaml's loader is much faster, fall back to the pure Python one without it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 load_dotenv()
 
 class Readenv(Protocol):
@@ -33,16 +27,33 @@ class Readenv(Protocol):
 
 def _read_env(key: str, fallback: Optional[str] = None) -> Readenv:
     """ read the given key from environment"""
-    return lambda: os.environ.get(key, fallback)
+    # A bound partial instead of a lambda - no extra Python frame per read, and
+    # the environment is still read live, so runtime changes are picked up
+    return partial(os.environ.get, key, fallback)
+
+@lru_cache(maxsize=32)
+def _split_env(value: str, separator: str, convert: Callable[[str], Any] = str) -> tuple:
+    """Split (and convert) a list-valued environment variable, parsed once per distinct value.
+    The environment is still read on every access, so changes are picked up"""
+    return tuple(convert(item) for item in value.split(separator))
+
+_TRUE_VALUES = frozenset(("true", "1", "on", "yes", "y"))
+_FALSE_VALUES = frozenset(("false", "0", "off", "no", "n"))
 
 def _to_bool(value: Any) -> bool:
     """Cast config parameters to booleans"""
     if isinstance(value, bool):
         return value
+    if isinstance(value, str):
+        # Fast path for values that are already normalized
+        if value in _TRUE_VALUES:
+            return True
+        if value in _FALSE_VALUES:
+            return False
     value = str(value).strip().lower()
-    if value in ("true", "1", "on", "yes", "y"):
+    if value in _TRUE_VALUES:
         return True
-    if value in ("false", "0", "off", "no", "n"):
+    if value in _FALSE_VALUES:
         return False
     error_msg = f"Cannot convert config parameter '{value}' to boolean"
     logger.error(error_msg)
@@ -110,13 +121,16 @@ def elide(string):
         return None
     if len(string) < 6:
         return "x" * len(string)
-    blanks = "x" * (len(string)-6)
-    return f"{string[0:3]}{blanks}{string[-3:]}"
+    return string[:3] + "x" * (len(string) - 6) + string[-3:]
 
 
 class YamlConfig:  # pylint: disable=too-many-public-methods
     """Generic config object constructed from nested dictionaries"""
 
+    # Fixed attribute layout - config objects are read on every crawl
+    __slots__ = ('config', '__searchers__', '_path_cache', '_captcha_solver',
+                 '_captcha_solver_keys', '_repr_cache')
+
     DEFAULT_MESSAGE_FORMAT = """{title}
 Zimmer: {rooms}
 Größe: {size}
@@ -128,6 +142,13 @@ Preis: {price}
         if config is None:
             config = {}
         self.config = config
+        # Resolved dotted paths, cleared whenever the config is updated
+        self._path_cache: Dict[str, Any] = {}
+        # The captcha solver and the keys it was created with
+        self._captcha_solver: Optional[CaptchaSolver] = None
+        self._captcha_solver_keys: Optional[tuple] = None
+        # Rendered __repr__, cleared whenever the config is updated
+        self._repr_cache: Optional[str] = None
         self.__searchers__ = []
         self.check_deprecated()
 
@@ -141,6 +162,19 @@ Preis: {price}
 
     def init_searchers(self):
         """Initialize search plugins"""
+        # Imported here, the crawlers pull in Selenium and friends that plain
+        # config access does not need
+        # pylint: disable=import-outside-toplevel
+        from flathunter.crawler.kleinanzeigen import Kleinanzeigen
+        from flathunter.crawler.idealista import Idealista
+        from flathunter.crawler.immobiliare import Immobiliare
+        from flathunter.crawler.immobilienscout import Immobilienscout
+        from flathunter.crawler.immowelt import Immowelt
+        from flathunter.crawler.wggesucht import WgGesucht
+        from flathunter.crawler.willhaben import Willhaben
+        from flathunter.crawler.vrmimmo import VrmImmo
+        from flathunter.crawler.subito import Subito
+        from flathunter.crawler.derstandard import DerStandard
         self.__searchers__ = [
             Immobilienscout(self),
             WgGesucht(self),
@@ -177,17 +211,24 @@ Preis: {price}
 
     def _read_yaml_path(self, path, default_value):
         """Resolve a dotted variable path in nested dictionaries"""
+        try:
+            res = self._path_cache[path]
+        except KeyError:
+            res = self._path_cache[path] = self._resolve_yaml_path(path)
+        if res is None:
+            return default_value
+        return res
+
+    def _resolve_yaml_path(self, path):
+        """Walk the nested dictionaries along a dotted path, None if it is not set"""
         config = self.config
         parts = path.split('.')
         while len(parts) > 1 and config is not None:
             config = config.get(parts[0], {})
             parts = parts[1:]
         if config is None:
-            return default_value
-        res = config.get(parts[0], default_value)
-        if res is None:
-            return default_value
-        return res
+            return None
+        return config.get(parts[0])
 
     def set_searchers(self, searchers):
         """Update the active search plugins"""
@@ -242,6 +283,10 @@ Preis: {price}
         """Whether a random delay should be added to loop sleeping time, defaults to true"""
         return self._read_yaml_path('loop.random_jitter', True)
 
+    def max_crawler_threads(self):
+        """Number of crawlers (portals) that are crawled in parallel, defaults to 8"""
+        return self._read_yaml_path('max_crawler_threads', 8)
+
     def loop_pause_from(self):
         """Start time of loop pause"""
         return self._read_yaml_path('loop.pause.from', "00:00")
@@ -287,9 +332,7 @@ Preis: {price}
 
     def telegram_notify_with_images(self) -> bool:
         """True if images should be sent along with notifications"""
-        flag = str(self._read_yaml_path(
-            "telegram.notify_with_images", 'false'))
-        return flag.lower() == 'true'
+        return _to_bool(self._read_yaml_path("telegram.notify_with_images", False))
 
     def telegram_receiver_ids(self):
         """Static list of receiver IDs for notification messages"""
@@ -309,9 +352,7 @@ Preis: {price}
 
     def apprise_notify_with_images(self) -> bool:
         """True if images should be sent along with notifications"""
-        flag = str(self._read_yaml_path(
-            "apprise_notify_with_images", 'false'))
-        return flag.lower() == 'true'
+        return _to_bool(self._read_yaml_path("apprise_notify_with_images", False))
 
     def apprise_image_limit(self) -> Optional[int]:
         """How many images should be sent along with Apprise notifications"""
@@ -330,17 +371,31 @@ Preis: {price}
         return self._read_yaml_path("captcha.capmonster.api_key", "")
 
     def _get_captcha_solver(self) -> Optional[CaptchaSolver]:
-        """Get configured captcha solver"""
-        imagetyperz_token = self._get_imagetyperz_token()
+        """Get configured captcha solver
+
+        The solver (and its HTTP session) is reused for as long as the configured
+        keys stay the same"""
+        keys = (self._get_imagetyperz_token(), self.get_twocaptcha_key(), self.get_capmonster_key())
+        if self._captcha_solver_keys != keys:
+            self._captcha_solver = self._create_captcha_solver(*keys)
+            self._captcha_solver_keys = keys
+        return self._captcha_solver
+
+    @staticmethod
+    def _create_captcha_solver(imagetyperz_token, twocaptcha_api_key,
+                               capmonster_api_key) -> Optional[CaptchaSolver]:
+        # Only the configured solver is imported
+        # pylint: disable=import-outside-toplevel
         if imagetyperz_token:
+            from flathunter.captcha.imagetyperz_solver import ImageTyperzSolver
             return ImageTyperzSolver(imagetyperz_token)
 
-        twocaptcha_api_key = self.get_twocaptcha_key()
         if twocaptcha_api_key:
+            from flathunter.captcha.twocaptcha_solver import TwoCaptchaSolver
             return TwoCaptchaSolver(twocaptcha_api_key)
 
-        capmonster_api_key = self.get_capmonster_key()
         if capmonster_api_key:
+            from flathunter.captcha.capmonster_solver import CapmonsterSolver
             return CapmonsterSolver(capmonster_api_key)
 
         return None
@@ -356,6 +411,10 @@ Preis: {price}
         """The list of driver arguments for Selenium / Webdriver"""
         return self._read_yaml_path('captcha.driver_arguments', [])
 
+    def captcha_driver_pool_size(self):
+        """Number of Chrome drivers the webdriver crawlers may keep open, defaults to 1"""
+        return self._read_yaml_path('captcha.driver_pool_size', 1)
+
     def use_proxy(self):
         """Check if proxy is configured"""
         return "use_proxy_list" in self.config and self.config["use_proxy_list"]
@@ -363,6 +422,8 @@ Preis: {price}
     def set_keys(self, dict_keys: Dict[str, Any]):
         """Update the config keys based on the content of the dictionary passed"""
         self.config.update(dict_keys)
+        self._path_cache.clear()
+        self._repr_cache = None
 
     def _get_filter_config(self, key: str) -> Optional[Any]:
         return (self.config.get("filters", {}) or {}).get(key, None)
@@ -406,6 +467,11 @@ Preis: {price}
         return self._read_yaml_path('immoscout_cookie', None)
 
     def __repr__(self):
+        if self._repr_cache is None:
+            self._repr_cache = self._build_repr()
+        return self._repr_cache
+
+    def _build_repr(self) -> str:
         return json.dumps({
             "captcha_enabled": self.captcha_enabled(),
             "captcha_driver_arguments": self.captcha_driver_arguments(),
@@ -425,6 +491,8 @@ Preis: {price}
 class CaptchaEnvironmentConfig(YamlConfig):
     """Mixin to add environment-variable captcha support to config object"""
 
+    __slots__ = ()
+
     def _get_imagetyperz_token(self):
         return Env.FLATHUNTER_IMAGETYPERZ_TOKEN() or super()._get_imagetyperz_token()  # pylint: disable=no-member
 
@@ -455,6 +523,8 @@ class Config(CaptchaEnvironmentConfig):  # pylint: disable=too-many-public-metho
     environment variable overrides
     """
 
+    __slots__ = ()
+
     def __init__(self, filename=None):
         if filename is None and Env.FLATHUNTER_TARGET_URLS() is None:
             raise ConfigException(
@@ -464,7 +534,7 @@ class Config(CaptchaEnvironmentConfig):  # pylint: disable=too-many-public-metho
             if not os.path.exists(filename):
                 raise ConfigException("No config file found at location %s")
             with open(filename, encoding="utf-8") as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=YamlLoader)
         else:
             config = {}
         super().__init__(config)
@@ -476,7 +546,7 @@ class Config(CaptchaEnvironmentConfig):  # pylint: disable=too-many-public-metho
     def target_urls(self):
         env_urls = Env.FLATHUNTER_TARGET_URLS()
         if env_urls is not None:
-            return env_urls.split(';')
+            return list(_split_env(env_urls, ';'))
         return super().target_urls()
 
     def verbose_logging(self):
@@ -539,7 +609,7 @@ class Config(CaptchaEnvironmentConfig):  # pylint: disable=too-many-public-metho
     def notifiers(self):
         env_notifiers = Env.FLATHUNTER_NOTIFIERS()
         if env_notifiers is not None:
-            return env_notifiers.split(",")
+            return list(_split_env(env_notifiers, ','))
         return super().notifiers()
 
     def telegram_bot_token(self) -> Optional[str]:
@@ -548,13 +618,13 @@ class Config(CaptchaEnvironmentConfig):  # pylint: disable=too-many-public-metho
     def telegram_notify_with_images(self) -> bool:
         env_bot_images = Env.FLATHUNTER_TELEGRAM_BOT_NOTIFY_WITH_IMAGES()
         if env_bot_images is not None:
-            return str(env_bot_images) == 'true'
+            return _to_bool(env_bot_images)
         return super().telegram_notify_with_images()
 
     def telegram_receiver_ids(self):
         env_receiver_ids = Env.FLATHUNTER_TELEGRAM_RECEIVER_IDS()
         if env_receiver_ids is not None:
-            return [int(x) for x in env_receiver_ids.split(",")]
+            return list(_split_env(env_receiver_ids, ',', int))
         return super().telegram_receiver_ids()
 
     def mattermost_webhook_url(self):
@@ -566,8 +636,9 @@ class Config(CaptchaEnvironmentConfig):  # pylint: disable=too-many-public-metho
         return super().slack_webhook_url()
 
     def apprise_notify_with_images(self) -> bool:
-        if Env.FLATHUNTER_APPRISE_NOTIFY_WITH_IMAGES() is not None:
-            return str(Env.FLATHUNTER_APPRISE_NOTIFY_WITH_IMAGES()) == 'true'
+        env_images = Env.FLATHUNTER_APPRISE_NOTIFY_WITH_IMAGES()
+        if env_images is not None:
+            return _to_bool(env_images)
         return super().apprise_notify_with_images()
 
     def apprise_image_limit(self) -> Optional[int]:
@@ -579,7 +650,7 @@ class Config(CaptchaEnvironmentConfig):  # pylint: disable=too-many-public-metho
     def excluded_titles(self):
         env_filter = Env.FLATHUNTER_FILTER_EXCLUDED_TITLES()
         if env_filter is not None:
-            return env_filter.split(";")
+            return list(_split_env(env_filter, ';'))
         return super().excluded_titles()
 
     def min_price(self):
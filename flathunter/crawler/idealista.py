@@ -1,6 +1,8 @@
 """Expose crawler for Idealista"""
 import re
 
+from bs4 import SoupStrainer
+
 from flathunter.logger_config import logger
 from flathunter.abstract_crawler import Crawler
 
@@ -8,18 +10,19 @@ class Idealista(Crawler):
     """Implementation of Crawler interface for Idealista"""
 
     URL_PATTERN = re.compile(r'https://www\.idealista\.it')
+    RESULTS_STRAINER = SoupStrainer('article', class_='item')
 
     def __init__(self, config):
         super().__init__(config)
         self.config = config
 
     # pylint: disable=unused-argument
-    def get_page(self, search_url, driver=None, page_no=None):
+    def get_page(self, search_url, driver=None, page_no=None, parse_only=None):
         """Applies a page number to a formatted search URL and fetches the exposes at that page"""
         if self.config.use_proxy():
-            return self.get_soup_with_proxy(search_url)
+            return self.get_soup_with_proxy(search_url, parse_only)
 
-        return self.get_soup_from_url(search_url)
+        return self.get_soup_from_url(search_url, parse_only=parse_only)
 
     # pylint: disable=too-many-locals
     def extract_data(self, raw_data):
@@ -114,7 +114,7 @@ class Immobilienscout(Crawler):
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 search_url.format(page_no),
                 headers=self.get_headers(),
                 json=data,
@@ -3,7 +3,7 @@ import re
 import datetime
 import hashlib
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from flathunter.logger_config import logger
 from flathunter.abstract_crawler import Crawler
@@ -12,6 +12,7 @@ class Immowelt(Crawler):
     """Implementation of Crawler interface for ImmoWelt"""
 
     URL_PATTERN = re.compile(r'https://www\.immowelt\.de')
+    RESULTS_STRAINER = SoupStrainer("div", attrs={"class": "css-79elbk"})
 
     def __init__(self, config):
         super().__init__(config)
@@ -2,7 +2,7 @@
 import re
 import datetime
 
-from bs4 import Tag
+from bs4 import SoupStrainer, Tag
 
 from flathunter.webdriver_crawler import WebdriverCrawler
 from flathunter.logger_config import logger
@@ -11,6 +11,7 @@ class Kleinanzeigen(WebdriverCrawler):
     """Implementation of Crawler interface for Kleinanzeigen"""
 
     URL_PATTERN = re.compile(r'https://www\.kleinanzeigen\.de')
+    RESULTS_STRAINER = SoupStrainer(id="srchrslt-adtable")
     MONTHS = {
         "Januar": "01",
         "Februar": "02",
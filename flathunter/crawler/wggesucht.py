@@ -5,10 +5,10 @@ import random
 from typing import Optional, List, Dict, Any, Union
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from flathunter.logger_config import logger
-from flathunter.abstract_crawler import Crawler
+from flathunter.abstract_crawler import Crawler, CAPTCHA_MARKER_PATTERN
 
 
 def get_title(title_row: Tag) -> str:
@@ -265,7 +265,8 @@ class WgGesucht(Crawler):
             driver: Optional[Any] = None,
             checkbox: bool = False,
             afterlogin_string: Optional[str] = None,
-            retry_count: int = 0) -> BeautifulSoup:
+            retry_count: int = 0,
+            parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
         """
         Creates a Soup object from the HTML at the provided URL
 
@@ -309,19 +310,23 @@ class WgGesucht(Crawler):
 
             if self.config.use_proxy():
                 logger.debug("Using proxy for URL: %s", url)
-                return self.get_soup_with_proxy(url)
+                return self.get_soup_with_proxy(url, parse_only)
             if driver is not None:
                 logger.debug("Using webdriver for URL: %s", url)
                 driver.get(url)
-                if re.search("initGeetest", driver.page_source):
+                page_source = driver.page_source
+                captchas = set(CAPTCHA_MARKER_PATTERN.findall(page_source))
+                if "initGeetest" in captchas:
                     logger.info("Geetest captcha detected, attempting to resolve...")
                     self.resolve_geetest(driver)
-                elif re.search("g-recaptcha", driver.page_source):
+                    page_source = driver.page_source
+                elif "g-recaptcha" in captchas:
                     logger.info("reCAPTCHA detected, attempting to resolve...")
                     self.resolve_recaptcha(
                         driver, checkbox, afterlogin_string or "")
-                return BeautifulSoup(driver.page_source, 'lxml')
-            return BeautifulSoup(resp.content, 'lxml')
+                    page_source = driver.page_source
+                return self.parse_html(page_source, parse_only)
+            return self.parse_html(resp.content, parse_only)
 
         except (requests.exceptions.Timeout, requests.exceptions.RequestException) as exc:
             if retry_count >= max_retries:
@@ -329,7 +334,7 @@ class WgGesucht(Crawler):
                     f"WG-Gesucht page load failed after {max_retries} retries - likely rate limited or down: {url}"
                 )
                 # Return empty soup after exhausting retries
-                return BeautifulSoup("", 'lxml')
+                return self.parse_html("")
 
             # Exponential backoff with jitter to avoid thundering herd
             delay = base_delay * (2 ** retry_count) + random.uniform(0, 3)
@@ -339,8 +344,9 @@ class WgGesucht(Crawler):
             )
             time.sleep(delay)
 
-            return self.get_soup_from_url(url, driver, checkbox, afterlogin_string, retry_count + 1)
+            return self.get_soup_from_url(url, driver, checkbox, afterlogin_string, retry_count + 1,
+                                          parse_only)
 
         except Exception as e:
             logger.error("Unexpected error loading WG-Gesucht page %s: %s", url, str(e), exc_info=True)
-            return BeautifulSoup("", 'lxml')
+            return self.parse_html("")
@@ -1,6 +1,7 @@
 """Expose crawler for Willhaben"""
 import re
 from typing import Optional, List, Dict
+import requests
 from bs4 import BeautifulSoup, Tag
 from flathunter.logger_config import logger
 from flathunter.abstract_crawler import Crawler
@@ -11,8 +12,8 @@ class Willhaben(Crawler):
 
     URL_PATTERN = re.compile(r'https://www\.willhaben\.at')
 
-    def __init__(self, config):
-        super().__init__(config)
+    def __init__(self, config, session: Optional[requests.Session] = None):
+        super().__init__(config, session)
         self.config = config
 
     def extract_data(self, soup: BeautifulSoup) -> List[Dict]:
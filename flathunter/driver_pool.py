@@ -0,0 +1,122 @@
+"""Pool of Chrome webdrivers that are shared by the webdriver crawlers
+
+Starting Chrome takes seconds, so drivers are kept alive and handed from one
+crawl to the next. Cookies are cleared whenever a driver is returned to the
+pool. All drivers are shut down when the interpreter exits.
+"""
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver import Chrome
+
+from flathunter.chrome_wrapper import get_chrome_driver
+from flathunter.logger_config import logger
+
+
+class DriverPool:
+    """Hands out at most `size` Chrome drivers created with the same arguments"""
+
+    def __init__(self, driver_arguments, size: int = 1):
+        self.driver_arguments = list(driver_arguments or [])
+        self.size = max(1, size)
+        self.idle: queue.Queue = queue.Queue()
+        self.drivers: List[Chrome] = []
+        self.starting = 0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> Chrome:
+        """Take an idle driver, start a new one, or wait until one is released"""
+        while True:
+            try:
+                return self.idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self.lock:
+                can_start = len(self.drivers) + self.starting < self.size
+                if can_start:
+                    # Reserve the slot - Chrome is started outside of the lock
+                    self.starting += 1
+            if can_start:
+                break
+            try:
+                # Re-check every second, a discarded driver frees its slot
+                return self.idle.get(timeout=1)
+            except queue.Empty:
+                continue
+
+        try:
+            driver = get_chrome_driver(self.driver_arguments)
+            with self.lock:
+                self.drivers.append(driver)
+            return driver
+        finally:
+            with self.lock:
+                self.starting -= 1
+
+    def release(self, driver: Chrome):
+        """Return a driver to the pool, dropping it if the browser is gone"""
+        try:
+            driver.delete_all_cookies()
+        except WebDriverException as exc:
+            logger.warning("Discarding broken Chrome driver: %s", exc)
+            self._discard(driver)
+            return
+        self.idle.put(driver)
+
+    @contextmanager
+    def driver(self):
+        """Borrow a driver for the duration of the with-block"""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        """Quit all drivers started by this pool"""
+        with self.lock:
+            drivers, self.drivers = self.drivers, []
+        while not self.idle.empty():
+            self.idle.get_nowait()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+    def _discard(self, driver: Chrome):
+        with self.lock:
+            if driver in self.drivers:
+                self.drivers.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+_pools: Dict[Tuple[Tuple[str, ...], int], DriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(driver_arguments, size: int = 1) -> DriverPool:
+    """Return the shared pool for the given driver arguments and size"""
+    key = (tuple(driver_arguments or []), size)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = DriverPool(driver_arguments, size)
+        return _pools[key]
+
+
+@atexit.register
+def close_all_pools():
+    """Quit the drivers of every pool"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -43,6 +43,11 @@ class GoogleCloudIdMaintainer:
         self.database.collection('exposes').document(
             str(expose['id'])).set(record)
 
+    def save_exposes(self, exposes):
+        """Writes several exposes to the storage backend"""
+        for expose in exposes:
+            self.save_expose(expose)
+
     def get_exposes_since(self, min_datetime):
         """Returns all exposes since the supplied datetime"""
         localized_datetime = min_datetime.replace(tzinfo=pytz.UTC)
@@ -2,6 +2,7 @@
 import re
 import traceback
 import time
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 import requests
 
@@ -280,9 +281,20 @@ class Hunter:
                 self._record_crawler_failure(crawler_name, error_msg)
                 return []
 
-        return chain(*[try_crawl(searcher, url, max_pages)
-                       for searcher in self.config.searchers()
-                       for url in self.config.target_urls()])
+        def crawl_searcher(searcher):
+            # URLs of one portal stay sequential, so the per-crawler delay and
+            # the crawler's own webdriver are only ever used from one thread
+            return list(chain(*[try_crawl(searcher, url, max_pages)
+                                for url in self.config.target_urls()]))
+
+        searchers = self.config.searchers()
+        if len(searchers) < 2:
+            return chain(*[crawl_searcher(searcher) for searcher in searchers])
+
+        # Portals are independent hosts - crawl them in parallel, keeping the configured order
+        max_workers = min(len(searchers), self.config.max_crawler_threads() or 8)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return chain(*executor.map(crawl_searcher, searchers))
 
     def hunt_flats(self, max_pages: None|int = None):
         """Crawl, process and filter exposes"""
@@ -21,14 +21,25 @@ class SaveAllExposesProcessor(Processor):
         self.config = config
         self.id_watch = id_watch
 
+    # Exposes are written in one transaction per batch
+    BATCH_SIZE = 32
+
     def process_expose(self, expose):
         """Save a single expose"""
         self.id_watch.save_expose(expose)
         return expose
 
+    def process_batch(self, batch):
+        """Save a batch of exposes at once"""
+        self.id_watch.save_exposes(batch)
+        return batch
+
 class IdMaintainer:
     """SQLite back-end for the database"""
 
+    # Keep IN (...) lists below SQLite's bound parameter limit
+    QUERY_BATCH_SIZE = 500
+
     def __init__(self, db_name):
         self.db_name = db_name
         self.threadlocal = threading.local()
@@ -41,6 +52,12 @@ class IdMaintainer:
                 self.threadlocal.connection = lite.connect(self.db_name)
                 connection = self.threadlocal.connection
                 cur = self.threadlocal.connection.cursor()
+                if self.db_name != ':memory:':
+                    # The connection lives for the whole hunt loop - let commits
+                    # append to a write-ahead log instead of syncing the database
+                    cur.execute('PRAGMA journal_mode=WAL')
+                    cur.execute('PRAGMA synchronous=NORMAL')
+                cur.execute('PRAGMA temp_store=MEMORY')
                 cur.execute('CREATE TABLE IF NOT EXISTS processed (ID INTEGER)')
                 cur.execute('CREATE TABLE IF NOT EXISTS executions (timestamp timestamp)')
                 cur.execute('CREATE TABLE IF NOT EXISTS exposes (id INTEGER, created TIMESTAMP, \
@@ -69,6 +86,22 @@ class IdMaintainer:
             # Conservative: assume not processed to avoid missing listings
             return False
 
+    def filter_processed(self, expose_ids):
+        """Returns the subset of the given expose IDs that have already been processed"""
+        expose_ids = list(dict.fromkeys(expose_ids))
+        processed = set()
+        try:
+            cur = self.get_connection().cursor()
+            for i in range(0, len(expose_ids), self.QUERY_BATCH_SIZE):
+                batch = expose_ids[i:i + self.QUERY_BATCH_SIZE]
+                placeholders = ', '.join('?' * len(batch))
+                cur.execute(f'SELECT id FROM processed WHERE id IN ({placeholders})', batch)
+                processed.update(row[0] for row in cur.fetchall())
+        except lite.Error as e:
+            logger.error(f"Database error checking processed exposes: {e}")
+            # Conservative: assume not processed to avoid missing listings
+        return processed
+
     def mark_processed(self, expose_id):
         """Mark an expose as processed in the database"""
         try:
@@ -138,6 +171,26 @@ class IdMaintainer:
 
         return False
 
+    def filter_title_contacted(self, titles):
+        """Returns the subset of the given titles that have already been contacted"""
+        titles_by_normalized = {}
+        for title in titles:
+            normalized = self.normalize_title(title)
+            if normalized:
+                titles_by_normalized.setdefault(normalized, []).append(title)
+
+        contacted = set()
+        normalized_titles = list(titles_by_normalized)
+        cur = self.get_connection().cursor()
+        for i in range(0, len(normalized_titles), self.QUERY_BATCH_SIZE):
+            batch = normalized_titles[i:i + self.QUERY_BATCH_SIZE]
+            placeholders = ', '.join('?' * len(batch))
+            cur.execute('SELECT normalized_title FROM contacted_titles '
+                        f'WHERE normalized_title IN ({placeholders})', batch)
+            for row in cur.fetchall():
+                contacted.update(titles_by_normalized[row[0]])
+        return contacted
+
     def mark_title_contacted(self, expose):
         """
         Mark a listing title as contacted in the database.
@@ -183,6 +236,25 @@ class IdMaintainer:
         except (lite.Error, KeyError, ValueError) as e:
             logger.error(f"Database error saving expose {expose.get('id', 'unknown')}: {e}")
 
+    def save_exposes(self, exposes):
+        """Saves several exposes to the database in one transaction"""
+        rows = []
+        now = datetime.datetime.now()
+        for expose in exposes:
+            try:
+                rows.append((int(expose['id']), now, expose['crawler'], json.dumps(expose)))
+            except (KeyError, ValueError) as e:
+                logger.error(f"Database error saving expose {expose.get('id', 'unknown')}: {e}")
+        if not rows:
+            return
+        try:
+            connection = self.get_connection()
+            connection.executemany('INSERT OR REPLACE INTO exposes(id, created, crawler, details) \
+                                    VALUES (?, ?, ?, ?)', rows)
+            connection.commit()
+        except lite.Error as e:
+            logger.error(f"Database error saving {len(rows)} exposes: {e}")
+
     def get_exposes_since(self, min_datetime):
         """Loads all exposes since the specified date"""
         def row_to_expose(row):
@@ -3,7 +3,9 @@ Session tracking manager for auto-contact processors.
 Tracks when sessions were last validated to prevent expiry.
 """
 
+import functools
 import json
+import os
 import time
 from pathlib import Path
 from datetime import datetime
@@ -12,6 +14,24 @@ from flathunter.logger_config import logger
 SESSION_TIMEOUT = 2 * 60 * 60  # 2 hours in seconds
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_cookie_file(path: str, mtime_ns: int) -> tuple:
+    """Parse a cookie file. Cached per file version, so only changed files are re-read"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return tuple(json.load(f))
+
+
+def load_cookie_file(path) -> list:
+    """Return the cookies saved in a contact bot cookie file
+
+    Raises OSError if the file can't be read and json.JSONDecodeError if it is corrupt.
+    The returned cookie dicts are copies and may be modified by the caller.
+    """
+    path = str(path)
+    cookies = _parse_cookie_file(path, os.stat(path).st_mtime_ns)
+    return [dict(cookie) for cookie in cookies]
+
+
 class SessionManager:
     """Manages session timestamps and validation state for auto-contact processors"""
 
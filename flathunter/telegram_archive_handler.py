@@ -14,16 +14,19 @@ from flathunter.logger_config import logger
 class TelegramArchiveHandler:
     """Handles Telegram callback queries for archive buttons"""
 
-    def __init__(self, bot_token: str, sender_telegram=None):
+    def __init__(self, bot_token: str, sender_telegram=None,
+                 done_event: Optional[threading.Event] = None):
         """
         Initialize archive handler
 
         Args:
             bot_token: Telegram bot token
             sender_telegram: SenderTelegram instance for sending archives
+            done_event: Optional event that is set once an archive button was handled
         """
         self.bot_token = bot_token
         self.sender_telegram = sender_telegram
+        self.done_event = done_event
 
         # Storage file
         self.storage_file = Path.home() / '.flathunter_telegram_archives.json'
@@ -234,6 +237,9 @@ class TelegramArchiveHandler:
                 archive_data=archive['archive_data']
             )
 
+            if self.done_event is not None:
+                self.done_event.set()
+
         except Exception as e:
             logger.error(f"Error handling callback query: {e}", exc_info=True)
             try:
@@ -2,6 +2,8 @@
 from time import sleep
 from datetime import datetime
 from random import randint
+from threading import Event
+from typing import Optional
 
 from flathunter.logger_config import logger
 
@@ -25,11 +27,16 @@ def get_time_span_in_secs(time_a, time_b):
     return (24*60*60) - a_secs + b_secs
 
 
-def wait_during_period(time_from, time_till):
-    """Waits for the end of the pause period if necessary."""
+def wait_during_period(time_from, time_till, stop_event: Optional[Event] = None) -> bool:
+    """Waits for the end of the pause period if necessary. With a stop_event the
+    wait ends as soon as the event is set. Returns True if it was stopped."""
     if is_current_time_between(time_from, time_till):
         logger.info("Paused loop. Waiting till %s.", time_till)
-        sleep(get_time_span_in_secs(datetime.now().time(), time_till))
+        pause_seconds = get_time_span_in_secs(datetime.now().time(), time_till)
+        if stop_event is not None:
+            return stop_event.wait(pause_seconds)
+        sleep(pause_seconds)
+    return stop_event is not None and stop_event.is_set()
 
 
 def get_random_time_jitter(loop_period_seconds: int) -> int:
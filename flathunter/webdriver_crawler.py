@@ -2,28 +2,42 @@
 from typing import Optional
 
 from selenium.webdriver import Chrome
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from flathunter.abstract_crawler import Crawler
-from flathunter.chrome_wrapper import get_chrome_driver
+from flathunter.driver_pool import DriverPool, get_driver_pool
 from flathunter.exceptions import DriverLoadException
 
 class WebdriverCrawler(Crawler):
     """Parent class of crawlers that use webdriver rather than `requests` to fetch pages"""
 
+    # A single browser can only load one page at a time
+    CONCURRENT_CRAWLS = False
+
     def __init__(self, config):
         super().__init__(config)
         self.config = config
         self.driver = None
 
+    def driver_pool(self) -> DriverPool:
+        """The pool of Chrome drivers shared with the other webdriver crawlers"""
+        return get_driver_pool(self.config.captcha_driver_arguments(),
+                               self.config.captcha_driver_pool_size())
+
     def get_driver(self) -> Optional[Chrome]:
-        """Lazy method to fetch the driver as required at runtime"""
+        """Lazy method to fetch the driver as required at runtime. The driver is
+           borrowed from the shared pool until release_driver is called"""
         if self.driver is not None:
             return self.driver
-        driver_arguments = self.config.captcha_driver_arguments()
-        self.driver = get_chrome_driver(driver_arguments)
+        self.driver = self.driver_pool().acquire()
         return self.driver
 
+    def release_driver(self):
+        """Hand the borrowed driver back to the shared pool"""
+        if self.driver is not None:
+            driver, self.driver = self.driver, None
+            self.driver_pool().release(driver)
+
     def get_driver_force(self) -> Chrome:
         """Fetch the driver, and throw an exception if it is not configured or available"""
         res = self.get_driver()
@@ -31,6 +45,10 @@ class WebdriverCrawler(Crawler):
             raise DriverLoadException("Unable to load chrome driver when expected")
         return res
 
-    def get_page(self, search_url, driver=None, page_no=None) -> BeautifulSoup:
+    def get_page(self, search_url, driver=None, page_no=None,
+                 parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
         """Applies a page number to a formatted search URL and fetches the exposes at that page"""
-        return self.get_soup_from_url(search_url, driver=self.get_driver())
+        try:
+            return self.get_soup_from_url(search_url, driver=self.get_driver(), parse_only=parse_only)
+        finally:
+            self.release_driver()
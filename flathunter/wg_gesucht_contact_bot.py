@@ -19,6 +19,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import logging
 
+from flathunter.session_manager import load_cookie_file
+
 # SSL FIX (before any HTTPS usage)
 try:
     import certifi
@@ -747,8 +749,7 @@ class WgGesuchtContactBot:
     def _load_cookies(self):
         """Load cookies from file and validate session."""
         try:
-            with open(COOKIE_FILE, 'r') as f:
-                cookies = json.load(f)
+            cookies = load_cookie_file(COOKIE_FILE)
             
             # Navigate to site first
             self.driver.get(WG_GESUCHT_URL)
@@ -771,6 +772,9 @@ class WgGesuchtContactBot:
                 logger.warning("Session validation failed")
                 return False
         
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Could not read saved cookies from {COOKIE_FILE}: {e}")
+            return False
         except Exception as e:
             logger.error(f"Error loading cookies: {e}")
             return False
@@ -19,6 +19,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from flathunter.session_manager import load_cookie_file
+from flathunter.willhaben_contacted_store import WillhabenContactedStore
+
 # SSL FIX (before any HTTPS usage)
 try:
     import certifi
@@ -75,24 +78,18 @@ class WillhabenContactBot:
             self.options.add_experimental_option('useAutomationExtension', False)
 
         self.cookies_file = Path.home() / '.willhaben_cookies.json'
-        self.contacted_file = Path.home() / '.willhaben_contacted.json'
         self.contacted_listings = self._load_contacted_listings()
 
         stealth_mode = "stealth" if use_stealth else "standard"
         logger.info(f"Willhaben bot initialized (mode: {stealth_mode}, headless: {headless})")
     
     def _load_contacted_listings(self):
-        """Load the list of already contacted listing IDs"""
-        if self.contacted_file.exists():
-            with open(self.contacted_file, 'r') as f:
-                return set(json.load(f))
-        return set()
+        """Open the store of already contacted listing IDs"""
+        return WillhabenContactedStore()
     
     def _save_contacted_listing(self, listing_id):
         """Save a listing ID as contacted"""
         self.contacted_listings.add(listing_id)
-        with open(self.contacted_file, 'w') as f:
-            json.dump(list(self.contacted_listings), f)
     
     def _random_delay(self, min_sec=None, max_sec=None):
         """Add a random delay to simulate human behavior
@@ -738,14 +735,17 @@ class WillhabenContactBot:
         if not self.cookies_file.exists():
             return False
 
+        try:
+            cookies = load_cookie_file(self.cookies_file)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Could not read saved cookies from {self.cookies_file}: {e}")
+            return False
+
         # Need to visit the domain first before adding cookies
         self.driver.get('https://www.willhaben.at')
         # Brief delay to let domain load before adding cookies
         time.sleep(0.1)
 
-        with open(self.cookies_file, 'r') as f:
-            cookies = json.load(f)
-
         for cookie in cookies:
             # Selenium doesn't like some cookie fields
             if 'expiry' in cookie:
@@ -6,6 +6,7 @@ Detects browser crashes and restarts automatically
 from flathunter.logger_config import logger
 from flathunter.willhaben_contact_bot import WillhabenContactBot, SessionExpiredException, AlreadyContactedException
 from flathunter.session_manager import SessionManager
+from flathunter.archive_manager import ArchiveManager
 from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
 import time
 import json
@@ -18,6 +19,9 @@ from zoneinfo import ZoneInfo
 class WillhabenContactProcessor:
     """Processor that auto-contacts willhaben listings - with crash recovery and headless fallback"""
 
+    # Skip the gallery click-through once the embedded page data yields this many images
+    MIN_EMBEDDED_IMAGES = 2
+
     @staticmethod
     def _calculate_business_hours_delay():
         """Calculate delay if current time is outside business hours (00:00-06:00 CET).
@@ -64,6 +68,12 @@ class WillhabenContactProcessor:
                 self.bot.driver.get(listing_url)
                 time.sleep(1.5)
 
+            # The embedded page data usually lists the whole gallery - no clicking needed then
+            embedded_images = ArchiveManager.extract_willhaben_embedded_images(self.bot.driver.page_source)
+            if len(embedded_images) >= self.MIN_EMBEDDED_IMAGES:
+                logger.debug(f"Found {len(embedded_images)} images in embedded page data - skipping gallery scroll")
+                return
+
             # Wait for gallery container to be present (sign that Flickity is initializing)
             try:
                 WebDriverWait(self.bot.driver, 10).until(
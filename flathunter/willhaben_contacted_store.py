@@ -0,0 +1,91 @@
+"""SQLite-backed store of Willhaben listing IDs that have already been contacted"""
+import json
+import sqlite3 as lite
+import threading
+from pathlib import Path
+
+from flathunter.logger_config import logger
+
+DEFAULT_DB_PATH = Path.home() / '.willhaben_contacted.db'
+LEGACY_JSON_PATH = Path.home() / '.willhaben_contacted.json'
+
+
+class WillhabenContactedStore:
+    """Set-like store of contacted listing IDs
+
+    Membership checks are single indexed lookups and new IDs are inserted
+    individually, so the file is never re-read or rewritten as a whole. IDs
+    from the former ~/.willhaben_contacted.json cache are imported when the
+    database is created.
+    """
+
+    # Keep IN (...) lists below SQLite's bound parameter limit
+    QUERY_BATCH_SIZE = 500
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, legacy_json_path=LEGACY_JSON_PATH):
+        self.db_path = str(db_path)
+        self.legacy_json_path = Path(legacy_json_path) if legacy_json_path else None
+        self.threadlocal = threading.local()
+
+    def get_connection(self):
+        """Connects to the SQLite database. Connections are thread-local"""
+        connection = getattr(self.threadlocal, 'connection', None)
+        if connection is None:
+            connection = lite.connect(self.db_path)
+            self.threadlocal.connection = connection
+            cur = connection.cursor()
+            cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='contacted'")
+            is_new = cur.fetchone() is None
+            cur.execute('CREATE TABLE IF NOT EXISTS contacted (id TEXT PRIMARY KEY)')
+            if is_new:
+                self._import_legacy_json(cur)
+            connection.commit()
+        return connection
+
+    def _import_legacy_json(self, cur):
+        """Copy the IDs of the old JSON cache into a freshly created table"""
+        if self.legacy_json_path is None or not self.legacy_json_path.exists():
+            return
+        try:
+            with open(self.legacy_json_path, 'r', encoding='utf-8') as f:
+                listing_ids = json.load(f)
+        except (OSError, ValueError) as error:
+            logger.warning("Could not import %s: %s", self.legacy_json_path, error)
+            return
+        cur.executemany('INSERT OR IGNORE INTO contacted VALUES (?)',
+                        ((str(listing_id),) for listing_id in listing_ids))
+        logger.info("Imported %d contacted listings from %s",
+                    len(listing_ids), self.legacy_json_path)
+
+    def __contains__(self, listing_id):
+        cur = self.get_connection().cursor()
+        cur.execute('SELECT 1 FROM contacted WHERE id = ?', (str(listing_id),))
+        return cur.fetchone() is not None
+
+    def __len__(self):
+        cur = self.get_connection().cursor()
+        cur.execute('SELECT COUNT(*) FROM contacted')
+        return cur.fetchone()[0]
+
+    def filter_contacted(self, listing_ids):
+        """Returns the subset of the given listing IDs (as strings) that have been contacted"""
+        listing_ids = list(dict.fromkeys(str(listing_id) for listing_id in listing_ids))
+        contacted = set()
+        cur = self.get_connection().cursor()
+        for i in range(0, len(listing_ids), self.QUERY_BATCH_SIZE):
+            batch = listing_ids[i:i + self.QUERY_BATCH_SIZE]
+            placeholders = ', '.join('?' * len(batch))
+            cur.execute(f'SELECT id FROM contacted WHERE id IN ({placeholders})', batch)
+            contacted.update(row[0] for row in cur.fetchall())
+        return contacted
+
+    def add(self, listing_id):
+        """Mark a single listing ID as contacted"""
+        self.update([listing_id])
+
+    def update(self, listing_ids):
+        """Mark several listing IDs as contacted in one transaction"""
+        connection = self.get_connection()
+        connection.executemany('INSERT OR IGNORE INTO contacted VALUES (?)',
+                               ((str(listing_id),) for listing_id in listing_ids))
+        connection.commit()
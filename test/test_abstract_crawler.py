@@ -0,0 +1,125 @@
+import re
+import unittest
+from unittest import mock
+
+import requests
+from bs4 import SoupStrainer
+
+from flathunter.abstract_crawler import Crawler, retry_after_seconds
+from test.utils.config import StringConfig
+
+
+class UrlEchoCrawler(Crawler):
+    URL_PATTERN = re.compile(r'https://www\.example\.com')
+
+    def get_results(self, search_url, max_pages=None):
+        if search_url.endswith('/broken'):
+            raise ValueError("broken page")
+        return [{'id': search_url, 'url': search_url}]
+
+
+class StrainedCrawler(Crawler):
+    URL_PATTERN = re.compile(r'https://www\.example\.com')
+    RESULTS_STRAINER = SoupStrainer('article')
+    PAGE = '<html><body><nav><a href="/nav">Menu</a></nav><article><a href="/1">Flat</a></article></body></html>'
+
+    def get_soup_from_url(self, url, driver=None, checkbox=False, afterlogin_string=None,
+                          retry_count=0, parse_only=None):
+        return self.parse_html(self.PAGE, parse_only)
+
+    def extract_data(self, raw_data):
+        return [link['href'] for link in raw_data.find_all('a')]
+
+
+class ProxySession:
+    """Fake session: only the proxy named 'good' answers with a page"""
+
+    def get(self, url, headers=None, proxies=None, timeout=None):
+        if proxies['https'] != 'good':
+            raise requests.exceptions.ConnectionError("proxy down")
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'<html><body><a href="/1">Flat</a></body></html>'
+        return response
+
+
+class FakeDriver:
+    """Webdriver stand-in that counts how often the page source is fetched"""
+
+    def __init__(self, page):
+        self.page = page
+        self.page_source_reads = 0
+
+    def get(self, url):
+        pass
+
+    @property
+    def page_source(self):
+        self.page_source_reads += 1
+        return self.page
+
+
+class AbstractCrawlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.crawler = UrlEchoCrawler(StringConfig(string=""))
+
+    def test_crawlers_have_their_own_session(self):
+        other = UrlEchoCrawler(StringConfig(string=""))
+        self.assertIsNot(self.crawler.session, other.session)
+
+    def test_crawl_many_keeps_url_order(self):
+        urls = [f"https://www.example.com/{i}" for i in range(10)]
+        results = self.crawler.crawl_many(urls)
+        self.assertEqual([result[0]['id'] for result in results], urls)
+
+    def test_crawl_many_skips_failed_and_foreign_urls(self):
+        results = self.crawler.crawl_many([
+            "https://www.example.com/broken",
+            "https://www.other.com/1",
+            "https://www.example.com/2",
+        ])
+        self.assertEqual(results, [[], [], [{'id': "https://www.example.com/2",
+                                             'url': "https://www.example.com/2"}]])
+
+    def test_results_strainer_only_applies_to_search_pages(self):
+        crawler = StrainedCrawler(StringConfig(string=""))
+        self.assertEqual(crawler.get_results("https://www.example.com/search"), ['/1'])
+        detail_page = crawler.get_page("https://www.example.com/1")
+        self.assertEqual(crawler.extract_data(detail_page), ['/nav', '/1'])
+
+    def test_proxy_race_returns_first_working_proxy(self):
+        crawler = UrlEchoCrawler(StringConfig(string=""), session=ProxySession())
+        crawler.PROXY_RACE_SIZE = 2
+        proxies = [['bad1', 'bad2', 'bad3', 'good', 'bad4']]
+        with mock.patch('flathunter.proxies.get_proxies', side_effect=proxies):
+            soup = crawler.get_soup_with_proxy("https://www.example.com/search")
+        self.assertEqual(soup.find('a')['href'], '/1')
+
+    def test_page_source_fetched_once_without_captcha(self):
+        driver = FakeDriver('<html><body><a href="/1">Flat</a></body></html>')
+        soup = self.crawler.get_soup_from_url("https://www.example.com/search", driver=driver)
+        self.assertEqual(soup.find('a')['href'], '/1')
+        self.assertEqual(driver.page_source_reads, 1)
+
+    def test_retry_after_header(self):
+        response = requests.Response()
+        self.assertIsNone(retry_after_seconds(response))
+        response.headers['Retry-After'] = '30'
+        self.assertEqual(retry_after_seconds(response), 30)
+        response.headers['Retry-After'] = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        self.assertEqual(retry_after_seconds(response), 0)
+        response.headers['Retry-After'] = 'soon'
+        self.assertIsNone(retry_after_seconds(response))
+
+    def test_broken_body_is_retried(self):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'<html><body><a href="/1">Flat</a></body></html>'
+        session = mock.Mock()
+        session.get.side_effect = [requests.exceptions.ChunkedEncodingError("connection dropped"), response]
+        crawler = UrlEchoCrawler(StringConfig(string=""), session=session)
+        with mock.patch('flathunter.abstract_crawler.time.sleep'):
+            soup = crawler.get_soup_from_url("https://www.example.com/search")
+        self.assertEqual(soup.find('a')['href'], '/1')
+        self.assertEqual(session.get.call_count, 2)
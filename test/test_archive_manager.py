@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from flathunter import archive_manager
+from flathunter.archive_manager import ArchiveManager, dump_json
+
+
+class ArchiveManagerTest(unittest.TestCase):
+
+    NEXT_DATA = {'props': {'pageProps': {'advertDetails': {'advertImageList': {'advertImage': [
+        {'mainImageUrl': 'https://cache.willhaben.at/mmo/1/111_-1.jpg',
+         'thumbnailImageUrl': 'https://cache.willhaben.at/mmo/1/111_-1_thumb.jpg'},
+        {'mainImageUrl': 'https://cache.willhaben.at/mmo/1/111_-2.jpg',
+         'thumbnailImageUrl': 'https://cache.willhaben.at/mmo/1/111_-2_thumb.jpg'},
+    ]}}}}}
+
+    JSON_LD = {'@type': 'Product', 'image': ['https://cache.willhaben.at/mmo/1/111_-3_thumb.jpg']}
+
+    WILLHABEN_PAGE = f"""
+<html><body>
+<img src="https://cache.willhaben.at/mmo/1/111_-1_thumb.jpg">
+<img src="https://www.willhaben.at/logo.png">
+<div data-testid="ad-description-Objektbeschreibung"><p>Helle Wohnung</p><p>mit Balkon</p></div>
+<script id="__NEXT_DATA__" type="application/json">{json.dumps(NEXT_DATA)}</script>
+<script type="application/ld+json">{json.dumps(JSON_LD)}</script>
+</body></html>
+"""
+
+    EXPOSE = {'title': 'Test Listing', 'crawler': 'Willhaben'}
+
+    def test_embedded_images(self):
+        self.assertEqual(ArchiveManager.extract_willhaben_embedded_images(self.WILLHABEN_PAGE), [
+            'https://cache.willhaben.at/mmo/1/111_-1.jpg',
+            'https://cache.willhaben.at/mmo/1/111_-2.jpg',
+            'https://cache.willhaben.at/mmo/1/111_-3.jpg',
+        ])
+
+    def test_embedded_images_without_data(self):
+        self.assertEqual(ArchiveManager.extract_willhaben_embedded_images('<html></html>'), [])
+
+    def test_extract_willhaben(self):
+        archive = ArchiveManager().extract_archive_data(
+            self.WILLHABEN_PAGE, 'https://www.willhaben.at/iad/1', self.EXPOSE)
+        self.assertEqual(archive['images'], [
+            'https://cache.willhaben.at/mmo/1/111_-1.jpg',
+            'https://cache.willhaben.at/mmo/1/111_-2.jpg',
+            'https://cache.willhaben.at/mmo/1/111_-3.jpg',
+        ])
+        self.assertEqual(archive['description'], 'Helle Wohnung\nmit Balkon')
+        self.assertEqual(archive['metadata']['url'], 'https://www.willhaben.at/iad/1')
+        self.assertEqual(archive['metadata']['title'], 'Test Listing')
+
+    WGGESUCHT_PAGE = """
+<html><head><title>WG-Gesucht</title></head><body>
+<div class="wrapper">
+<img class="sp-image lazy" data-default="https://img.wg-gesucht.de/1.jpg">
+<img class="logo" src="https://www.wg-gesucht.de/logo.png">
+<div class="panel section_freetext"><p>Schoenes Zimmer in Altbau</p><p class="ad_box">Werbung hier</p></div>
+</div>
+</body></html>
+"""
+
+    def test_extract_wggesucht(self):
+        archive = ArchiveManager().extract_archive_data(
+            self.WGGESUCHT_PAGE, 'https://www.wg-gesucht.de/1.html', {'crawler': 'WgGesucht'})
+        self.assertEqual(archive['images'], ['https://img.wg-gesucht.de/1.jpg'])
+        self.assertEqual(archive['description'], 'Schoenes Zimmer in Altbau')
+        self.assertEqual(list(archive['metadata']), ['url', 'title', 'price', 'size', 'rooms', 'crawler', 'timestamp'])
+
+    def test_large_pages_are_narrowed(self):
+        padding = '<div class="filler">' + 'x' * 100 + '</div>'
+        head = padding * (ArchiveManager.NARROW_SOURCE_THRESHOLD // len(padding))
+        page = head + self.WILLHABEN_PAGE + padding * 10
+        narrowed = ArchiveManager._narrow_source(
+            page, archive_manager.WILLHABEN_MARKER_PATTERN, ArchiveManager.WILLHABEN_END_MARKERS)
+        self.assertTrue(narrowed.startswith('<img src="https://cache.willhaben.at/mmo/1/111_-1_thumb.jpg">'))
+        self.assertTrue(narrowed.endswith('</script>'))
+        archive = ArchiveManager().extract_archive_data(page, 'https://www.willhaben.at/iad/1', self.EXPOSE)
+        self.assertEqual(len(archive['images']), 3)
+        self.assertEqual(archive['description'], 'Helle Wohnung\nmit Balkon')
+
+    def test_extract_willhaben_from_bytes(self):
+        page = self.WILLHABEN_PAGE.encode('utf-8')
+        archive = ArchiveManager().extract_archive_data(page, 'https://www.willhaben.at/iad/1', self.EXPOSE)
+        self.assertEqual(len(archive['images']), 3)
+        self.assertEqual(archive['description'], 'Helle Wohnung\nmit Balkon')
+        narrowed = archive_manager.narrow_source(
+            b'<p>intro</p>' + page, archive_manager.WILLHABEN_MARKER_PATTERN, ArchiveManager.WILLHABEN_END_MARKERS)
+        self.assertTrue(narrowed.startswith(b'<img src="https://cache.willhaben.at/mmo/1/111_-1_thumb.jpg">'))
+        self.assertTrue(narrowed.endswith(b'</script>'))
+
+    def test_small_pages_are_not_narrowed(self):
+        self.assertIs(ArchiveManager._narrow_source(
+            self.WGGESUCHT_PAGE, archive_manager.WGGESUCHT_MARKER_PATTERN), self.WGGESUCHT_PAGE)
+
+    def test_images_are_capped(self):
+        gallery = ''.join(f'<img class="sp-image" data-default="https://img.wg-gesucht.de/{i}.jpg">'
+                          for i in range(ArchiveManager.MAX_ARCHIVE_IMAGES + 10))
+        archive = ArchiveManager().extract_archive_data(
+            f'<html><body>{gallery}</body></html>', 'https://www.wg-gesucht.de/1.html', {'crawler': 'WgGesucht'})
+        self.assertEqual(len(archive['images']), ArchiveManager.MAX_ARCHIVE_IMAGES)
+        self.assertEqual(archive['images'][0], 'https://img.wg-gesucht.de/0.jpg')
+
+    def test_save_archive_locally(self):
+        with tempfile.TemporaryDirectory() as archive_path:
+            manager = ArchiveManager({'telegram_archive_path': archive_path})
+            archive = manager.extract_archive_data(
+                self.WILLHABEN_PAGE, 'https://www.willhaben.at/iad/1', self.EXPOSE)
+            result = manager.save_archive_locally(archive, 'test_1')
+            self.assertEqual(result.path, Path(archive_path) / 'test_1')
+            self.assertEqual(sorted(os.listdir(result.path)),
+                             ['description.txt', 'images.json', 'metadata.json'])
+            content = b''.join((result.path / name).read_bytes()
+                               for name in ('metadata.json', 'description.txt', 'images.json'))
+            self.assertEqual(result.bytes_written, len(content))
+            self.assertEqual(result.sha256, hashlib.sha256(content).hexdigest())
+
+    def test_dump_json_matches_stdlib_output(self):
+        data = {'title': 'Schöne Wohnung', 'images': ['a.jpg', 'b.jpg']}
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        self.assertEqual(json.loads(dump_json(data)), data)
+        with unittest.mock.patch.object(archive_manager, 'orjson', None):
+            self.assertEqual(dump_json(data), expected)
+
+    def test_cleanup_old_archives(self):
+        with tempfile.TemporaryDirectory() as archive_path:
+            manager = ArchiveManager({'telegram_archive_path': archive_path,
+                                      'telegram_archive_retention_days': 30})
+            for archive_id in ('old', 'new'):
+                manager.save_archive_locally({'metadata': {'id': archive_id}}, archive_id)
+            old_time = (datetime.now() - timedelta(days=31)).timestamp()
+            os.utime(Path(archive_path) / 'old', (old_time, old_time))
+            self.assertEqual(manager.cleanup_old_archives(), 1)
+            self.assertEqual(os.listdir(archive_path), ['new'])
@@ -0,0 +1,39 @@
+import json
+import unittest
+from unittest import mock
+
+from flathunter.captcha.captcha_solver import CaptchaSolver, CaptchaUnsolvableError
+from flathunter.captcha.imagetyperz_solver import ImageTyperzSolver
+
+
+class CaptchaSolverPollTest(unittest.TestCase):
+
+    def setUp(self):
+        self.solver = CaptchaSolver("key")
+
+    @mock.patch('flathunter.captcha.captcha_solver.uniform', return_value=0)
+    @mock.patch('flathunter.captcha.captcha_solver.sleep')
+    def test_poll_backs_off_until_result(self, sleep, _uniform):
+        results = iter([None, None, None, None, "token"])
+        self.assertEqual(self.solver._poll(lambda: next(results)), "token")
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [1.0, 1.5, 2.25, 3.375, 5.0])
+
+    @mock.patch('flathunter.captcha.captcha_solver.sleep')
+    def test_poll_gives_up_after_deadline(self, _sleep):
+        with self.assertRaises(CaptchaUnsolvableError):
+            self.solver._poll(lambda: None, deadline=0)
+
+
+class ImageTyperzPollTest(unittest.TestCase):
+
+    @mock.patch('flathunter.captcha.captcha_solver.sleep')
+    def test_pending_responses_are_not_decoded(self, _sleep):
+        solver = ImageTyperzSolver("key")
+        responses = iter([mock.Mock(text='[{"Status":"Pending"}]'),
+                          mock.Mock(text='[{"Status":"Solved","Response":"token"}]')])
+        solver.session = mock.Mock()
+        solver.session.get.side_effect = lambda *args, **kwargs: next(responses)
+        with mock.patch('flathunter.captcha.imagetyperz_solver.json.loads',
+                        wraps=json.loads) as loads:
+            self.assertEqual(solver._ImageTyperzSolver__retrieve_imagetyperz_result("1"), "token")
+        loads.assert_called_once()
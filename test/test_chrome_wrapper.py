@@ -1,16 +1,21 @@
+import os
 import pytest
+import subprocess
+import tempfile
 import unittest
 from unittest.mock import patch
 
-from flathunter.chrome_wrapper import get_chrome_version, CHROME_BINARY_NAMES
+from flathunter.chrome_wrapper import (
+    get_chrome_driver, get_chrome_version, cached_chrome_version, get_command_output, CHROME_BINARY_NAMES)
 from flathunter.exceptions import ChromeNotFound
 
 
 def calc_linux_binary_names():
 	"""
-	Creates a list containing empty lists for each name in CHROME_BINARY_NAMES that does not start with a forward slash.
+	Creates a list containing empty lists for each name in CHROME_BINARY_NAMES that my_subprocess_mock
+	answers from CHROME_VERSION_RESULTS (every name containing 'chrom').
 	"""
-	return [[] for name in CHROME_BINARY_NAMES if not name.startswith('/')]
+	return [[] for name in CHROME_BINARY_NAMES if 'chrom' in name]
 
 
 """
@@ -52,8 +57,9 @@ def my_subprocess_mock(args, static={ 'chrome_calls': 0, 'reg_calls': 0 }):
 
 class ChromeWrapperTest(unittest.TestCase):
 
+    @patch("flathunter.chrome_wrapper.shutil.which", side_effect=lambda name: name)
     @patch("flathunter.chrome_wrapper.get_command_output")
-    def test_parse_chrome_version(self, subprocess_mock):
+    def test_parse_chrome_version(self, subprocess_mock, _which):
         subprocess_mock.side_effect = my_subprocess_mock
         with pytest.raises(ChromeNotFound):
             self.assertEqual(get_chrome_version(), None)
@@ -61,3 +67,67 @@ class ChromeWrapperTest(unittest.TestCase):
         self.assertEqual(get_chrome_version(), 107)
         self.assertEqual(get_chrome_version(), 107)
         self.assertEqual(get_chrome_version(), 116)
+
+    @patch("flathunter.chrome_wrapper.probe_chrome_version", return_value=(107, None))
+    def test_chrome_version_is_cached(self, version_mock):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                patch("flathunter.chrome_wrapper.CHROME_VERSION_CACHE", os.path.join(cache_dir, 'chrome_version')):
+            cached_chrome_version.cache_clear()
+            self.assertEqual(cached_chrome_version(), 107)
+            self.assertEqual(cached_chrome_version(), 107)
+            # A new process reads the version stored on disk
+            cached_chrome_version.cache_clear()
+            self.assertEqual(cached_chrome_version(), 107)
+            cached_chrome_version.cache_clear()
+        version_mock.assert_called_once()
+
+    @patch("flathunter.chrome_wrapper.probe_chrome_version")
+    def test_chrome_version_cache_notices_updated_binary(self, version_mock):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                patch("flathunter.chrome_wrapper.CHROME_VERSION_CACHE", os.path.join(cache_dir, 'chrome_version')):
+            binary = os.path.join(cache_dir, 'chrome')
+            open(binary, 'w').close()
+            version_mock.return_value = (107, binary)
+            cached_chrome_version.cache_clear()
+            self.assertEqual(cached_chrome_version(), 107)
+            os.utime(binary, ns=(0, 0))
+            version_mock.return_value = (120, binary)
+            cached_chrome_version.cache_clear()
+            self.assertEqual(cached_chrome_version(), 120)
+            cached_chrome_version.cache_clear()
+
+    @patch("flathunter.chrome_wrapper.subprocess.run",
+           side_effect=subprocess.TimeoutExpired(['chromium', '--version'], 5))
+    def test_hanging_command_has_no_output(self, _run):
+        self.assertEqual(get_command_output(['chromium', '--version']), [])
+
+    @patch("flathunter.chrome_wrapper.get_command_output", return_value=[])
+    @patch("flathunter.chrome_wrapper.winreg")
+    def test_reads_version_from_windows_registry(self, winreg_mock, command_mock):
+        winreg_mock.QueryValueEx.return_value = ('116.0.5845.141', 1)
+        self.assertEqual(get_chrome_version(), 116)
+        self.assertNotIn('reg', [call.args[0][0] for call in command_mock.call_args_list])
+
+    @patch("flathunter.chrome_wrapper.winreg", None)
+    @patch("flathunter.chrome_wrapper.shutil.which", return_value=None)
+    @patch("flathunter.chrome_wrapper.get_command_output", return_value=[])
+    def test_missing_binaries_are_not_started(self, command_mock, _which):
+        with pytest.raises(ChromeNotFound):
+            get_chrome_version()
+        self.assertEqual([call.args[0][0] for call in command_mock.call_args_list], ['reg'])
+
+    @patch("flathunter.chrome_wrapper.cached_chrome_version", return_value=120)
+    @patch("flathunter.chrome_wrapper.uc.Chrome")
+    def test_network_domain_is_enabled_first(self, chrome_mock, _version):
+        driver = get_chrome_driver([])
+        commands = [call.args[0] for call in driver.execute_cdp_cmd.call_args_list]
+        self.assertEqual(commands, ['Network.enable', 'Network.setUserAgentOverride', 'Network.setBlockedURLs'])
+        self.assertIs(driver, chrome_mock.return_value)
+
+    @patch.dict(os.environ, {"FLATHUNTER_CHROMEDRIVER_PATH": "/opt/chromedriver"})
+    @patch("flathunter.chrome_wrapper.cached_chrome_version", return_value=120)
+    @patch("flathunter.chrome_wrapper.uc.Chrome")
+    def test_uses_configured_chromedriver(self, chrome_mock, _version):
+        get_chrome_driver([])
+        self.assertEqual(chrome_mock.call_args.kwargs['driver_executable_path'], '/opt/chromedriver')
+        self.assertEqual(chrome_mock.call_args.kwargs['version_main'], 120)
@@ -87,3 +87,30 @@ filters:
        config = StringConfig(string=self.FILTERS_CONFIG)
        self.assertIsNotNone(config)
        self.assertEqual(config.database_location(), os.path.abspath(os.path.dirname(os.path.abspath(__file__)) + "/.."))
+
+    def test_set_keys_updates_cached_paths(self):
+       config = StringConfig(string=self.FILTERS_CONFIG)
+       self.assertEqual(config.loop_period_seconds(), 600)
+       config.set_keys({'loop': {'sleeping_time': 120}})
+       self.assertEqual(config.loop_period_seconds(), 120)
+
+    def test_captcha_solver_is_reused(self):
+       config = StringConfig(string=self.DUMMY_CONFIG)
+       config.set_keys({'captcha': {'2captcha': {'api_key': 'abc'}}})
+       solver = config.get_captcha_solver()
+       self.assertIs(config.get_captcha_solver(), solver)
+       config.set_keys({'captcha': {'2captcha': {'api_key': 'def'}}})
+       self.assertIsNot(config.get_captcha_solver(), solver)
+
+    def test_repr_is_refreshed_by_set_keys(self):
+       config = StringConfig(string=self.DUMMY_CONFIG)
+       self.assertIn('"notifiers": []', repr(config))
+       config.set_keys({'notifiers': ['telegram']})
+       self.assertIn('"notifiers": ["telegram"]', repr(config))
+
+    def test_notify_with_images_accepts_boolean_spellings(self):
+       config = StringConfig(string=self.DUMMY_CONFIG)
+       self.assertFalse(config.telegram_notify_with_images())
+       config.set_keys({'telegram': {'notify_with_images': 'yes'}, 'apprise_notify_with_images': True})
+       self.assertTrue(config.telegram_notify_with_images())
+       self.assertTrue(config.apprise_notify_with_images())
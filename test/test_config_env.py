@@ -67,3 +67,10 @@ immoscout_cookie: abdcd
         with modified_environ(FLATHUNTER_IS24_COOKIE="bbbb"):
             self.assertEqual("bbbb", self.config.immoscout_cookie()) 
 
+
+    def test_list_overrides_follow_the_environment(self):
+        with modified_environ(FLATHUNTER_TELEGRAM_RECEIVER_IDS="1,2"):
+            self.assertEqual([1, 2], self.config.telegram_receiver_ids())
+            self.assertEqual([1, 2], self.config.telegram_receiver_ids())
+        with modified_environ(FLATHUNTER_TELEGRAM_RECEIVER_IDS="3"):
+            self.assertEqual([3], self.config.telegram_receiver_ids())
@@ -124,3 +124,25 @@ class ConfigWizardTest(unittest.TestCase):
         doc = Document("https://www.wg-gesucht.de/wohnungen-in-Berlin.8.2.1.0.html")
         validator = UrlsValidator([], self.config)
         self.assertFalse(validator.validate(doc))
+
+    def test_load_config_returns_independent_copies(self):
+        config = config_wizard.load_config(False)
+        config.set_keys({ "urls": [ "https://www.wg-gesucht.de/" ] })
+        self.assertNotEqual(config_wizard.load_config(False).target_urls(),
+                            [ "https://www.wg-gesucht.de/" ])
+
+    def test_urls_validator_remembers_valid_urls(self):
+        doc = Document("https://www.wg-gesucht.de/wohnungen-in-Berlin.8.2.1.0.html")
+        validator = UrlsValidator([], self.config)
+        validator.validate(doc)
+        validator.url_patterns = []
+        self.assertFalse(validator.validate(doc))
+
+    @patch("builtins.input")
+    @patch("config_wizard.FULLSCREEN_DIALOGS", False)
+    def test_select_notifier_without_fullscreen_dialogs(self, input_mock):
+        input_mock.side_effect = [
+            "9",
+            "2"
+        ]
+        self.assertEqual(config_wizard.select_notifier(self.config), Notifier.MATTERMOST.value)
@@ -0,0 +1,48 @@
+import unittest
+from unittest import mock
+
+from selenium.common.exceptions import WebDriverException
+
+from flathunter.driver_pool import DriverPool
+
+
+class FakeDriver:
+
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.cookies_cleared = 0
+        self.quit_called = False
+
+    def delete_all_cookies(self):
+        if self.broken:
+            raise WebDriverException("browser gone")
+        self.cookies_cleared += 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+class DriverPoolTest(unittest.TestCase):
+
+    @mock.patch('flathunter.driver_pool.get_chrome_driver', side_effect=lambda args: FakeDriver())
+    def test_released_driver_is_reused(self, get_chrome_driver):
+        pool = DriverPool(["--headless"], size=1)
+        with pool.driver() as first:
+            pass
+        with pool.driver() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(first.cookies_cleared, 2)
+        self.assertEqual(get_chrome_driver.call_count, 1)
+        pool.close()
+        self.assertTrue(first.quit_called)
+
+    @mock.patch('flathunter.driver_pool.get_chrome_driver', side_effect=lambda args: FakeDriver())
+    def test_broken_driver_is_replaced(self, get_chrome_driver):
+        pool = DriverPool([], size=1)
+        driver = pool.acquire()
+        driver.broken = True
+        pool.release(driver)
+        self.assertTrue(driver.quit_called)
+        self.assertIsNot(pool.acquire(), driver)
+        self.assertEqual(get_chrome_driver.call_count, 2)
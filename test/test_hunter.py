@@ -227,3 +227,21 @@ excluded_titles:
             for expose in unfiltered:
                 print("Got unfiltered expose: ", expose)
         self.assertTrue(len(unfiltered) == 0, "Expected flats with too few rooms to be filtered")
+
+    def test_crawlers_run_in_parallel_in_configured_order(self):
+        class FirstCrawler(DummyCrawler):
+            pass
+
+        class SecondCrawler(DummyCrawler):
+            pass
+
+        config = StringConfig(string=self.FILTER_TITLES_CONFIG)
+        config.set_searchers([FirstCrawler(), SecondCrawler()])
+        hunter = Hunter(config, IdMaintainer(":memory:"))
+        crawlers = [expose['crawler'] for expose in hunter.crawl_for_exposes()]
+        self.assertIn("SecondCrawler", crawlers)
+        first_second = crawlers.index("SecondCrawler")
+        self.assertEqual(set(crawlers[:first_second]), {"FirstCrawler"})
+        self.assertEqual(set(crawlers[first_second:]), {"SecondCrawler"})
+        self.assertEqual(hunter.crawler_status["FirstCrawler"]['status'], 'success')
+        self.assertEqual(hunter.crawler_status["SecondCrawler"]['status'], 'success')
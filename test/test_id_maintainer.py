@@ -35,6 +35,18 @@ filters:
         self.maintainer.mark_processed(12345)
         self.assertTrue(self.maintainer.is_processed(12345), "Expected ID to be saved")
 
+    def test_filter_processed(self):
+        self.maintainer.mark_processed(12345)
+        self.maintainer.mark_processed(23456)
+        self.assertEqual({12345, 23456}, self.maintainer.filter_processed([12345, 23456, 34567]))
+        self.assertEqual(set(), self.maintainer.filter_processed([]))
+
+    def test_filter_title_contacted(self):
+        self.maintainer.mark_title_contacted({'id': 1, 'title': 'Schöne Wohnung, 2 Zimmer', 'crawler': 'Willhaben'})
+        contacted = self.maintainer.filter_title_contacted(
+            ['schone wohnung 2 zimmer', 'Schöne Wohnung - 2 Zimmer', 'Other flat', ''])
+        self.assertEqual({'schone wohnung 2 zimmer', 'Schöne Wohnung - 2 Zimmer'}, contacted)
+
     def test_get_last_run_time_none_by_default(self):
         self.assertIsNone(self.maintainer.get_last_run_time(), "Expected last run time to be none")
 
@@ -133,3 +145,14 @@ def test_all_filters_can_be_loaded():
     hunter.set_filters_for_user(123, filter)
     hunter.set_filters_for_user(124, filter)
     assert id_watch.get_user_settings() == [ (123, { 'filters': filter }), (124, { 'filters': filter }) ]
+
+def test_file_database_uses_write_ahead_log(tmp_path):
+    id_watch = IdMaintainer(str(tmp_path / "processed_ids.db"))
+    cur = id_watch.get_connection().cursor()
+    cur.execute('PRAGMA journal_mode')
+    assert cur.fetchone()[0] == 'wal'
+    id_watch.save_exposes([{'id': 1, 'crawler': 'Dummy', 'title': 'Flat'},
+                           {'id': 2, 'crawler': 'Dummy', 'title': 'Other flat'},
+                           {'title': 'No id'}])
+    saved = id_watch.get_exposes_since(datetime.datetime.now() - datetime.timedelta(seconds=10))
+    assert sorted(expose['id'] for expose in saved) == [1, 2]
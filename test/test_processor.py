@@ -1,4 +1,5 @@
 import unittest
+from flathunter.abstract_processor import Processor
 from flathunter.hunter import Hunter
 from flathunter.idmaintainer import IdMaintainer
 from flathunter.processor import ProcessorChain
@@ -40,3 +41,20 @@ google_maps_api:
         exposes = chain.process(exposes)
         for expose in exposes:
             self.assertFalse(expose['address'].startswith('http'), "Expected addresses to be processed")
+
+    def test_batched_processor_keeps_order(self):
+        class BatchCounter(Processor):
+            BATCH_SIZE = 3
+
+            def __init__(self):
+                self.batch_sizes = []
+
+            def process_batch(self, batch):
+                self.batch_sizes.append(len(batch))
+                return super().process_batch(batch)
+
+        processor = BatchCounter()
+        exposes = [{'id': i} for i in range(7)]
+        self.assertEqual([expose['id'] for expose in processor.process_exposes(exposes)], list(range(7)))
+        self.assertEqual(processor.batch_sizes, [3, 3, 1])
+        self.assertEqual([len(batch) for batch in processor.process_exposes_batched(exposes, 4)], [4, 3])
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch
 from datetime import time
 from datetime import datetime as dt
+from threading import Event
 
 from flathunter.time_utils import is_current_time_between, get_time_span_in_secs, wait_during_period
 
@@ -41,3 +42,14 @@ class TimeUtilsTest(unittest.TestCase):
         wait_during_period(time.fromisoformat("11:00"), time.fromisoformat("11:00"))
         self.assertFalse(mock_sleep.called)
 
+
+    @patch("flathunter.time_utils.sleep")
+    @patch("flathunter.time_utils.datetime", side_effect=lambda *args, **kw: dt(*args, **kw))
+    def test_wait_during_period_ends_on_stop_event(self, mock_datetime, mock_sleep):
+        mock_datetime.now.return_value = dt.fromisoformat("2023-01-01 10:01")
+        stop_event = Event()
+        stop_event.set()
+
+        self.assertTrue(wait_during_period(time.fromisoformat("22:00"), time.fromisoformat("11:00"), stop_event))
+        self.assertFalse(mock_sleep.called)
+        self.assertFalse(wait_during_period(time.fromisoformat("11:00"), time.fromisoformat("11:00"), Event()))
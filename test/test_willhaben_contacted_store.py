@@ -0,0 +1,36 @@
+import json
+
+from flathunter.willhaben_contacted_store import WillhabenContactedStore
+
+
+def test_add_and_contains(tmp_path):
+    store = WillhabenContactedStore(tmp_path / 'contacted.db', legacy_json_path=None)
+    assert '12345' not in store
+    store.add('12345')
+    store.update([23456, '12345'])
+    assert '12345' in store
+    assert 23456 in store
+    assert len(store) == 2
+
+
+def test_filter_contacted(tmp_path):
+    store = WillhabenContactedStore(tmp_path / 'contacted.db', legacy_json_path=None)
+    store.update(['111', '222'])
+    assert store.filter_contacted([111, '222', '333']) == {'111', '222'}
+
+
+def test_ids_persist_across_instances(tmp_path):
+    WillhabenContactedStore(tmp_path / 'contacted.db', legacy_json_path=None).add('12345')
+    assert '12345' in WillhabenContactedStore(tmp_path / 'contacted.db', legacy_json_path=None)
+
+
+def test_legacy_json_is_imported_once(tmp_path):
+    legacy_file = tmp_path / 'contacted.json'
+    legacy_file.write_text(json.dumps(['111', '222']))
+    store = WillhabenContactedStore(tmp_path / 'contacted.db', legacy_json_path=legacy_file)
+    assert '111' in store
+    assert len(store) == 2
+
+    legacy_file.write_text(json.dumps(['333']))
+    store = WillhabenContactedStore(tmp_path / 'contacted.db', legacy_json_path=legacy_file)
+    assert '333' not in store
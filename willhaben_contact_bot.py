@@ -15,6 +15,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from flathunter.willhaben_contacted_store import WillhabenContactedStore
+
 
 class WillhabenContactBot:
     def __init__(self, headless=False):
@@ -36,21 +38,15 @@ class WillhabenContactBot:
         
         self.driver = None
         self.cookies_file = Path.home() / '.willhaben_cookies.json'
-        self.contacted_file = Path.home() / '.willhaben_contacted.json'
         self.contacted_listings = self._load_contacted_listings()
     
     def _load_contacted_listings(self):
-        """Load the list of already contacted listing IDs"""
-        if self.contacted_file.exists():
-            with open(self.contacted_file, 'r') as f:
-                return set(json.load(f))
-        return set()
+        """Open the store of already contacted listing IDs"""
+        return WillhabenContactedStore()
     
     def _save_contacted_listing(self, listing_id):
         """Save a listing ID as contacted"""
         self.contacted_listings.add(listing_id)
-        with open(self.contacted_file, 'w') as f:
-            json.dump(list(self.contacted_listings), f)
     
     def _random_delay(self, min_sec=0.5, max_sec=2.0):
         """Add a random delay to simulate human behavior"""